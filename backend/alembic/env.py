@@ -23,6 +23,11 @@ from domain.issue.model import *
 from domain.tag.model import *
 from domain.vehicletype.model import *
 from domain.invite.model import *
+from domain.sync.model import *
+from domain.subscription.model import *
+from domain.webhook.model import *
+from domain.statistics.model import *
+from domain.hotspot.model import *
 from infrastructure.postgresql.db import Base
 
 target_metadata = Base.metadata
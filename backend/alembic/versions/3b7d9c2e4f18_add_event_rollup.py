@@ -0,0 +1,42 @@
+"""add event rollup for statistics
+
+Revision ID: 3b7d9c2e4f18
+Revises: e6f03a1d8b52
+Create Date: 2026-10-19 18:12:05.417390
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7d9c2e4f18"
+down_revision: Union[str, None] = "e6f03a1d8b52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_rollup",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("cell", sa.Integer(), nullable=False),
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.Column("vehicle_id", sa.Integer(), nullable=False),
+        sa.Column("events", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "cell", "tag_id", "vehicle_id"),
+    )
+    op.create_index(
+        "ix_event_rollup_tag_vehicle_day",
+        "event_rollup",
+        ["tag_id", "vehicle_id", "day"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_rollup_tag_vehicle_day", table_name="event_rollup")
+    op.drop_table("event_rollup")
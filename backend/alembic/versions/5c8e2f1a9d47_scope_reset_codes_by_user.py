@@ -0,0 +1,44 @@
+"""scope forgot-password codes by user, index expiry for purging
+
+Revision ID: 5c8e2f1a9d47
+Revises: b3f1951afce0
+Create Date: 2026-10-19 10:12:41.508213
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c8e2f1a9d47"
+down_revision: Union[str, None] = "b3f1951afce0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_pw_reset_reset_code", table_name="pw_reset")
+    op.create_index(
+        "ix_pw_reset_open_code",
+        "pw_reset",
+        ["for_user_id", "reset_code"],
+        unique=False,
+        postgresql_where=sa.text("is_used = false"),
+    )
+    op.create_index(
+        op.f("ix_pw_reset_expire_date"), "pw_reset", ["expire_date"], unique=False
+    )
+    op.create_index(
+        op.f("ix_invite_expire_date"), "invite", ["expire_date"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_invite_expire_date"), table_name="invite")
+    op.drop_index(op.f("ix_pw_reset_expire_date"), table_name="pw_reset")
+    op.drop_index("ix_pw_reset_open_code", table_name="pw_reset")
+    # Schlägt fehl, falls inzwischen derselbe Code für mehrere Benutzer existiert
+    op.create_index("ix_pw_reset_reset_code", "pw_reset", ["reset_code"], unique=True)
@@ -0,0 +1,62 @@
+"""add hotspot table for the hotspot worker
+
+Revision ID: 8c5e2f71a9d4
+Revises: 3b7d9c2e4f18
+Create Date: 2026-10-19 19:40:27.184302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c5e2f71a9d4"
+down_revision: Union[str, None] = "3b7d9c2e4f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "hotspot",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("source", sa.String(length=10), nullable=False),
+        sa.Column(
+            "area",
+            geoalchemy2.types.Geometry(
+                geometry_type="POLYGON",
+                srid=4326,
+                from_text="ST_GeomFromEWKT",
+                name="geometry",
+            ),
+            nullable=False,
+        ),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("density", sa.Float(), nullable=False),
+        sa.Column("events", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_hotspot_area",
+        "hotspot",
+        ["area"],
+        unique=False,
+        if_not_exists=True,
+        postgresql_using="gist",
+    )
+    op.create_index(op.f("ix_hotspot_source"), "hotspot", ["source"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_hotspot_source"), table_name="hotspot")
+    op.drop_index(
+        "idx_hotspot_area",
+        table_name="hotspot",
+        postgresql_using="gist",
+    )
+    op.drop_table("hotspot")
@@ -0,0 +1,58 @@
+"""add tombstones and keyset indexes for the delta sync feed
+
+Revision ID: 9a41c7e2b6d3
+Revises: 5c8e2f1a9d47
+Create Date: 2026-10-19 13:05:17.284913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a41c7e2b6d3"
+down_revision: Union[str, None] = "5c8e2f1a9d47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tombstone",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tombstone_entity_deleted_at_id",
+        "tombstone",
+        ["entity", "deleted_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_tombstone_deleted_at"), "tombstone", ["deleted_at"], unique=False
+    )
+    op.create_index(
+        "ix_event_updated_at_id", "event", ["updated_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_issue_updated_at_id", "issue", ["updated_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issue_updated_at_id", table_name="issue")
+    op.drop_index("ix_event_updated_at_id", table_name="event")
+    op.drop_index(op.f("ix_tombstone_deleted_at"), table_name="tombstone")
+    op.drop_index("ix_tombstone_entity_deleted_at_id", table_name="tombstone")
+    op.drop_table("tombstone")
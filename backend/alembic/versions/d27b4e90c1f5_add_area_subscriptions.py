@@ -0,0 +1,70 @@
+"""add area subscriptions with a GiST index on the area
+
+Revision ID: d27b4e90c1f5
+Revises: 9a41c7e2b6d3
+Create Date: 2026-10-19 14:21:03.719540
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d27b4e90c1f5"
+down_revision: Union[str, None] = "9a41c7e2b6d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "area_subscription",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column(
+            "area",
+            geoalchemy2.types.Geometry(
+                geometry_type="POLYGON",
+                srid=4326,
+                from_text="ST_GeomFromEWKT",
+                name="geometry",
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_area_subscription_area",
+        "area_subscription",
+        ["area"],
+        unique=False,
+        if_not_exists=True,
+        postgresql_using="gist",
+    )
+    op.create_index(
+        op.f("ix_area_subscription_user_id"),
+        "area_subscription",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_area_subscription_user_id"), table_name="area_subscription"
+    )
+    op.drop_index(
+        "idx_area_subscription_area",
+        table_name="area_subscription",
+        postgresql_using="gist",
+    )
+    op.drop_table("area_subscription")
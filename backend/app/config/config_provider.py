@@ -50,6 +50,222 @@ class ConfigProvider(BaseSettings):
         default="admin123", description="Password for the initial admin user"
     )
 
+    # Mail
+    mail_server: str = Field(default="mailserver", description="SMTP host")
+    mail_port: int = Field(default=1025, description="SMTP port")
+    mail_from: str = Field(default="mail@mail.com", description="Sender address")
+    mail_from_name: str = Field(default="Fire Map", description="Sender name")
+    mail_template_dir: str = Field(
+        default="./mail_templates", description="Directory of the mail templates"
+    )
+    mail_template_cache_dir: str | None = Field(
+        default=None,
+        description="Bytecode cache for compiled mail templates (default: tmp dir)",
+    )
+    mail_queue_max_attempts: int = Field(
+        default=5, description="Send attempts before a mail is dead-lettered"
+    )
+    mail_queue_retry_base_seconds: int = Field(
+        default=10, description="Base delay for exponential retry backoff"
+    )
+    mail_queue_batch_size: int = Field(
+        default=20, description="Mails sent per SMTP connection round"
+    )
+    mail_worker_name: str = Field(
+        default="mail-worker", description="Name of the worker's processing list"
+    )
+
+    # Monitoring
+    metrics_enabled: bool = Field(
+        default=False, description="Expose Prometheus metrics under /metrics"
+    )
+    metrics_token: str | None = Field(
+        default=None,
+        description="Bearer token for /metrics (unset: a logged-in session is needed)",
+    )
+
+    slow_query_threshold_ms: int = Field(
+        default=200, description="Log SQL statements slower than this"
+    )
+    slow_query_explain_sample_rate: float = Field(
+        default=0.0,
+        description="Share of slow SELECTs re-run with EXPLAIN (ANALYZE, BUFFERS)",
+    )
+    sql_profile_requests: bool = Field(
+        default=False, description="Collect a per-statement SQL profile per request"
+    )
+    slow_request_sql_ms: int = Field(
+        default=500, description="Log the SQL profile of requests above this SQL time"
+    )
+
+    # HTTP-Caching
+    reference_data_max_age: int = Field(
+        default=0,
+        description="Cache-Control max-age for tags/vehicles/roles (0 = revalidate)",
+    )
+
+    reference_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Max age of the in-process tag/vehicle/role cache",
+    )
+
+    # Aufräumen abgelaufener Passwort-Resets und Einladungen
+    purge_interval_seconds: int = Field(
+        default=3600, description="Pause between purge runs of the purge worker"
+    )
+    purge_retention_days: int = Field(
+        default=7, description="Keep expired resets/invites for this many days"
+    )
+    purge_batch_size: int = Field(
+        default=1000, description="Rows deleted per transaction"
+    )
+
+    # Rate Limiting
+    rate_limit_enabled: bool = Field(
+        default=True, description="Throttle login, 2FA and password reset routes"
+    )
+    rate_limit_trust_forwarded_for: bool = Field(
+        default=False,
+        description="Use the first X-Forwarded-For address as client IP (proxy)",
+    )
+    rate_limit_login_per_ip: int = Field(
+        default=20, description="Login attempts per IP and minute"
+    )
+    rate_limit_login_per_account: int = Field(
+        default=5, description="Login/2FA attempts per account and minute"
+    )
+    rate_limit_password_reset_per_account: int = Field(
+        default=3, description="Forgot-password mails/attempts per account and hour"
+    )
+
+    # Änderungs-Feed (Delta-Sync)
+    sync_settle_seconds: int = Field(
+        default=5,
+        description="Changes younger than this are held back (longest write tx)",
+    )
+    sync_tombstone_retention_days: int = Field(
+        default=30, description="Keep delete markers; older cursors get 410 Gone"
+    )
+
+    # Gebiets-Abonnements
+    area_subscriptions_per_user: int = Field(
+        default=20, description="Maximum number of area subscriptions per user"
+    )
+    notification_queue_max_length: int = Field(
+        default=200, description="Pending notifications kept per user"
+    )
+    notification_queue_ttl_seconds: int = Field(
+        default=7 * 24 * 3600, description="Drop a user's notifications after this"
+    )
+
+    # Webhooks (workers/webhook_worker.py)
+    webhook_max_concurrency: int = Field(
+        default=10, description="Endpoints delivered to in parallel per worker"
+    )
+    webhook_batch_size: int = Field(
+        default=100, description="Changes sent per request to one endpoint"
+    )
+    webhook_timeout_seconds: float = Field(
+        default=10.0, description="HTTP timeout per webhook request"
+    )
+    webhook_max_attempts: int = Field(
+        default=8, description="Attempts before a change is marked as failed"
+    )
+    webhook_retry_base_seconds: int = Field(
+        default=10, description="Base pause of a failing endpoint (doubles per error)"
+    )
+    webhook_poll_interval_seconds: float = Field(
+        default=2.0, description="Pause of the worker when there is nothing to do"
+    )
+    webhook_fan_out_batch: int = Field(
+        default=500, description="Outbox rows distributed per transaction"
+    )
+
+    # Heatmap-Kacheln (/event/heatmap/{z}/{x}/{y}.png)
+    heatmap_tile_size: int = Field(default=256, description="Tile size in pixels")
+    heatmap_max_zoom: int = Field(default=18, description="Highest zoom level served")
+    heatmap_sigma_px: float = Field(
+        default=6.0, description="Standard deviation of the Gaussian kernel in pixels"
+    )
+    heatmap_saturation: float = Field(
+        default=4.0,
+        description="Density (in overlapping events) at which colors reach ~63%",
+    )
+    heatmap_cache_ttl_seconds: int = Field(
+        default=3600, description="Lifetime of rendered tiles in Redis"
+    )
+
+    # Aggregate der Events (/event/timeline, /event/facets, /event/timelapse)
+    timeline_cache_ttl_seconds: int = Field(
+        default=600, description="Lifetime of cached timeline histograms"
+    )
+
+    facets_cache_ttl_seconds: int = Field(
+        default=60, description="Lifetime of cached facet counts (/event/facets)"
+    )
+
+    timelapse_cache_ttl_seconds: int = Field(
+        default=3600, description="Lifetime of cached time-lapse frames"
+    )
+    timelapse_max_events: int = Field(
+        default=200_000, description="Events per time-lapse; later ones are cut off"
+    )
+    timelapse_coordinate_decimals: int = Field(
+        default=5, description="Decimal places of time-lapse coordinates (5: ~1 m)"
+    )
+
+    # Statistik-Rollup (workers/statistics_worker.py)
+    statistics_grid_degrees: float = Field(
+        default=0.5,
+        description="Edge length of the rollup grid cells (rebuild after changes)",
+    )
+    statistics_refresh_interval_seconds: int = Field(
+        default=60, description="Pause between refreshes of changed days"
+    )
+    statistics_refresh_batch_days: int = Field(
+        default=31, description="Days recomputed per transaction"
+    )
+
+    # Hotspots (workers/hotspot_worker.py)
+    hotspot_interval_seconds: int = Field(
+        default=900, description="Pause between hotspot computations"
+    )
+    hotspot_window_hours: int = Field(
+        default=72, description="Age of the newest events and issues considered"
+    )
+    hotspot_half_life_hours: float = Field(
+        default=24.0, description="Age at which an event counts half"
+    )
+    hotspot_cell_meters: float = Field(
+        default=500.0, description="Edge length of the analysis grid cells"
+    )
+    hotspot_max_cells: int = Field(
+        default=1_000_000, description="Upper bound for cells; larger grids get coarser"
+    )
+    hotspot_bandwidth_meters: float = Field(
+        default=1000.0, description="Standard deviation of the density kernel"
+    )
+    hotspot_neighbourhood_meters: float = Field(
+        default=1000.0, description="Radius of the Getis-Ord neighbourhood"
+    )
+    hotspot_min_z: float = Field(
+        default=2.58, description="Minimum Gi* z-score of a hotspot cell (p < 0.01)"
+    )
+    hotspot_false_discovery_rate: float = Field(
+        default=0.05, description="Accepted share of false hotspot cells (FDR)"
+    )
+    hotspot_min_events: int = Field(
+        default=5, description="Minimum events in the neighbourhood of a hotspot cell"
+    )
+
+    # Live-Stream der Event-Änderungen (SSE)
+    event_stream_queue_size: int = Field(
+        default=100, description="Buffered changes per connection before a resync"
+    )
+    event_stream_heartbeat_seconds: int = Field(
+        default=15, description="Interval of keep-alive comments on idle streams"
+    )
+
     # Frontend URLs
     frontend_url: str = Field(
         default="http://localhost:3000", description="Frontend base URL"
@@ -0,0 +1,118 @@
+import math
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from starlette import status
+
+from config.config_provider import get_config
+from infrastructure.metrics.prometheus import RATE_LIMITED_REQUESTS
+from infrastructure.redis.rate_limiter import RateLimit, RateLimiter, get_rate_limiter
+
+config = get_config()
+
+AccountResolver = Callable[[Request], Awaitable[Optional[str]]]
+
+
+def client_ip(request: Request) -> str:
+    if config.rate_limit_trust_forwarded_for:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def body_field(name: str) -> AccountResolver:
+    """Konto aus einem Feld des JSON-Bodys (z.B. der E-Mail-Adresse)"""
+
+    async def resolve(request: Request) -> Optional[str]:
+        try:
+            body = await request.json()
+        except ValueError:
+            return None
+        value = body.get(name) if isinstance(body, dict) else None
+        return str(value).strip().lower() if value else None
+
+    return resolve
+
+
+async def session_user(request: Request) -> Optional[str]:
+    """Konto aus der (temporären) Session, gesetzt von der SessionMiddleware"""
+    user_id = getattr(request.state, "user_id", None)
+    return str(user_id) if user_id is not None else None
+
+
+class RateLimited:
+    """
+    Dependency, die eine Route pro IP und pro Konto drosselt
+
+    Greift vor dem Routen-Code, damit abgewiesene Anfragen weder bcrypt noch
+    den Mailversand erreichen. Antwortet mit 429 und Retry-After.
+    """
+
+    def __init__(
+        self,
+        route: str,
+        per_ip: Optional[RateLimit] = None,
+        per_account: Optional[RateLimit] = None,
+        account: Optional[AccountResolver] = None,
+    ):
+        self.route = route
+        self.per_ip = per_ip
+        self.per_account = per_account
+        self.account = account
+
+    async def __call__(
+        self,
+        request: Request,
+        limiter: RateLimiter = Depends(get_rate_limiter),
+    ) -> None:
+        if not config.rate_limit_enabled:
+            return
+
+        buckets = []
+        if self.per_ip:
+            buckets.append((f"{self.route}:ip:{client_ip(request)}", self.per_ip))
+        if self.per_account and self.account:
+            account = await self.account(request)
+            if account:
+                buckets.append((f"{self.route}:account:{account}", self.per_account))
+
+        retry_after = await run_in_threadpool(limiter.hit, buckets)
+        if retry_after is None:
+            return
+        RATE_LIMITED_REQUESTS.labels(self.route).inc()
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please try again later",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+MINUTE = 60
+HOUR = 3600
+
+login_rate_limit = RateLimited(
+    "login",
+    per_ip=RateLimit(config.rate_limit_login_per_ip, MINUTE),
+    per_account=RateLimit(config.rate_limit_login_per_account, MINUTE),
+    account=body_field("email"),
+)
+verify_2fa_rate_limit = RateLimited(
+    "verify_2fa",
+    per_ip=RateLimit(config.rate_limit_login_per_ip, MINUTE),
+    per_account=RateLimit(config.rate_limit_login_per_account, MINUTE),
+    account=session_user,
+)
+forgot_password_rate_limit = RateLimited(
+    "forgot_password",
+    per_ip=RateLimit(config.rate_limit_login_per_ip, HOUR),
+    per_account=RateLimit(config.rate_limit_password_reset_per_account, HOUR),
+    account=body_field("email"),
+)
+confirm_forgot_password_rate_limit = RateLimited(
+    "confirm_forgot_password",
+    per_ip=RateLimit(config.rate_limit_login_per_ip, MINUTE),
+    per_account=RateLimit(config.rate_limit_login_per_account, HOUR),
+    account=body_field("email"),
+)
@@ -12,6 +12,10 @@ from domain.issue.repository import IssueRepository
 from domain.vehicletype.repository import VehicleTypeRepository
 from domain.invite.repository import InviteRepository
 from domain.user.otp_repo import OTPRepo
+from domain.subscription.repository import AreaSubscriptionRepository
+from domain.webhook.repository import WebhookRepository
+from domain.statistics.repository import StatisticsRepository
+from domain.hotspot.repository import HotspotRepository
 
 
 def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
@@ -44,3 +48,21 @@ def get_issue_repository(db: Session = Depends(get_db)) -> IssueRepository:
 
 def get_invite_repo(db: Session = Depends(get_db)) -> InviteRepository:
     return InviteRepository(db)
+
+
+def get_area_subscription_repository(
+    db: Session = Depends(get_db),
+) -> AreaSubscriptionRepository:
+    return AreaSubscriptionRepository(db)
+
+
+def get_webhook_repository(db: Session = Depends(get_db)) -> WebhookRepository:
+    return WebhookRepository(db)
+
+
+def get_statistics_repository(db: Session = Depends(get_db)) -> StatisticsRepository:
+    return StatisticsRepository(db)
+
+
+def get_hotspot_repository(db: Session = Depends(get_db)) -> HotspotRepository:
+    return HotspotRepository(db)
@@ -14,6 +14,7 @@ from infrastructure.redis.redis_client import session_manager
 from domain.auth.service import verify_password, hash_password, gen_auth_cookie
 from domain.user.dto import UserCreate, Authresponse, UserLogin, LoginStep2
 from domain.user.model import User, OtpSettings
+from domain.user.principal import Principal
 from infrastructure.postgresql.db import get_db
 from config.config_provider import get_config
 from dependencies.repository_dependencies import (
@@ -21,6 +22,7 @@ from dependencies.repository_dependencies import (
     get_otp_repo,
     get_invite_repo,
 )
+from dependencies.rate_limit_dependencies import login_rate_limit
 from domain.invite.repository import InviteRepository
 from starlette import status
 from loguru import logger
@@ -102,12 +104,16 @@ def register_user(
     invite_repo.mark_as_used(db_invite.invite_uuid)
 
     # Erstelle Session
-    sid = session_manager.create_session(new_user.id)
+    sid = session_manager.create_session(
+        new_user.id, principal=Principal.from_user(new_user).to_session()
+    )
     res = gen_auth_cookie(sid)
     return res
 
 
-@auth_router.post("/login", response_model=Authresponse)
+@auth_router.post(
+    "/login", response_model=Authresponse, dependencies=[Depends(login_rate_limit)]
+)
 def login_user(user_data: UserLogin, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.email == user_data.email).first()
     if not user or not verify_password(user_data.password, user.password):
@@ -128,7 +134,9 @@ def login_user(user_data: UserLogin, db: Session = Depends(get_db)):
         )
         return response
 
-    sid = session_manager.create_session(user.id)
+    sid = session_manager.create_session(
+        user.id, principal=Principal.from_user(user).to_session()
+    )
     response = JSONResponse(
         status_code=status.HTTP_200_OK, content={"requires_mfa": False}
     )
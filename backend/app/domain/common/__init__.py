@@ -0,0 +1,3 @@
+"""
+Shared domain building blocks
+"""
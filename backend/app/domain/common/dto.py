@@ -0,0 +1,23 @@
+from collections import Counter
+from itertools import chain
+from pydantic import BaseModel
+from typing import Iterable, Optional, Literal, Set
+
+
+class BatchItemResult(BaseModel):
+    """Ergebnis einer einzelnen Operation innerhalb eines Batch-Requests"""
+
+    operation: Literal["create", "update", "delete"]
+    index: int
+    id: Optional[int] = None
+    status: int
+    detail: Optional[str] = None
+
+
+def repeated_ids(*id_lists: Iterable[int]) -> Set[int]:
+    """
+    IDs, die in den Update- und Delete-Listen eines Batches zusammen mehrfach
+    vorkommen; solche Einträge widersprechen sich und werden abgelehnt
+    """
+    counts = Counter(chain(*id_lists))
+    return {item_id for item_id, count in counts.items() if count > 1}
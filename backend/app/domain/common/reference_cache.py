@@ -0,0 +1,173 @@
+"""
+Prozesslokaler Cache für Tags, Fahrzeugtypen und Rollen
+
+Die Tabellen sind klein und ändern sich selten. Der Cache wird beim Start
+geladen und nach Änderungen neu geladen: Die Repositories melden Änderungen
+über reference_cache.changed(), das den Versionszähler erhöht (ETags) und die
+Änderung per Redis Pub/Sub an alle Worker-Prozesse verteilt. Diese markieren
+die Tabelle als veraltet und laden sie beim nächsten Zugriff neu.
+
+Als Fallback für verlorene Nachrichten (z.B. Redis-Neustart) wird jede Tabelle
+spätestens nach reference_cache_ttl_seconds neu geladen.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import loguru
+import redis
+from sqlalchemy import select
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from config.config_provider import get_config
+from domain.role.model import Role
+from domain.tag.model import Tag
+from domain.vehicletype.model import VehicleType
+from infrastructure.redis.redis_client import client
+from infrastructure.redis.table_versions import table_versions
+
+config = get_config()
+
+INVALIDATION_CHANNEL = "reference_data:invalidate"
+
+
+class ReferenceTable:
+    """Snapshot einer Stammdatentabelle (Spaltenwerte, keine ORM-Objekte)"""
+
+    def __init__(self, model, columns: Iterable[str]):
+        self.model = model
+        self.columns = tuple(columns)
+        self._rows: Dict[int, dict] = {}
+        self._ids_by_name: Dict[str, int] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.model.__tablename__
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    def load(self, db: Session) -> None:
+        columns = [getattr(self.model, column) for column in self.columns]
+        rows = {row.id: dict(row._mapping) for row in db.execute(select(*columns))}
+        with self._lock:
+            self._rows = rows
+            self._ids_by_name = {row["name"]: row_id for row_id, row in rows.items()}
+            self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self, db: Session) -> None:
+        loaded_at = self._loaded_at
+        if (
+            loaded_at is None
+            or time.monotonic() - loaded_at > config.reference_cache_ttl_seconds
+        ):
+            self.load(db)
+
+    def get(self, db: Session, item_id: int) -> Optional[dict]:
+        self._ensure_loaded(db)
+        return self._rows.get(item_id)
+
+    def get_by_name(self, db: Session, name: str) -> Optional[dict]:
+        self._ensure_loaded(db)
+        item_id = self._ids_by_name.get(name)
+        return self._rows.get(item_id) if item_id is not None else None
+
+    def existing_ids(self, db: Session, ids: Iterable[int]) -> set:
+        """Filtert die IDs auf existierende Einträge"""
+        self._ensure_loaded(db)
+        return {item_id for item_id in ids if item_id in self._rows}
+
+    def instances(self, db: Session, ids: Iterable[int]) -> List:
+        """
+        ORM-Objekte der existierenden IDs, ohne die Datenbank abzufragen
+
+        Die Objekte werden per merge(load=False) als persistent in die Session
+        übernommen und können wie geladene Objekte Relationships zugewiesen
+        werden.
+        """
+        self._ensure_loaded(db)
+        result = []
+        for item_id in dict.fromkeys(ids):
+            row = self._rows.get(item_id)
+            if row is None:
+                continue
+            instance = self.model(**row)
+            make_transient_to_detached(instance)
+            result.append(db.merge(instance, load=False))
+        return result
+
+    def instance(self, db: Session, item_id: int):
+        instances = self.instances(db, [item_id])
+        return instances[0] if instances else None
+
+
+class ReferenceCache:
+    def __init__(self, redis_client: redis.Redis = client):
+        self.redis = redis_client
+        self.tags = ReferenceTable(Tag, ("id", "name"))
+        self.vehicles = ReferenceTable(VehicleType, ("id", "name"))
+        self.roles = ReferenceTable(Role, ("id", "name", "description"))
+        self._tables = {
+            table.name: table for table in (self.tags, self.vehicles, self.roles)
+        }
+        self._pubsub = None
+        self._thread = None
+
+    def table_for(self, model) -> ReferenceTable:
+        return self._tables[model.__tablename__]
+
+    def load_all(self, db: Session) -> None:
+        for table in self._tables.values():
+            table.load(db)
+        loguru.logger.info(
+            "Stammdaten-Cache geladen: "
+            + ", ".join(f"{name}={len(t._rows)}" for name, t in self._tables.items())
+        )
+
+    def invalidate(self, *names: str) -> None:
+        for name in names or self._tables:
+            if name in self._tables:
+                self._tables[name].invalidate()
+
+    def changed(self, name: str) -> None:
+        """Meldet eine committete Änderung an einer Stammdatentabelle"""
+        self.invalidate(name)
+        table_versions.bump(name)
+        try:
+            self.redis.publish(INVALIDATION_CHANNEL, name)
+        except redis.RedisError as e:
+            # Andere Worker laden spätestens nach Ablauf der TTL neu
+            loguru.logger.warning(f"Invalidierung für {name} nicht verteilt: {e}")
+
+    def _on_message(self, message) -> None:
+        self.invalidate(message["data"])
+
+    def _on_error(self, e, pubsub, thread) -> None:
+        # Während der Verbindungsunterbrechung verpasste Änderungen nachholen
+        loguru.logger.warning(f"Stammdaten-Invalidierung unterbrochen: {e}")
+        self.invalidate()
+        time.sleep(1)
+
+    def start_listener(self) -> None:
+        """Startet den Pub/Sub-Listener dieses Prozesses (im Lifespan)"""
+        if self._thread is not None:
+            return
+        self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{INVALIDATION_CHANNEL: self._on_message})
+        self._thread = self._pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=self._on_error
+        )
+
+    def stop_listener(self) -> None:
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread.join(timeout=2)
+            self._pubsub.close()
+            self._thread = None
+            self._pubsub = None
+
+
+reference_cache = ReferenceCache()
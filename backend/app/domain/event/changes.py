@@ -0,0 +1,88 @@
+"""
+Änderungen an Events nach dem Commit verteilen
+
+EventRepository sammelt pro Transaktion EventChange-Objekte und übergibt sie
+nach dem Commit an event_changes.publish(). Die Änderungen werden als eine
+Nachricht per Redis Pub/Sub an alle Worker verteilt (Live-Stream).
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import loguru
+import redis
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.shape import to_shape
+
+from infrastructure.redis.redis_client import client
+
+CHANGES_CHANNEL = "events:changes"
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+@dataclass
+class EventChange:
+    """
+    Eine Änderung an einem Event
+
+    None bei location, tag_ids oder vehicle_ids bedeutet "nicht bekannt"
+    (z.B. bei Deletes oder Updates ohne Tag-Änderung). Filter lassen solche
+    Änderungen durch. moved markiert Updates mit neuem Standort, deren alter
+    Standort nicht bekannt ist.
+    """
+
+    op: str
+    id: int
+    location: Optional[Tuple[float, float]] = None
+    tag_ids: Optional[List[int]] = None
+    vehicle_ids: Optional[List[int]] = None
+    moved: bool = False
+
+    def to_message(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_message(cls, data: dict) -> "EventChange":
+        location = data.get("location")
+        return cls(
+            op=data["op"],
+            id=data["id"],
+            location=tuple(location) if location else None,
+            tag_ids=data.get("tag_ids"),
+            vehicle_ids=data.get("vehicle_ids"),
+            moved=data.get("moved", False),
+        )
+
+
+def point_coordinates(location) -> Optional[Tuple[float, float]]:
+    """[lon, lat] aus einer Liste oder Geometrie"""
+    if location is None:
+        return None
+    if isinstance(location, WKBElement):
+        point = to_shape(location)
+        return (point.x, point.y)
+    if len(location) >= 2:
+        return (float(location[0]), float(location[1]))
+    return None
+
+
+class EventChangePublisher:
+    def __init__(self, redis_client: redis.Redis = client):
+        self.redis = redis_client
+
+    def publish(self, changes: Iterable[EventChange]) -> None:
+        messages = [change.to_message() for change in changes]
+        if not messages:
+            return
+        try:
+            self.redis.publish(CHANGES_CHANNEL, json.dumps(messages))
+        except redis.RedisError as e:
+            # Live-Clients verpassen die Änderung, die Daten sind committet
+            loguru.logger.warning(f"Event-Änderungen nicht verteilt: {e}")
+
+
+event_changes = EventChangePublisher()
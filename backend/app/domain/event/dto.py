@@ -1,9 +1,16 @@
+import hashlib
+import json
+
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from typing import Optional, List, Annotated
+from typing import Optional, List, Annotated, Literal
 from datetime import datetime
 from geoalchemy2.shape import to_shape
 from shapely.geometry import mapping
 
+from domain.common.dto import BatchItemResult
+
+MAX_BATCH_ITEMS = 500
+
 
 class TagResponse(BaseModel):
     id: int
@@ -43,6 +50,26 @@ class EventUpdate(BaseModel):
     vehicle_ids: Optional[List[int]] = None
 
 
+class EventBatchUpdate(EventUpdate):
+    id: int
+
+
+class EventBatchRequest(BaseModel):
+    """Batch-Operationen für Events, die in einer Transaktion ausgeführt werden"""
+
+    create: List[EventCreate] = Field(default_factory=list, max_length=MAX_BATCH_ITEMS)
+    update: List[EventBatchUpdate] = Field(
+        default_factory=list, max_length=MAX_BATCH_ITEMS
+    )
+    delete: List[int] = Field(default_factory=list, max_length=MAX_BATCH_ITEMS)
+
+
+class EventBatchResponse(BaseModel):
+    """Ergebnisliste eines Batch-Requests (eine Zeile pro Operation)"""
+
+    results: List[BatchItemResult]
+
+
 class EventResponse(BaseModel):
     id: int
     name: str
@@ -97,6 +124,74 @@ class EventFilter(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
+    def cache_key(self) -> str:
+        """
+        Kurzer, stabiler Schlüssel der Filterbedingungen für Caches
+
+        Paginierung, Reihenfolge und Duplikate der IDs sowie leere Filter
+        ändern den Schlüssel nicht.
+        """
+        data = self.model_dump(exclude={"page", "limit"}, mode="json")
+        for field in ("tag_ids", "vehicle_ids"):
+            if data[field]:
+                data[field] = sorted(set(data[field]))
+        data = {name: value for name, value in data.items() if value}
+        raw = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+TimelineBucketSize = Literal["hour", "day", "week"]
+
+
+class TimelineBucket(BaseModel):
+    start: datetime = Field(description="Beginn des Intervalls (date_trunc)")
+    count: int = Field(description="Anzahl der Events im Intervall")
+
+
+class EventTimelineResponse(BaseModel):
+    """Anzahl der gefilterten Events pro Intervall (nur Intervalle mit Events)"""
+
+    bucket: TimelineBucketSize
+    total: int = Field(description="Anzahl aller gefilterten Events")
+    buckets: List[TimelineBucket]
+
+
+class EventTimelapseResponse(BaseModel):
+    """
+    Gefilterte Events mit Standort in zeitlicher Reihenfolge, spaltenweise
+    kodiert (siehe domain/event/timelapse.py)
+    """
+
+    start: datetime = Field(description="Zeitpunkt, auf den sich times[0] bezieht")
+    scale: int = Field(description="Koordinate in Grad = Wert / scale")
+    times: List[int] = Field(description="Sekunden seit dem vorherigen Event")
+    lon: List[int]
+    lat: List[int]
+    ids: List[int]
+    truncated: bool = Field(description="Mehr als timelapse_max_events Treffer")
+
+
+class FacetCount(BaseModel):
+    id: int
+    count: int = Field(description="Treffer bei Auswahl dieses Eintrags")
+
+
+class EventFacetsResponse(BaseModel):
+    """Trefferzahlen für die Filter-Seitenleiste (nur Einträge mit Treffern)"""
+
+    total: int = Field(description="Anzahl der Events für den aktuellen Filter")
+    tags: List[FacetCount]
+    vehicles: List[FacetCount]
+
+
+class EventChangesResponse(BaseModel):
+    """Seite des Änderungs-Feeds (Delta-Sync)"""
+
+    events: List[EventResponse] = Field(description="Angelegte/geänderte Events")
+    deleted_ids: List[int] = Field(description="IDs gelöschter Events")
+    next_cursor: str = Field(description="Cursor für die nächste Abfrage")
+    has_more: bool = Field(description="Weitere Änderungen sofort abrufbar")
+
 
 class PaginatedEventResponse(BaseModel):
     """Paginierte Response für Events"""
@@ -0,0 +1,206 @@
+"""
+Heatmap-Kacheln (Web Mercator, z/x/y) der Event-Dichte als PNG
+
+Pro Kachel werden nur die Koordinaten der Events in der Kachel plus einem
+Rand von der Breite des Kernels geladen. NumPy zählt sie mit histogram2d in
+ein Pixelraster, ein separierbarer Gaußfilter glättet das Raster, eine
+Farbtabelle färbt es ein. Der Rand sorgt dafür, dass Punkte knapp außerhalb
+der Kachel mitgezählt werden und an den Kachelgrenzen keine Kanten entstehen.
+
+Fertige Kacheln liegen in Redis unter der aktuellen Version der Event-Tabelle
+(table_versions). Jede Event-Änderung erhöht die Version, ältere Kacheln
+werden dadurch nicht mehr gelesen und laufen per TTL ab.
+"""
+
+import io
+import math
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import loguru
+import numpy as np
+import redis
+from numpy.lib.stride_tricks import sliding_window_view
+from PIL import Image
+
+from config.config_provider import get_config
+from infrastructure.metrics.prometheus import HEATMAP_TILE_CACHE_LOOKUPS
+from infrastructure.redis.redis_client import binary_client
+from infrastructure.redis.table_versions import TableVersions, table_versions
+
+config = get_config()
+
+TILE_PREFIX = "heatmap_tile:"
+
+EARTH_RADIUS = 6378137.0
+# Halbe Ausdehnung der Web-Mercator-Welt in Metern
+ORIGIN_SHIFT = math.pi * EARTH_RADIUS
+
+# Farbverlauf (Anteil der Sättigung, RGBA): transparent -> blau -> rot
+_COLOR_STOPS = (
+    (0.0, (0, 0, 255, 0)),
+    (0.2, (0, 128, 255, 110)),
+    (0.45, (0, 220, 120, 160)),
+    (0.7, (255, 220, 0, 200)),
+    (1.0, (220, 0, 0, 230)),
+)
+
+
+def kernel_radius() -> int:
+    """Randbreite in Pixeln: der Kernel endet bei drei Standardabweichungen"""
+    return math.ceil(3 * config.heatmap_sigma_px)
+
+
+def tile_bounds(z: int, x: int, y: int, margin_px: int = 0) -> Tuple[float, ...]:
+    """Web-Mercator-Grenzen (min_x, min_y, max_x, max_y) einer Kachel plus Rand"""
+    size = 2 * ORIGIN_SHIFT / 2**z
+    margin = size * margin_px / config.heatmap_tile_size
+    min_x = -ORIGIN_SHIFT + x * size
+    max_y = ORIGIN_SHIFT - y * size
+    return (
+        min_x - margin,
+        max_y - size - margin,
+        min_x + size + margin,
+        max_y + margin,
+    )
+
+
+def mercator_to_lonlat(mx: float, my: float) -> Tuple[float, float]:
+    lon = math.degrees(mx / EARTH_RADIUS)
+    lat = math.degrees(2 * math.atan(math.exp(my / EARTH_RADIUS)) - math.pi / 2)
+    return max(-180.0, min(180.0, lon)), lat
+
+
+def lonlat_bounds(bounds: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Umrechnung von tile_bounds in (min_lon, min_lat, max_lon, max_lat)"""
+    return (*mercator_to_lonlat(*bounds[:2]), *mercator_to_lonlat(*bounds[2:]))
+
+
+@lru_cache(maxsize=8)
+def _gaussian_kernel(sigma: float, radius: int) -> np.ndarray:
+    """1D-Kernel mit Spitze 1: ein einzelnes Event ergibt die Dichte 1"""
+    offsets = np.arange(-radius, radius + 1, dtype=np.float64)
+    return np.exp(-(offsets**2) / (2 * sigma**2))
+
+
+@lru_cache(maxsize=1)
+def _color_table() -> np.ndarray:
+    """256 RGBA-Farben, linear zwischen den Stützstellen interpoliert"""
+    positions = np.linspace(0.0, 1.0, 256)
+    stops = np.array([stop for stop, _ in _COLOR_STOPS])
+    colors = np.array([color for _, color in _COLOR_STOPS], dtype=np.float64)
+    table = np.stack(
+        [np.interp(positions, stops, colors[:, channel]) for channel in range(4)],
+        axis=1,
+    )
+    return table.round().astype(np.uint8)
+
+
+def density_grid(
+    points: np.ndarray, bounds: Tuple[float, ...], size: int, radius: int
+) -> np.ndarray:
+    """
+    Geglättete Dichte (size x size, Zeile 0 oben) aus Web-Mercator-Punkten
+
+    bounds umfasst die Kachel plus radius Pixel Rand auf jeder Seite; die
+    Faltung ohne Auffüllen ("valid") schneidet den Rand wieder ab.
+    """
+    cells = size + 2 * radius
+    min_x, min_y, max_x, max_y = bounds
+    counts, _, _ = np.histogram2d(
+        max_y - points[:, 1],
+        points[:, 0] - min_x,
+        bins=cells,
+        range=((0, max_y - min_y), (0, max_x - min_x)),
+    )
+    kernel = _gaussian_kernel(config.heatmap_sigma_px, radius)
+    # Separierbar: erst über die Zeilen, dann über die Spalten falten
+    rows = sliding_window_view(counts, kernel.size, axis=0) @ kernel
+    return sliding_window_view(rows, kernel.size, axis=1) @ kernel
+
+
+def colorize(density: np.ndarray) -> np.ndarray:
+    """
+    RGBA-Bild aus der Dichte
+
+    Feste Sättigung statt Normierung auf das Maximum der Kachel, damit
+    benachbarte Kacheln derselben Zoomstufe zusammenpassen.
+    """
+    intensity = 1.0 - np.exp(-density / config.heatmap_saturation)
+    return _color_table()[(intensity * 255).astype(np.uint8)]
+
+
+def encode_png(rgba: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(rgba).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def render_tile(points: np.ndarray, z: int, x: int, y: int) -> bytes:
+    """PNG der Kachel z/x/y aus den Web-Mercator-Koordinaten (n x 2)"""
+    size = config.heatmap_tile_size
+    if len(points) == 0:
+        return _empty_tile(size)
+    radius = kernel_radius()
+    density = density_grid(points, tile_bounds(z, x, y, radius), size, radius)
+    return encode_png(colorize(density))
+
+
+@lru_cache(maxsize=1)
+def _empty_tile(size: int) -> bytes:
+    return encode_png(np.zeros((size, size, 4), dtype=np.uint8))
+
+
+class HeatmapTileCache:
+    """
+    Gerenderte Kacheln in Redis, versioniert über die Event-Tabelle
+
+    Ist Redis nicht erreichbar, wird ohne Cache gerendert.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis = binary_client,
+        versions: TableVersions = table_versions,
+    ):
+        self.redis = redis_client
+        self.versions = versions
+
+    def version(self) -> Optional[int]:
+        """Aktuelle Version der Events oder None ohne Redis"""
+        try:
+            return self.versions.version("event")
+        except redis.RedisError as e:
+            loguru.logger.warning(f"Heatmap-Cache nicht verfügbar: {e}")
+            return None
+
+    @staticmethod
+    def key(version: int, tile: str) -> str:
+        return f"{TILE_PREFIX}{version}:{tile}"
+
+    def get(self, version: int, tile: str) -> Optional[bytes]:
+        try:
+            png = self.redis.get(self.key(version, tile))
+        except redis.RedisError as e:
+            loguru.logger.warning(f"Heatmap-Kachel nicht gelesen: {e}")
+            return None
+        HEATMAP_TILE_CACHE_LOOKUPS.labels("hit" if png else "miss").inc()
+        return png
+
+    def put(self, version: int, tile: str, png: bytes) -> None:
+        try:
+            self.redis.set(
+                self.key(version, tile), png, ex=config.heatmap_cache_ttl_seconds
+            )
+        except redis.RedisError as e:
+            loguru.logger.warning(f"Heatmap-Kachel nicht gespeichert: {e}")
+
+
+heatmap_tiles = HeatmapTileCache()
+
+
+def get_heatmap_tiles() -> HeatmapTileCache:
+    """
+    Dependency to inject the heatmap tile cache
+    """
+    return heatmap_tiles
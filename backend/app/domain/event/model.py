@@ -1,7 +1,16 @@
 from datetime import datetime
 
 from infrastructure.postgresql.db import Base
-from sqlalchemy import Integer, String, DateTime, ForeignKey, func, Table, Column
+from sqlalchemy import (
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    func,
+    Table,
+    Column,
+    Index,
+)
 from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.orm import mapped_column
 from geoalchemy2 import Geometry, WKBElement
@@ -43,6 +52,10 @@ event_vehicles = Table(
 
 class Event(Base):
     __tablename__ = "event"
+    __table_args__ = (
+        # Keyset-Scan des Änderungs-Feeds: (updated_at, id) > (?, ?)
+        Index("ix_event_updated_at_id", "updated_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, autoincrement=True, index=True
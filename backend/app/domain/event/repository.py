@@ -1,18 +1,79 @@
+import time
+
 import loguru
-from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete, and_, func
-from typing import List, Optional, Tuple
+import numpy as np
+import redis
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.selectable import ScalarSelect
+from sqlalchemy import (
+    Column,
+    Date,
+    and_,
+    cast,
+    delete,
+    distinct,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from typing import Dict, Iterable, List, Optional, Tuple
 from geoalchemy2.functions import ST_GeomFromText, ST_DWithin, ST_Transform
 from geoalchemy2.shape import to_shape
 from geoalchemy2.elements import WKBElement
-from datetime import datetime
+from datetime import date, datetime
 
-from domain.event.model import Event
-from domain.event.dto import EventCreate, EventUpdate, EventFilter
+from domain.event.model import Event, event_tags, event_vehicles
+from domain.event.dto import (
+    EventCreate,
+    EventUpdate,
+    EventFilter,
+    EventBatchRequest,
+)
+from domain.common.dto import BatchItemResult, repeated_ids
 from domain.user.model import User
 from domain.tag.model import Tag
 from domain.vehicletype.model import VehicleType
+from domain.common.reference_cache import reference_cache
+from domain.event.changes import (
+    CREATED,
+    DELETED,
+    UPDATED,
+    EventChange,
+    event_changes,
+    point_coordinates,
+)
+from domain.sync.repository import ChangeSet, SyncCursor, SyncRepository
+from domain.subscription.repository import AreaSubscriptionRepository
+from domain.webhook.repository import WebhookRepository
 from infrastructure.geocoding import get_nominatim_service
+from infrastructure.redis.notification_queue import notification_queue
+from infrastructure.redis.rollup_dirty_days import rollup_dirty_days
+from infrastructure.redis.table_versions import table_versions
+
+BATCH_OPERATION_ORDER = ("create", "update", "delete")
+
+
+def linked_days(link: Column, item_id: int) -> ScalarSelect:
+    """
+    Unterabfrage: Tage (created_at) der Events, die mit dem Tag oder Fahrzeug
+    verknüpft sind, z.B. linked_days(event_tags.c.tag_id, tag_id)
+
+    Im RETURNING eines DELETE sieht sie die Links noch, die per Cascade mit
+    gelöscht werden (gleicher Snapshot), und kostet kein eigenes Statement.
+    """
+    return (
+        select(func.array_agg(distinct(cast(Event.created_at, Date))))
+        .join_from(Event, link.table)
+        .where(link == item_id)
+        .scalar_subquery()
+    )
 
 
 class EventRepository:
@@ -35,31 +96,32 @@ class EventRepository:
             created_by=current_user.id,
         )
 
-        # Add tags
-        if event_data.tag_ids:
-            tags = (
-                self.db.execute(select(Tag).where(Tag.id.in_(event_data.tag_ids)))
-                .scalars()
-                .all()
-            )
+        # Add tags and vehicles (aus dem Stammdaten-Cache, ohne Query)
+        tags = reference_cache.tags.instances(self.db, event_data.tag_ids or [])
+        vehicles = reference_cache.vehicles.instances(
+            self.db, event_data.vehicle_ids or []
+        )
+        if tags:
             db_event.tags = tags
-
-        # Add vehicles
-        if event_data.vehicle_ids:
-            vehicles = (
-                self.db.execute(
-                    select(VehicleType).where(
-                        VehicleType.id.in_(event_data.vehicle_ids)
-                    )
-                )
-                .scalars()
-                .all()
-            )
+        if vehicles:
             db_event.vehicles = vehicles
 
         self.db.add(db_event)
+        self.db.flush()
+        changes = [
+            EventChange(
+                CREATED,
+                db_event.id,
+                point_coordinates(event_data.location),
+                [tag.id for tag in tags],
+                [vehicle.id for vehicle in vehicles],
+            )
+        ]
+        self._record_changes(changes)
         self.db.commit()
-        self.db.refresh(db_event)
+        # Nur serverseitig gesetzte Spalten nachladen, Tags/Fahrzeuge sind bekannt
+        self.db.refresh(db_event, ["location", "created_at", "updated_at"])
+        self._after_commit(changes, [db_event.created_at])
         return db_event
 
     def get_by_id(self, event_id: int) -> Optional[Event]:
@@ -68,23 +130,186 @@ class EventRepository:
         result = self.db.execute(query).scalar_one_or_none()
         return result
 
+    def get_updated_at(self, event_id: int) -> Optional[datetime]:
+        """Get only the last modification time of an event (for ETags)"""
+        query = select(Event.updated_at).where(Event.id == event_id)
+        return self.db.execute(query).scalar_one_or_none()
+
     async def get_filtered_events(self, filters: EventFilter) -> Tuple[List[Event], int]:
         """Get events with database-side filtering and pagination"""
-        # Basis-Query erstellen
-        base_query = select(Event).distinct()
+        base_query = select(Event)
+        conditions = await self._filter_conditions(filters)
+        if conditions:
+            base_query = base_query.where(and_(*conditions))
+
+        # Gesamtanzahl ermitteln (für Paginierung)
+        count_query = select(func.count()).select_from(
+            base_query.subquery()
+        )
+        total_count = self.db.execute(count_query).scalar()
+
+        # Paginierung anwenden
+        offset = (filters.page - 1) * filters.limit
+        paginated_query = (
+            base_query.offset(offset)
+            .limit(filters.limit)
+            # Tags und Fahrzeuge für die ganze Seite in je einer Query laden
+            .options(selectinload(Event.tags), selectinload(Event.vehicles))
+        )
+
+        # Events abrufen
+        events = self.db.execute(paginated_query).scalars().all()
+        
+        return events, total_count
+
+    async def get_heatmap_points(
+        self, filters: EventFilter, bounds: Tuple[float, float, float, float]
+    ) -> np.ndarray:
+        """
+        Web-Mercator-Koordinaten (x, y) der gefilterten Events in bounds (lon/lat)
+
+        Nur die Koordinaten, keine ORM-Objekte: der GiST-Index auf location
+        liefert die Kandidaten, das Ergebnis geht direkt in ein NumPy-Array.
+        """
+        location = ST_Transform(Event.location, 3857)
+        query = select(func.ST_X(location), func.ST_Y(location)).where(
+            Event.location.intersects(func.ST_MakeEnvelope(*bounds, 4326)),
+            *await self._filter_conditions(filters),
+        )
+        rows = self.db.execute(query).all()
+        return np.array(rows, dtype=np.float64).reshape(-1, 2)
+
+    async def get_timeline(
+        self, filters: EventFilter, bucket: str
+    ) -> List[Tuple[datetime, int]]:
+        """
+        Anzahl der gefilterten Events pro Intervall (hour, day oder week)
+
+        Eine Aggregat-Abfrage; Intervalle ohne Events fehlen im Ergebnis.
+        """
+        # Als Literal, damit SELECT und GROUP BY denselben Ausdruck enthalten
+        start = func.date_trunc(
+            literal(bucket, literal_execute=True), Event.created_at
+        ).label("start")
+        query = (
+            select(start, func.count())
+            .where(*await self._filter_conditions(filters))
+            .group_by(start)
+            .order_by(start)
+        )
+        return [tuple(row) for row in self.db.execute(query)]
+
+    async def get_timelapse(self, filters: EventFilter, limit: int) -> np.ndarray:
+        """
+        (Epoch-Sekunden, lon, lat, id) der gefilterten Events mit Standort
+
+        Ein sortierter Scan über created_at, nur die benötigten Spalten; das
+        Ergebnis geht direkt in ein NumPy-Array. Höchstens limit Zeilen.
+        """
+        query = (
+            select(
+                func.extract("epoch", Event.created_at),
+                func.ST_X(Event.location),
+                func.ST_Y(Event.location),
+                Event.id,
+            )
+            .where(
+                Event.location.is_not(None), *await self._filter_conditions(filters)
+            )
+            .order_by(Event.created_at, Event.id)
+            .limit(limit)
+        )
+        rows = self.db.execute(query).all()
+        return np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+    async def get_facets(self, filters: EventFilter) -> Dict:
+        """
+        Trefferzahlen pro Tag und Fahrzeugtyp für die Filter-Seitenleiste
+
+        Ein Tag zählt die Events, die alle Filter außer dem Tag-Filter erfüllen
+        (Fahrzeugtypen entsprechend), also die Treffer bei Auswahl dieses Tags.
+        Eine Abfrage: GROUPING SETS über Tags, Fahrzeugtypen und die Gesamtzahl,
+        die Filter auf Tags und Fahrzeuge wirken als FILTER der Aggregate.
+
+        Returns:
+            {"total": int, "tags": {tag_id: count}, "vehicles": {id: count}}
+        """
+        tags_match = self._tag_filter(filters.tag_ids)
+        vehicles_match = self._vehicle_filter(filters.vehicle_ids)
+        others = filters.model_copy(update={"tag_ids": None, "vehicle_ids": None})
+        event_count = func.count(distinct(Event.id))
+        # Bitmaske: 1 = Gruppe pro Tag, 2 = pro Fahrzeugtyp, 3 = Gesamtzahl
+        grouping = func.grouping(event_tags.c.tag_id, event_vehicles.c.vehicle_id)
+        query = (
+            select(
+                grouping,
+                event_tags.c.tag_id,
+                event_vehicles.c.vehicle_id,
+                event_count.filter(vehicles_match),
+                event_count.filter(tags_match),
+                event_count.filter(and_(tags_match, vehicles_match)),
+            )
+            .select_from(Event)
+            .outerjoin(event_tags, event_tags.c.event_id == Event.id)
+            .outerjoin(event_vehicles, event_vehicles.c.event_id == Event.id)
+            .where(*await self._filter_conditions(others))
+            .group_by(
+                func.grouping_sets(
+                    tuple_(event_tags.c.tag_id),
+                    tuple_(event_vehicles.c.vehicle_id),
+                    tuple_(),
+                )
+            )
+        )
+        facets = {"total": 0, "tags": {}, "vehicles": {}}
+        rows = self.db.execute(query).all()
+        for group, tag_id, vehicle_id, per_tag, per_vehicle, total in rows:
+            if group == 1 and tag_id is not None and per_tag:
+                facets["tags"][tag_id] = per_tag
+            elif group == 2 and vehicle_id is not None and per_vehicle:
+                facets["vehicles"][vehicle_id] = per_vehicle
+            elif group == 3:
+                facets["total"] = total
+        return facets
+
+    @staticmethod
+    def _tag_filter(tag_ids: Optional[List[int]]):
+        """Event hat einen der Tags (ohne Tag-Filter immer wahr)"""
+        if not tag_ids:
+            return true()
+        return exists().where(
+            event_tags.c.event_id == Event.id, event_tags.c.tag_id.in_(tag_ids)
+        )
+
+    @staticmethod
+    def _vehicle_filter(vehicle_ids: Optional[List[int]]):
+        """Event hat einen der Fahrzeugtypen (ohne Filter immer wahr)"""
+        if not vehicle_ids:
+            return true()
+        return exists().where(
+            event_vehicles.c.event_id == Event.id,
+            event_vehicles.c.vehicle_id.in_(vehicle_ids),
+        )
+
+    async def _filter_conditions(self, filters: EventFilter) -> List:
+        """
+        WHERE-Bedingungen für die Filter eines EventFilter (ohne Paginierung)
+
+        Tags und Fahrzeuge werden per EXISTS geprüft, so bleibt die Abfrage
+        eine Zeile pro Event (kein JOIN mit DISTINCT) und lässt sich für
+        Listen, Zählungen und Aggregationen gleichermaßen verwenden.
+        """
+        conditions = []
 
         # Filter für Fahrzeugtypen anwenden
         if filters.vehicle_ids:
-            base_query = base_query.join(Event.vehicles).where(
-                VehicleType.id.in_(filters.vehicle_ids)
-            )
+            conditions.append(self._vehicle_filter(filters.vehicle_ids))
 
         # Filter für Tags anwenden
         if filters.tag_ids:
-            base_query = base_query.join(Event.tags).where(Tag.id.in_(filters.tag_ids))
+            conditions.append(self._tag_filter(filters.tag_ids))
 
         # Filter für Zeitraum anwenden
-        conditions = []
         if filters.start_date:
             conditions.append(Event.created_at >= filters.start_date)
         if filters.end_date:
@@ -128,23 +353,16 @@ class EventRepository:
                 loguru.logger.error(f"Fehler beim Geocoding für {filters.city_name}: {str(e)}")
                 # Bei Fehlern ignorieren wir den Geo-Filter
 
-        if conditions:
-            base_query = base_query.where(and_(*conditions))
+        return conditions
 
-        # Gesamtanzahl ermitteln (für Paginierung)
-        count_query = select(func.count()).select_from(
-            base_query.subquery()
+    def get_changes(self, cursor: SyncCursor, limit: int) -> ChangeSet:
+        """Seit dem Cursor geänderte und gelöschte Events (Delta-Sync)"""
+        return SyncRepository(self.db).changes(
+            Event,
+            cursor,
+            limit,
+            options=(selectinload(Event.tags), selectinload(Event.vehicles)),
         )
-        total_count = self.db.execute(count_query).scalar()
-
-        # Paginierung anwenden
-        offset = (filters.page - 1) * filters.limit
-        paginated_query = base_query.offset(offset).limit(filters.limit)
-
-        # Events abrufen
-        events = self.db.execute(paginated_query).scalars().all()
-        
-        return events, total_count
 
     def get_by_user(self, user_id: int) -> List[Event]:
         """Get all events created by a specific user"""
@@ -152,67 +370,443 @@ class EventRepository:
         result = self.db.execute(query).scalars().all()
         return result
 
-    def update(self, event_id: int, event_data: EventUpdate) -> Optional[Event]:
-        """Update an event"""
-        # First check if the event exists
-        db_event = self.get_by_id(event_id)
-        if not db_event:
-            return None
+    def exists(self, event_id: int) -> bool:
+        """Check whether an event with the given ID exists"""
+        query = select(Event.id).where(Event.id == event_id)
+        return self.db.execute(query).scalar_one_or_none() is not None
 
-        # Update basic fields
+    def update(
+        self, event_id: int, event_data: EventUpdate, owner_id: Optional[int] = None
+    ) -> Optional[Event]:
+        """
+        Update an event with a single UPDATE ... RETURNING.
+
+        If owner_id is given, only events created by that user are updated.
+        Returns None if no matching event was found.
+        """
+        values = {}
         if event_data.name is not None:
-            db_event.name = event_data.name
+            values["name"] = event_data.name
         if event_data.description is not None:
-            db_event.description = event_data.description
-
-        # Handle location update
+            values["description"] = event_data.description
         if event_data.location is not None:
-            if len(event_data.location) >= 2:
-                lon, lat = event_data.location[0], event_data.location[1]
-                wkt_point = f"POINT({lon} {lat})"
-                db_event.location = ST_GeomFromText(wkt_point)
-            else:
-                db_event.location = None
-
-        # Update tags
+            values["location"] = self._location_ewkt(event_data.location)
+        if not values:
+            # Auch reine Tag-/Fahrzeug-Änderungen liefern so die Zeile zurück
+            values["updated_at"] = func.now()
+
+        stmt = update(Event).where(Event.id == event_id)
+        if owner_id is not None:
+            stmt = stmt.where(Event.created_by == owner_id)
+        stmt = stmt.values(**values).returning(Event)
+
+        db_event = self.db.execute(stmt).scalar_one_or_none()
+        if not db_event:
+            return None
+
+        change = EventChange(
+            UPDATED,
+            db_event.id,
+            point_coordinates(db_event.location),
+            moved=event_data.location is not None,
+        )
         if event_data.tag_ids is not None:
-            tags = (
-                self.db.execute(select(Tag).where(Tag.id.in_(event_data.tag_ids)))
-                .scalars()
-                .all()
+            tags = self._replace_associations(
+                db_event, event_tags, "tag_id", Tag, event_data.tag_ids
             )
-            db_event.tags = tags
-
-        # Update vehicles
+            set_committed_value(db_event, "tags", tags)
+            change.tag_ids = [tag.id for tag in tags]
         if event_data.vehicle_ids is not None:
-            vehicles = (
-                self.db.execute(
-                    select(VehicleType).where(
-                        VehicleType.id.in_(event_data.vehicle_ids)
-                    )
-                )
-                .scalars()
-                .all()
+            vehicles = self._replace_associations(
+                db_event,
+                event_vehicles,
+                "vehicle_id",
+                VehicleType,
+                event_data.vehicle_ids,
             )
-            db_event.vehicles = vehicles
+            set_committed_value(db_event, "vehicles", vehicles)
+            change.vehicle_ids = [vehicle.id for vehicle in vehicles]
 
+        self._record_changes([change])
         self.db.commit()
-        self.db.refresh(db_event)
+        self._after_commit([change], [db_event.created_at])
         return db_event
 
-    def delete(self, event_id: int) -> bool:
-        """Delete an event"""
-        # First check if the event exists
-        db_event = self.get_by_id(event_id)
-        if not db_event:
-            return False
+    def delete(self, event_id: int, owner_id: Optional[int] = None) -> bool:
+        """
+        Delete an event with a single DELETE ... RETURNING.
 
-        # Execute delete
+        If owner_id is given, only events created by that user are deleted.
+        """
         stmt = delete(Event).where(Event.id == event_id)
-        self.db.execute(stmt)
+        if owner_id is not None:
+            stmt = stmt.where(Event.created_by == owner_id)
+        stmt = stmt.returning(
+            Event.id, Event.location, Event.created_at
+        ).execution_options(synchronize_session=False)
+
+        deleted = self.db.execute(stmt).one_or_none()
+        if deleted is None:
+            return False
+        changes = [
+            EventChange(DELETED, deleted.id, point_coordinates(deleted.location))
+        ]
+        self._record_changes(changes)
         self.db.commit()
+        self._after_commit(changes, [deleted.created_at])
         return True
 
+    def _record_changes(self, changes: List[EventChange]) -> None:
+        """
+        Schreibt Änderungen in der laufenden Transaktion mit
+
+        Tombstones für den Änderungs-Feed und die Webhook-Outbox werden so nur
+        zusammen mit der Änderung selbst committet.
+        """
+        SyncRepository(self.db).record_deletes(
+            Event.__tablename__, [c.id for c in changes if c.op == DELETED]
+        )
+        WebhookRepository(self.db).record([c.to_message() for c in changes])
+
+    def _after_commit(
+        self, changes: List[EventChange], created_at: Iterable[datetime] = ()
+    ) -> None:
+        """
+        Verteilt committete Änderungen (Live-Stream, Gebiets-Abonnements)
+
+        Die Tabellenversion macht gecachte Aggregate (z.B. Heatmap-Kacheln)
+        ungültig, die Tage der Events (created_at) werden für den
+        Statistik-Rollup neu berechnet.
+        """
+        if not changes:
+            return
+        rollup_dirty_days.mark({timestamp.date() for timestamp in created_at})
+        self._bump_version()
+        event_changes.publish(changes)
+        self._notify_subscribers(
+            [c.id for c in changes if c.op == CREATED and c.location is not None]
+        )
+
+    def links_deleted(self, days: Optional[Iterable[date]] = None) -> None:
+        """
+        Meldet einen committeten Löschvorgang eines Tags oder Fahrzeugs
+
+        Seine Links in event_tags bzw. event_vehicles entfallen per ON DELETE
+        CASCADE, ohne dass ein Event geändert wird. Die Tabellenversion macht
+        die gecachten Aggregate (Facetten, Timeline, Kacheln) trotzdem ungültig,
+        die Tage der verknüpften Events (linked_days) werden für den
+        Statistik-Rollup neu berechnet.
+        """
+        rollup_dirty_days.mark(days or ())
+        self._bump_version()
+
+    def _bump_version(self) -> None:
+        try:
+            table_versions.bump(Event.__tablename__)
+        except redis.RedisError as e:
+            loguru.logger.warning(f"Version der Events nicht erhöht: {e}")
+
+    def _notify_subscribers(self, event_ids: List[int]) -> None:
+        if not event_ids:
+            return
+        try:
+            matches = AreaSubscriptionRepository(self.db).match_events(event_ids)
+            now = time.time()
+            notification_queue.push(dict(match, created_at=now) for match in matches)
+        except (SQLAlchemyError, redis.RedisError) as e:
+            # Das Event ist committet, nur die Benachrichtigungen fehlen
+            self.db.rollback()
+            loguru.logger.error(f"Gebiets-Abonnements nicht benachrichtigt: {e}")
+
+    def _replace_associations(self, db_event: Event, table, column: str, model, ids):
+        """Ersetzt die Zuordnungen eines Events und gibt die neuen Objekte zurück"""
+        items = reference_cache.table_for(model).instances(self.db, ids or [])
+        self.db.execute(delete(table).where(table.c.event_id == db_event.id))
+        if items:
+            self.db.execute(
+                insert(table),
+                [{"event_id": db_event.id, column: item.id} for item in items],
+            )
+        return items
+
+    def batch(
+        self, batch: EventBatchRequest, current_user: User, admin: bool = False
+    ) -> List[BatchItemResult]:
+        """
+        Führt Create-, Update- und Delete-Operationen in einer Transaktion aus.
+
+        Creates werden mit einem einzigen INSERT ... RETURNING angelegt, die
+        Zuordnungen zu Tags und Fahrzeugen per executemany eingefügt. Fehlende
+        oder fremde Events (ohne Admin-Rechte) sowie mehrfach in update/delete
+        genannte IDs (409) werden pro Eintrag gemeldet, ohne den restlichen
+        Batch abzubrechen.
+        """
+        results: List[BatchItemResult] = []
+        changes: List[EventChange] = []
+        # created_at aller geänderten Events (Tage des Statistik-Rollups)
+        days: List[datetime] = []
+
+        # Bestehende Events für Update/Delete mit einer Abfrage laden
+        target_ids = {item.id for item in batch.update} | set(batch.delete)
+        owners, created_at = {}, {}
+        if target_ids:
+            for event_id, created_by, timestamp in self.db.execute(
+                select(Event.id, Event.created_by, Event.created_at).where(
+                    Event.id.in_(target_ids)
+                )
+            ):
+                owners[event_id] = created_by
+                created_at[event_id] = timestamp
+
+        conflicting_ids = repeated_ids(
+            [item.id for item in batch.update], batch.delete
+        )
+
+        def check_access(operation: str, index: int, event_id: int) -> bool:
+            if event_id in conflicting_ids:
+                results.append(
+                    BatchItemResult(
+                        operation=operation,
+                        index=index,
+                        id=event_id,
+                        status=409,
+                        detail=f"Event with ID {event_id} is listed more than once",
+                    )
+                )
+                return False
+            if event_id not in owners:
+                results.append(
+                    BatchItemResult(
+                        operation=operation,
+                        index=index,
+                        id=event_id,
+                        status=404,
+                        detail=f"Event with ID {event_id} not found",
+                    )
+                )
+                return False
+            if not admin and owners[event_id] != current_user.id:
+                results.append(
+                    BatchItemResult(
+                        operation=operation,
+                        index=index,
+                        id=event_id,
+                        status=403,
+                        detail="Sie haben keine Berechtigung, dieses Event zu bearbeiten",
+                    )
+                )
+                return False
+            return True
+
+        updates = [
+            (index, item)
+            for index, item in enumerate(batch.update)
+            if check_access("update", index, item.id)
+        ]
+        deletes = [
+            (index, event_id)
+            for index, event_id in enumerate(batch.delete)
+            if check_access("delete", index, event_id)
+        ]
+
+        # Nur existierende Tags/Fahrzeuge zuordnen (wie bei create/update)
+        requested_tag_ids = {
+            tag_id
+            for item in [*batch.create, *batch.update]
+            for tag_id in item.tag_ids or []
+        }
+        requested_vehicle_ids = {
+            vehicle_id
+            for item in [*batch.create, *batch.update]
+            for vehicle_id in item.vehicle_ids or []
+        }
+        valid_tag_ids = self._existing_ids(Tag, requested_tag_ids)
+        valid_vehicle_ids = self._existing_ids(VehicleType, requested_vehicle_ids)
+
+        try:
+            tag_rows = []
+            vehicle_rows = []
+
+            # Creates: ein INSERT ... RETURNING für alle Events
+            if batch.create:
+                created = self.db.execute(
+                    insert(Event).returning(
+                        Event.id, Event.created_at, sort_by_parameter_order=True
+                    ),
+                    [
+                        {
+                            "name": item.name,
+                            "description": item.description,
+                            "location": self._location_ewkt(item.location),
+                            "created_by": current_user.id,
+                        }
+                        for item in batch.create
+                    ],
+                ).all()
+                days += [row.created_at for row in created]
+                for index, (item, (event_id, _)) in enumerate(
+                    zip(batch.create, created)
+                ):
+                    item_tag_ids = [
+                        tag_id
+                        for tag_id in dict.fromkeys(item.tag_ids)
+                        if tag_id in valid_tag_ids
+                    ]
+                    item_vehicle_ids = [
+                        vehicle_id
+                        for vehicle_id in dict.fromkeys(item.vehicle_ids)
+                        if vehicle_id in valid_vehicle_ids
+                    ]
+                    tag_rows += [
+                        {"event_id": event_id, "tag_id": tag_id}
+                        for tag_id in item_tag_ids
+                    ]
+                    vehicle_rows += [
+                        {"event_id": event_id, "vehicle_id": vehicle_id}
+                        for vehicle_id in item_vehicle_ids
+                    ]
+                    changes.append(
+                        EventChange(
+                            CREATED,
+                            event_id,
+                            point_coordinates(item.location),
+                            item_tag_ids,
+                            item_vehicle_ids,
+                        )
+                    )
+                    results.append(
+                        BatchItemResult(
+                            operation="create", index=index, id=event_id, status=201
+                        )
+                    )
+
+            # Updates: Bulk-UPDATE per Primärschlüssel, Zuordnungen ersetzen
+            if updates:
+                update_rows = []
+                touched_ids = []
+                replace_tags = []
+                replace_vehicles = []
+                for _, item in updates:
+                    change = EventChange(
+                        UPDATED,
+                        item.id,
+                        point_coordinates(item.location),
+                        moved=item.location is not None,
+                    )
+                    changes.append(change)
+                    values = {"id": item.id}
+                    if item.name is not None:
+                        values["name"] = item.name
+                    if item.description is not None:
+                        values["description"] = item.description
+                    if item.location is not None:
+                        values["location"] = self._location_ewkt(item.location)
+                    if len(values) > 1:
+                        update_rows.append(values)
+                    else:
+                        touched_ids.append(item.id)
+
+                    if item.tag_ids is not None:
+                        replace_tags.append(item.id)
+                        change.tag_ids = [
+                            tag_id
+                            for tag_id in dict.fromkeys(item.tag_ids)
+                            if tag_id in valid_tag_ids
+                        ]
+                        tag_rows += [
+                            {"event_id": item.id, "tag_id": tag_id}
+                            for tag_id in change.tag_ids
+                        ]
+                    if item.vehicle_ids is not None:
+                        replace_vehicles.append(item.id)
+                        change.vehicle_ids = [
+                            vehicle_id
+                            for vehicle_id in dict.fromkeys(item.vehicle_ids)
+                            if vehicle_id in valid_vehicle_ids
+                        ]
+                        vehicle_rows += [
+                            {"event_id": item.id, "vehicle_id": vehicle_id}
+                            for vehicle_id in change.vehicle_ids
+                        ]
+
+                days += [created_at[item.id] for _, item in updates]
+                if update_rows:
+                    self.db.execute(update(Event), update_rows)
+                if touched_ids:
+                    self.db.execute(
+                        update(Event)
+                        .where(Event.id.in_(touched_ids))
+                        .values(updated_at=func.now())
+                        .execution_options(synchronize_session=False)
+                    )
+                if replace_tags:
+                    self.db.execute(
+                        delete(event_tags).where(
+                            event_tags.c.event_id.in_(replace_tags)
+                        )
+                    )
+                if replace_vehicles:
+                    self.db.execute(
+                        delete(event_vehicles).where(
+                            event_vehicles.c.event_id.in_(replace_vehicles)
+                        )
+                    )
+                results += [
+                    BatchItemResult(
+                        operation="update", index=index, id=item.id, status=200
+                    )
+                    for index, item in updates
+                ]
+
+            # Zuordnungen für Creates und Updates gesammelt einfügen
+            if tag_rows:
+                self.db.execute(insert(event_tags), tag_rows)
+            if vehicle_rows:
+                self.db.execute(insert(event_vehicles), vehicle_rows)
+
+            # Deletes: ein DELETE für alle Events
+            if deletes:
+                deleted = self.db.execute(
+                    delete(Event)
+                    .where(Event.id.in_([event_id for _, event_id in deletes]))
+                    .returning(Event.id, Event.location)
+                    .execution_options(synchronize_session=False)
+                ).all()
+                days += [created_at[row.id] for row in deleted]
+                changes += [
+                    EventChange(DELETED, row.id, point_coordinates(row.location))
+                    for row in deleted
+                ]
+                results += [
+                    BatchItemResult(
+                        operation="delete", index=index, id=event_id, status=204
+                    )
+                    for index, event_id in deletes
+                ]
+
+            self._record_changes(changes)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        self._after_commit(changes, days)
+        results.sort(key=lambda r: (BATCH_OPERATION_ORDER.index(r.operation), r.index))
+        return results
+
+    def _existing_ids(self, model, ids: set) -> set:
+        """Filtert die übergebenen IDs auf existierende Einträge"""
+        if not ids:
+            return set()
+        return reference_cache.table_for(model).existing_ids(self.db, ids)
+
+    @staticmethod
+    def _location_ewkt(location: Optional[List[float]]) -> Optional[str]:
+        """Wandelt [longitude, latitude] in einen EWKT-Punkt um"""
+        if location and len(location) >= 2:
+            return f"SRID=4326;POINT({location[0]} {location[1]})"
+        return None
+
     # def get_location_coordinates(self, event: Event) -> Optional[List[float]]:
     #    """Extract coordinates from a geometry point"""
     #    if event.location is None:
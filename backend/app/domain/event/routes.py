@@ -1,21 +1,60 @@
 import loguru
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Path,
+    Query,
+    Request,
+    Response,
+)
+import redis
+from fastapi.responses import StreamingResponse
 from typing import List, Optional, Annotated
 from sqlalchemy.orm import Session
 from datetime import datetime
 from geoalchemy2.elements import WKBElement, WKTElement
 
 from infrastructure.postgresql.db import get_db
-from domain.user.dependency import is_admin
+from domain.user.dependency import CurrentUser, is_admin
 from domain.user.model import User
 from domain.event.repository import EventRepository
-from dependencies.repository_dependencies import (
-    get_event_repository,
-    get_user_repository,
+from dependencies.repository_dependencies import get_event_repository
+from domain.event.dto import (
+    EventCreate,
+    EventUpdate,
+    EventResponse,
+    EventFilter,
+    PaginatedEventResponse,
+    EventBatchRequest,
+    EventBatchResponse,
+    EventChangesResponse,
+    EventTimelineResponse,
+    EventFacetsResponse,
+    EventTimelapseResponse,
+    TimelineBucketSize,
+)
+from domain.sync.dependency import SyncCursorParam, fetch_changes
+from domain.event.stream import EventStreamFilter, EventStreamHub, get_event_stream
+from domain.event import heatmap, timelapse
+from domain.event.heatmap import HeatmapTileCache, get_heatmap_tiles
+
+from domain.tag.model import Tag
+from domain.vehicletype.model import VehicleType
+from infrastructure.redis.query_cache import QueryCache, get_query_cache
+from infrastructure.redis.table_versions import TableVersions, get_table_versions
+from config.config_provider import get_config
+from misc.http_cache import (
+    RESOURCE_CACHE_CONTROL,
+    etag_matches,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+    timestamp_part,
 )
-from domain.event.dto import EventCreate, EventUpdate, EventResponse, EventFilter, PaginatedEventResponse
 
-from domain.user.repository import UserRepository
+config = get_config()
 
 # Create router
 event_router = APIRouter(prefix="/event")
@@ -26,15 +65,24 @@ event_router = APIRouter(prefix="/event")
 )
 def create_event(
     event_data: EventCreate,
-    request: Request,
+    current_user: CurrentUser,
     event_repository: EventRepository = Depends(get_event_repository),
-    user_repository: UserRepository = Depends(get_user_repository),
 ):
-    current_user = user_repository.get_user_by_id(request.state.user_id)
     event = event_repository.create(event_data, current_user)
     return event
 
 
+@event_router.post("/batch", response_model=EventBatchResponse)
+def batch_events(
+    batch: EventBatchRequest,
+    current_user: CurrentUser,
+    event_repository: EventRepository = Depends(get_event_repository),
+):
+    """Create, update and delete multiple events in one transaction"""
+    results = event_repository.batch(batch, current_user, is_admin(current_user))
+    return EventBatchResponse(results=results)
+
+
 @event_router.get("", response_model=PaginatedEventResponse)
 async def get_all_events(
     filters: Annotated[EventFilter, Query()],
@@ -57,18 +105,192 @@ async def get_all_events(
     )
 
 
+@event_router.get("/timeline", response_model=EventTimelineResponse)
+async def get_event_timeline(
+    filters: Annotated[EventFilter, Query()],
+    bucket: TimelineBucketSize = "day",
+    event_repository: EventRepository = Depends(get_event_repository),
+    cache: QueryCache = Depends(get_query_cache),
+):
+    """Number of filtered events per hour, day or week (for a time slider)"""
+    key = cache.key("timeline", "event", f"{bucket}:{filters.cache_key()}")
+    timeline = cache.get("timeline", key)
+    if timeline is None:
+        rows = await event_repository.get_timeline(filters, bucket)
+        timeline = EventTimelineResponse(
+            bucket=bucket,
+            total=sum(count for _, count in rows),
+            buckets=[{"start": start, "count": count} for start, count in rows],
+        ).model_dump(mode="json")
+        cache.set(key, timeline, config.timeline_cache_ttl_seconds)
+    return timeline
+
+
+@event_router.get("/facets", response_model=EventFacetsResponse)
+async def get_event_facets(
+    filters: Annotated[EventFilter, Query()],
+    event_repository: EventRepository = Depends(get_event_repository),
+    cache: QueryCache = Depends(get_query_cache),
+):
+    """Matching events per tag and vehicle type for the current filter"""
+    key = cache.key("facets", "event", filters.cache_key())
+    facets = cache.get("facets", key)
+    if facets is None:
+        counts = await event_repository.get_facets(filters)
+        facets = EventFacetsResponse(
+            total=counts["total"],
+            tags=[{"id": i, "count": n} for i, n in sorted(counts["tags"].items())],
+            vehicles=[
+                {"id": i, "count": n} for i, n in sorted(counts["vehicles"].items())
+            ],
+        ).model_dump(mode="json")
+        cache.set(key, facets, config.facets_cache_ttl_seconds)
+    return facets
+
+
+@event_router.get("/timelapse", response_model=EventTimelapseResponse)
+async def get_event_timelapse(
+    filters: Annotated[EventFilter, Query()],
+    event_repository: EventRepository = Depends(get_event_repository),
+    cache: QueryCache = Depends(get_query_cache),
+):
+    """
+    All filtered events with a location in time order, compactly encoded, so a
+    playback of any period loads in one request
+    """
+    key = cache.key("timelapse", "event", filters.cache_key())
+    frames = cache.get("timelapse", key)
+    if frames is None:
+        limit = config.timelapse_max_events
+        rows = await event_repository.get_timelapse(filters, limit + 1)
+        frames = EventTimelapseResponse(
+            **timelapse.encode(rows[:limit]), truncated=len(rows) > limit
+        ).model_dump(mode="json")
+        cache.set(key, frames, config.timelapse_cache_ttl_seconds)
+    return frames
+
+
+@event_router.get("/changes", response_model=EventChangesResponse)
+def get_event_changes(
+    cursor: SyncCursorParam,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 200,
+    event_repository: EventRepository = Depends(get_event_repository),
+):
+    """Events changed or deleted since the cursor (delta sync)"""
+    changes = fetch_changes(event_repository.get_changes, cursor, limit)
+    return EventChangesResponse(
+        events=changes.changed,
+        deleted_ids=changes.deleted_ids,
+        next_cursor=changes.cursor.encode(),
+        has_more=changes.has_more,
+    )
+
+
+@event_router.get("/stream", response_class=StreamingResponse)
+async def stream_events(
+    bbox: Annotated[
+        Optional[str],
+        Query(description="min_lon,min_lat,max_lon,max_lat", examples=["6,47,15,55"]),
+    ] = None,
+    tag_ids: Annotated[Optional[List[int]], Query()] = None,
+    vehicle_ids: Annotated[Optional[List[int]], Query()] = None,
+    hub: EventStreamHub = Depends(get_event_stream),
+):
+    """Live changes of events as Server-Sent Events (created/updated/deleted)"""
+    stream_filter = EventStreamFilter(
+        bbox=_parse_bbox(bbox),
+        tag_ids=frozenset(tag_ids or ()),
+        vehicle_ids=frozenset(vehicle_ids or ()),
+    )
+    try:
+        # Vor dem Senden der Header, damit ein Redis-Ausfall als 503 ankommt
+        hub.start_listener()
+    except redis.RedisError as e:
+        loguru.logger.error(f"Event-Stream nicht verfügbar: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Live updates are currently unavailable",
+        )
+    return StreamingResponse(
+        hub.events(stream_filter),
+        media_type="text/event-stream",
+        # Kein Buffering durch Reverse-Proxies (nginx)
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@event_router.get(
+    "/heatmap/{z}/{x}/{y}.png",
+    response_class=Response,
+    responses={200: {"content": {"image/png": {}}}},
+)
+async def get_heatmap_tile(
+    z: Annotated[int, Path(ge=0, le=config.heatmap_max_zoom)],
+    x: Annotated[int, Path(ge=0)],
+    y: Annotated[int, Path(ge=0)],
+    filters: Annotated[EventFilter, Query()],
+    request: Request,
+    event_repository: EventRepository = Depends(get_event_repository),
+    tiles: HeatmapTileCache = Depends(get_heatmap_tiles),
+):
+    """Density of the filtered events as a PNG map tile (Web Mercator)"""
+    if x >= 2**z or y >= 2**z:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tile {z}/{x}/{y} does not exist",
+        )
+    tile = f"{z}/{x}/{y}:{filters.cache_key()}"
+    # Ohne Redis (version None) wird jede Anfrage neu gerendert
+    version = tiles.version()
+    headers = {"Cache-Control": RESOURCE_CACHE_CONTROL}
+    png = None
+    if version is not None:
+        etag = make_etag("heatmap", version, tile)
+        if etag_matches(request, etag):
+            return not_modified(etag, RESOURCE_CACHE_CONTROL)
+        headers["ETag"] = etag
+        png = tiles.get(version, tile)
+
+    if png is None:
+        bounds = heatmap.tile_bounds(z, x, y, heatmap.kernel_radius())
+        points = await event_repository.get_heatmap_points(
+            filters, heatmap.lonlat_bounds(bounds)
+        )
+        png = heatmap.render_tile(points, z, x, y)
+        if version is not None:
+            tiles.put(version, tile, png)
+    return Response(content=png, media_type="image/png", headers=headers)
+
+
 @event_router.get("/{event_id}", response_model=EventResponse)
 def get_event(
     event_id: int,
+    request: Request,
+    response: Response,
     event_repository: EventRepository = Depends(get_event_repository),
+    versions: TableVersions = Depends(get_table_versions),
 ):
-    """Get an event by ID"""
+    """Get an event by ID (conditional GET via ETag)"""
+    # Umbenannte Tags/Fahrzeuge ändern die Antwort, aber nicht updated_at
+    reference = versions.get(Tag.__tablename__, VehicleType.__tablename__)
+    if request.headers.get("if-none-match"):
+        updated_at = event_repository.get_updated_at(event_id)
+        if updated_at is not None:
+            etag = _event_etag(event_id, updated_at, reference)
+            if etag_matches(request, etag):
+                return not_modified(etag, RESOURCE_CACHE_CONTROL)
+
     event = event_repository.get_by_id(event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Event with ID {event_id} not found",
         )
+    set_cache_headers(
+        response,
+        _event_etag(event.id, event.updated_at, reference),
+        RESOURCE_CACHE_CONTROL,
+    )
 
     # Convert the location from WKBElement to a list of coordinates
     # if event.location is not None and isinstance(event.location, (WKBElement, WKTElement)):
@@ -81,51 +303,77 @@ def get_event(
 def update_event(
     event_id: int,
     event_data: EventUpdate,
-    request: Request,
+    current_user: CurrentUser,
     event_repository: EventRepository = Depends(get_event_repository),
-    user_repository: UserRepository = Depends(get_user_repository),
 ):
-    current_user = user_repository.get_user_by_id(request.state.user_id)
-
-    event = event_repository.get_by_id(event_id)
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Event with ID {event_id} not found",
+    # Berechtigung wird direkt im UPDATE geprüft (Admins dürfen alle Events ändern)
+    owner_id = None if is_admin(current_user) else current_user.id
+    updated_event = event_repository.update(event_id, event_data, owner_id)
+    if not updated_event:
+        _raise_not_found_or_forbidden(
+            event_repository,
+            event_id,
+            "Sie haben keine Berechtigung, dieses Event zu bearbeiten",
         )
 
-    if event.created_by != current_user.id and not is_admin(current_user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Sie haben keine Berechtigung, dieses Event zu bearbeiten",
-        )
-
-    updated_event = event_repository.update(event_id, event_data)
-
     return updated_event
 
 
 @event_router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_event(
     event_id: int,
-    request: Request,
+    current_user: CurrentUser,
     event_repository: EventRepository = Depends(get_event_repository),
-    user_repository: UserRepository = Depends(get_user_repository),
 ):
-    current_user = user_repository.get_user_by_id(request.state.user_id)
+    # Berechtigung wird direkt im DELETE geprüft (Admins dürfen alle Events löschen)
+    owner_id = None if is_admin(current_user) else current_user.id
+    if not event_repository.delete(event_id, owner_id):
+        _raise_not_found_or_forbidden(
+            event_repository,
+            event_id,
+            "Sie haben keine Berechtigung, dieses Event zu löschen",
+        )
+    return None
 
-    event = event_repository.get_by_id(event_id)
-    if not event:
+
+def _parse_bbox(bbox: Optional[str]):
+    if not bbox:
+        return None
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(v) for v in bbox.split(","))
+    except ValueError:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Event with ID {event_id} not found",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="bbox must be min_lon,min_lat,max_lon,max_lat",
         )
-
-    if event.created_by != current_user.id and not is_admin(current_user):
+    if min_lon > max_lon or min_lat > max_lat:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Sie haben keine Berechtigung, dieses Event zu löschen",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="bbox minimum must not exceed maximum",
         )
+    return (min_lon, min_lat, max_lon, max_lat)
 
-    event_repository.delete(event_id)
-    return None
+
+def _event_etag(event_id: int, updated_at: datetime, reference: dict) -> str:
+    return make_etag(
+        "event",
+        event_id,
+        timestamp_part(updated_at),
+        reference[Tag.__tablename__],
+        reference[VehicleType.__tablename__],
+    )
+
+
+def _raise_not_found_or_forbidden(
+    event_repository: EventRepository, event_id: int, forbidden_detail: str
+):
+    """Unterscheidet nur im Fehlerfall zwischen fehlendem und fremdem Event"""
+    if not event_repository.exists(event_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=forbidden_detail,
+    )
@@ -0,0 +1,206 @@
+"""
+Live-Stream der Event-Änderungen (Server-Sent Events)
+
+Pro Worker-Prozess abonniert ein einzelner Pub/Sub-Listener den Kanal
+events:changes und verteilt die Änderungen an die offenen Verbindungen. Jede
+Verbindung hat eine begrenzte Queue: Läuft sie voll (langsamer Client), wird
+sie geleert und der Client erhält ein "resync"-Event, statt dass der Worker
+unbegrenzt Speicher ansammelt.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+import loguru
+import redis
+
+from config.config_provider import get_config
+from domain.event.changes import CHANGES_CHANNEL, UPDATED, EventChange
+from infrastructure.metrics.prometheus import (
+    EVENT_STREAM_CONNECTIONS,
+    EVENT_STREAM_RESYNCS,
+)
+from infrastructure.redis.redis_client import client
+
+config = get_config()
+
+RESYNC = "resync"
+# Wartezeit bis zum Reconnect, die der Browser (EventSource) verwendet
+RETRY_MS = 5000
+
+
+@dataclass(frozen=True)
+class EventStreamFilter:
+    """
+    Filter einer Stream-Verbindung
+
+    Unbekannte Werte einer Änderung (None) lassen sie durch. Updates, die ein
+    Event aus dem Filter herausbewegen könnten (neuer Standort, geänderte Tags
+    oder Fahrzeuge), werden ebenfalls zugestellt, damit der Client es
+    entfernen kann.
+    """
+
+    bbox: Optional[Tuple[float, float, float, float]] = None
+    tag_ids: frozenset = frozenset()
+    vehicle_ids: frozenset = frozenset()
+
+    def matches(self, change: EventChange) -> bool:
+        if not self._in_bbox(change.location) and not change.moved:
+            return False
+        if change.op == UPDATED:
+            # Geänderte Tags/Fahrzeuge: Event kann den Filter verlassen haben
+            return True
+        return self._any(self.tag_ids, change.tag_ids) and self._any(
+            self.vehicle_ids, change.vehicle_ids
+        )
+
+    def _in_bbox(self, location: Optional[Tuple[float, float]]) -> bool:
+        if self.bbox is None or location is None:
+            return True
+        min_lon, min_lat, max_lon, max_lat = self.bbox
+        lon, lat = location
+        return min_lon <= lon <= max_lon and min_lat <= lat <= max_lat
+
+    @staticmethod
+    def _any(wanted: frozenset, ids: Optional[List[int]]) -> bool:
+        return not wanted or ids is None or not wanted.isdisjoint(ids)
+
+
+@dataclass(eq=False)
+class EventStreamSubscriber:
+    filter: EventStreamFilter
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(init=False)
+
+    def __post_init__(self):
+        self.queue = asyncio.Queue(maxsize=config.event_stream_queue_size)
+
+    def offer(self, changes: List[EventChange]) -> None:
+        """Läuft im Event-Loop der Verbindung"""
+        for change in changes:
+            try:
+                self.queue.put_nowait(change)
+            except asyncio.QueueFull:
+                # Client kommt nicht hinterher: Rückstand verwerfen
+                self.resync()
+                return
+
+    def resync(self) -> None:
+        """Ersetzt alle wartenden Änderungen durch ein resync-Event"""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(RESYNC)
+        EVENT_STREAM_RESYNCS.inc()
+
+
+def format_sse(change) -> str:
+    if change == RESYNC:
+        return f"event: {RESYNC}\ndata: {{}}\n\n"
+    return (
+        f"id: {change.id}\nevent: {change.op}\n"
+        f"data: {json.dumps(change.to_message())}\n\n"
+    )
+
+
+class EventStreamHub:
+    def __init__(self, redis_client: redis.Redis = client):
+        self.redis = redis_client
+        self._subscribers: Set[EventStreamSubscriber] = set()
+        self._lock = threading.Lock()
+        self._pubsub = None
+        self._thread = None
+
+    def subscribe(self, stream_filter: EventStreamFilter) -> EventStreamSubscriber:
+        subscriber = EventStreamSubscriber(stream_filter, asyncio.get_running_loop())
+        self.start_listener()
+        with self._lock:
+            self._subscribers.add(subscriber)
+        EVENT_STREAM_CONNECTIONS.inc()
+        return subscriber
+
+    def unsubscribe(self, subscriber: EventStreamSubscriber) -> None:
+        with self._lock:
+            if subscriber not in self._subscribers:
+                return
+            self._subscribers.discard(subscriber)
+        EVENT_STREAM_CONNECTIONS.dec()
+
+    async def events(self, stream_filter: EventStreamFilter) -> AsyncIterator[str]:
+        """SSE-Nachrichten einer Verbindung, mit Keep-Alive bei Leerlauf"""
+        subscriber = self.subscribe(stream_filter)
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            while True:
+                try:
+                    change = await asyncio.wait_for(
+                        subscriber.queue.get(), config.event_stream_heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse(change)
+        finally:
+            self.unsubscribe(subscriber)
+
+    def dispatch(self, changes: List[EventChange]) -> None:
+        """Verteilt Änderungen an alle Verbindungen dieses Prozesses"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            matching = [c for c in changes if subscriber.filter.matches(c)]
+            if matching:
+                subscriber.loop.call_soon_threadsafe(subscriber.offer, matching)
+
+    def _on_message(self, message) -> None:
+        try:
+            changes = [EventChange.from_message(m) for m in json.loads(message["data"])]
+        except (ValueError, KeyError, TypeError) as e:
+            loguru.logger.warning(f"Ungültige Event-Änderung verworfen: {e}")
+            return
+        self.dispatch(changes)
+
+    def _on_error(self, e, pubsub, thread) -> None:
+        # Verpasste Änderungen sind nicht nachholbar: Clients neu laden lassen
+        loguru.logger.warning(f"Event-Stream unterbrochen: {e}")
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.loop.call_soon_threadsafe(subscriber.resync)
+        time.sleep(1)
+
+    def start_listener(self) -> None:
+        """
+        Startet den Listener beim ersten Abonnenten
+
+        Raises:
+            redis.RedisError: Redis ist nicht erreichbar
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{CHANGES_CHANNEL: self._on_message})
+            self._pubsub = pubsub
+            self._thread = pubsub.run_in_thread(
+                sleep_time=1.0, daemon=True, exception_handler=self._on_error
+            )
+
+    def stop_listener(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                self._thread.stop()
+                self._thread.join(timeout=2)
+                self._pubsub.close()
+                self._thread = None
+                self._pubsub = None
+
+
+event_stream = EventStreamHub()
+
+
+def get_event_stream() -> EventStreamHub:
+    return event_stream
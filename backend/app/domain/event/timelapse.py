@@ -0,0 +1,42 @@
+"""
+Kompakte Zeitraffer-Daten der Events (/event/timelapse)
+
+Eine sortierte Abfrage liefert (Zeit, lon, lat, id) aller gefilterten Events
+mit Standort; NumPy kodiert die Spalten:
+
+- times: Sekunden seit dem vorherigen Event (erstes Event: seit start);
+  sortiert, daher kleine, nicht negative Zahlen
+- lon, lat: ganzzahlig in Einheiten von 10^-timelapse_coordinate_decimals Grad
+- ids: unverändert
+
+Dekodieren: Zeit = start + cumsum(times), Koordinate = Wert / scale.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict
+
+import numpy as np
+
+from config.config_provider import get_config
+
+config = get_config()
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def encode(rows: np.ndarray) -> Dict:
+    """
+    Spalten der Antwort aus einem (n x 4)-Array (Epoch-Sekunden, lon, lat, id),
+    sortiert nach Zeit
+    """
+    scale = 10**config.timelapse_coordinate_decimals
+    seconds = np.floor(rows[:, 0]).astype(np.int64)
+    start = int(seconds[0]) if len(seconds) else 0
+    return {
+        "start": EPOCH + timedelta(seconds=start),
+        "scale": scale,
+        "times": np.diff(seconds, prepend=start).tolist(),
+        "lon": np.round(rows[:, 1] * scale).astype(np.int64).tolist(),
+        "lat": np.round(rows[:, 2] * scale).astype(np.int64).tolist(),
+        "ids": rows[:, 3].astype(np.int64).tolist(),
+    }
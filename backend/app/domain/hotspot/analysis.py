@@ -0,0 +1,218 @@
+"""
+Hotspot-Analyse auf einem Raster (NumPy)
+
+Die Punkte (lon, lat, Alter) werden in ein lokales metrisches Raster
+projiziert (equirektangulär um den mittleren Breitengrad, für regionale
+Ausschnitte ausreichend genau) und mit exponentiell abklingendem Gewicht
+nach Alter gezählt. Auf diesem Raster werden berechnet:
+
+- Kerndichte: Gaußfilter mit hotspot_bandwidth_meters (Anzeige, Rangfolge)
+- Getis-Ord Gi*: z-Wert der gewichteten Summe in der Nachbarschaft
+  (Radius hotspot_neighbourhood_meters, binäre Gewichte) gegenüber dem
+  Mittel des ganzen Rasters
+
+Zellen mit Gi* >= hotspot_min_z und mindestens hotspot_min_events Events in
+der Nachbarschaft sind Kandidaten. Da jede Zelle einzeln getestet wird,
+filtert eine Korrektur nach Benjamini-Hochberg (Anteil falscher Funde
+hotspot_false_discovery_rate) die Kandidaten, die bei vielen Zellen zufällig
+über der Schwelle liegen. Zusammenhängende Hotspot-Zellen werden zu einem
+Polygon vereinigt. Alle Schritte sind Array-Operationen über das Raster.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+import shapely
+from numpy.lib.stride_tricks import sliding_window_view
+from shapely.geometry import Polygon, box
+from shapely.ops import unary_union
+
+from config.config_provider import get_config
+
+config = get_config()
+
+METERS_PER_DEGREE = 111_320.0
+
+
+@dataclass
+class HotspotArea:
+    polygon: Polygon
+    score: float
+    density: float
+    events: int
+
+
+@dataclass
+class Grid:
+    """Raster in lokalen Metern; Zelle (row, col) beginnt bei origin + i * cell"""
+
+    origin: Tuple[float, float]
+    cell: float
+    shape: Tuple[int, int]
+    lat0: float
+
+    def to_lonlat(self, xy: np.ndarray) -> np.ndarray:
+        scale = METERS_PER_DEGREE * math.cos(math.radians(self.lat0))
+        return np.column_stack([xy[:, 0] / scale, xy[:, 1] / METERS_PER_DEGREE])
+
+
+def project(lon: np.ndarray, lat: np.ndarray, lat0: float) -> np.ndarray:
+    scale = METERS_PER_DEGREE * math.cos(math.radians(lat0))
+    return np.column_stack([lon * scale, lat * METERS_PER_DEGREE])
+
+
+def build_grid(xy: np.ndarray, lat0: float) -> Grid:
+    """
+    Raster über die Ausdehnung der Punkte (Untersuchungsgebiet)
+
+    Kein zusätzlicher Rand: leere Zellen außerhalb würden das Mittel für Gi*
+    senken und jede besiedelte Fläche als Hotspot erscheinen lassen.
+
+    Überschreitet das Raster hotspot_max_cells Zellen, wird die Zelle
+    entsprechend vergrößert.
+    """
+    low = xy.min(axis=0)
+    extent = xy.max(axis=0) - low
+    cell = float(config.hotspot_cell_meters)
+    cells = math.ceil(extent[0] / cell) * math.ceil(extent[1] / cell)
+    if cells > config.hotspot_max_cells:
+        cell *= math.sqrt(cells / config.hotspot_max_cells)
+    shape = tuple(max(1, math.ceil(length / cell)) for length in extent)
+    origin = (float(low[0]), float(low[1]))
+    return Grid(origin=origin, cell=cell, shape=shape, lat0=lat0)
+
+
+def decay_weights(age_seconds: np.ndarray) -> np.ndarray:
+    """Gewicht 1 für neue Events, halbiert pro hotspot_half_life_hours"""
+    return 0.5 ** (age_seconds / (config.hotspot_half_life_hours * 3600))
+
+
+def gaussian_smooth(values: np.ndarray, sigma_cells: float) -> np.ndarray:
+    """Separierbarer Gaußfilter (Summe 1), Rand mit Nullen aufgefüllt"""
+    radius = max(1, math.ceil(3 * sigma_cells))
+    offsets = np.arange(-radius, radius + 1, dtype=np.float64)
+    kernel = np.exp(-(offsets**2) / (2 * sigma_cells**2))
+    kernel /= kernel.sum()
+    padded = np.pad(values, radius)
+    rows = sliding_window_view(padded, kernel.size, axis=0) @ kernel
+    return sliding_window_view(rows, kernel.size, axis=1) @ kernel
+
+
+def window_sum(values: np.ndarray, radius: int) -> np.ndarray:
+    """Summe über das Quadrat (2 * radius + 1)² um jede Zelle (Summed-Area-Table)"""
+    size = 2 * radius + 1
+    padded = np.pad(values, ((radius + 1, radius), (radius + 1, radius)))
+    table = padded.cumsum(axis=0).cumsum(axis=1)
+    rows, cols = values.shape
+    return (
+        table[size : size + rows, size : size + cols]
+        - table[:rows, size : size + cols]
+        - table[size : size + rows, :cols]
+        + table[:rows, :cols]
+    )
+
+
+def getis_ord(values: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Gi* pro Zelle mit binären Gewichten im Quadrat um die Zelle (inkl. Zelle)
+
+    Gi* = (Σ w x - x̄ Σ w) / (S * sqrt((n Σ w² - (Σ w)²) / (n - 1)))
+    """
+    n = values.size
+    mean = values.mean()
+    std = math.sqrt(max((values**2).mean() - mean**2, 0.0))
+    if n < 2 or std == 0:
+        return np.zeros_like(values)
+    local = window_sum(values, radius)
+    # Am Rand liegen weniger Nachbarn im Raster
+    weights = window_sum(np.ones_like(values), radius)
+    spread = np.sqrt((n * weights - weights**2) / (n - 1))
+    return (local - mean * weights) / (std * spread)
+
+
+def significant(scores: np.ndarray, tests: int) -> np.ndarray:
+    """
+    Benjamini-Hochberg: Maske der z-Werte, die bei tests Einzeltests signifikant
+    bleiben (einseitig, nur Hotspots)
+    """
+    if scores.size == 0:
+        return np.zeros(0, dtype=bool)
+    p_values = 0.5 * _erfc(scores / math.sqrt(2))
+    order = np.argsort(p_values)
+    limits = config.hotspot_false_discovery_rate * np.arange(1, scores.size + 1) / tests
+    passed = np.nonzero(p_values[order] <= limits)[0]
+    mask = np.zeros(scores.size, dtype=bool)
+    if len(passed):
+        mask[order[: passed[-1] + 1]] = True
+    return mask
+
+
+_erfc = np.vectorize(math.erfc, otypes=[np.float64])
+
+
+def find_hotspots(
+    lon: np.ndarray, lat: np.ndarray, age_seconds: np.ndarray
+) -> List[HotspotArea]:
+    """Hotspot-Polygone (lon/lat) für die Punkte, stärkster zuerst"""
+    if len(lon) < config.hotspot_min_events:
+        return []
+    lat0 = float(lat.mean())
+    xy = project(lon, lat, lat0)
+    grid = build_grid(xy, lat0)
+    cell = grid.cell
+
+    # Zeilen = x, Spalten = y
+    ranges = [(grid.origin[i], grid.origin[i] + grid.shape[i] * cell) for i in (0, 1)]
+    weights = decay_weights(age_seconds)
+    weighted, _, _ = np.histogram2d(
+        xy[:, 0], xy[:, 1], bins=grid.shape, range=ranges, weights=weights
+    )
+    counts, _, _ = np.histogram2d(xy[:, 0], xy[:, 1], bins=grid.shape, range=ranges)
+
+    radius = max(1, round(config.hotspot_neighbourhood_meters / cell))
+    scores = getis_ord(weighted, radius)
+    # Dichte in (gewichteten) Events pro km²
+    density = gaussian_smooth(weighted, config.hotspot_bandwidth_meters / cell)
+    density *= 1e6 / cell**2
+    nearby = window_sum(counts, radius)
+    hot = (scores >= config.hotspot_min_z) & (nearby >= config.hotspot_min_events)
+    hot[hot] = significant(scores[hot], scores.size)
+    return _polygons(grid, hot, scores, density, counts)
+
+
+def _polygons(
+    grid: Grid,
+    hot: np.ndarray,
+    scores: np.ndarray,
+    density: np.ndarray,
+    counts: np.ndarray,
+) -> List[HotspotArea]:
+    rows, cols = np.nonzero(hot)
+    if len(rows) == 0:
+        return []
+    x0, y0 = grid.origin
+    cell = grid.cell
+    boxes = [
+        box(x0 + r * cell, y0 + c * cell, x0 + (r + 1) * cell, y0 + (c + 1) * cell)
+        for r, c in zip(rows, cols)
+    ]
+    merged = unary_union(boxes)
+    parts = list(getattr(merged, "geoms", [merged]))
+    center_x = x0 + (rows + 0.5) * cell
+    center_y = y0 + (cols + 0.5) * cell
+
+    hotspots = []
+    for part in parts:
+        inside = shapely.contains_xy(part, center_x, center_y)
+        r, c = rows[inside], cols[inside]
+        hotspots.append(
+            HotspotArea(
+                polygon=shapely.transform(part, grid.to_lonlat),
+                score=float(scores[r, c].max()),
+                density=float(density[r, c].max()),
+                events=int(counts[r, c].sum()),
+            )
+        )
+    return sorted(hotspots, key=lambda h: h.score, reverse=True)
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import List, Literal
+
+from geoalchemy2.shape import to_shape
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+HotspotSource = Literal["event", "issue"]
+
+
+class HotspotResponse(BaseModel):
+    id: int
+    area: List[List[float]] = Field(description="Äußerer Ring als [[lon, lat], ...]")
+    score: float = Field(description="Höchster Getis-Ord-Gi*-z-Wert im Hotspot")
+    density: float = Field(description="Höchste Kerndichte (gewichtete Events/km²)")
+    events: int = Field(description="Anzahl der Einträge im Zeitfenster")
+    computed_at: datetime
+
+    @field_validator("area", mode="before")
+    def area_to_coordinates(cls, value):
+        polygon = to_shape(value)
+        return [[float(x), float(y)] for x, y in polygon.exterior.coords]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from geoalchemy2 import Geometry
+from infrastructure.postgresql.db import Base
+from sqlalchemy import DateTime, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class Hotspot(Base):
+    """
+    Ergebnis des letzten Laufs von workers/hotspot_worker.py pro Quelle
+
+    Jeder Lauf ersetzt alle Zeilen einer Quelle ("event" oder "issue").
+    """
+
+    __tablename__ = "hotspot"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+    area: Mapped[Geometry] = mapped_column(
+        Geometry(geometry_type="POLYGON", srid=4326), nullable=False
+    )
+    # Höchster Getis-Ord-Gi*-z-Wert einer Zelle des Hotspots
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    # Höchste Kerndichte (zeitgewichtete Events pro km²)
+    density: Mapped[float] = mapped_column(Float, nullable=False)
+    events: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
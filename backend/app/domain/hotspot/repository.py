@@ -0,0 +1,80 @@
+"""
+Hotspots der Events und Issues (Tabelle hotspot)
+
+workers/hotspot_worker.py lädt die Koordinaten der letzten
+hotspot_window_hours Stunden als NumPy-Arrays, berechnet die Hotspots
+(domain/hotspot/analysis.py) und ersetzt das Ergebnis der Quelle. Die API
+liest nur noch die gespeicherten Polygone.
+"""
+
+from datetime import timedelta
+from typing import List, Tuple
+
+import numpy as np
+from geoalchemy2.shape import from_shape
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from config.config_provider import get_config
+from domain.event.model import Event
+from domain.hotspot.analysis import HotspotArea
+from domain.hotspot.model import Hotspot
+from domain.issue.model import Issue
+
+config = get_config()
+
+SOURCES = {"event": Event, "issue": Issue}
+
+
+class HotspotRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def recent_points(self, source: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (lon, lat, Alter in Sekunden) der Einträge mit Standort im Zeitfenster
+
+        Nur die Koordinaten, keine ORM-Objekte; das Alter rechnet die
+        Datenbank mit derselben Uhr wie created_at.
+        """
+        model = SOURCES[source]
+        now = func.localtimestamp()
+        query = select(
+            func.ST_X(model.location),
+            func.ST_Y(model.location),
+            func.extract("epoch", now - model.created_at),
+        ).where(
+            model.location.is_not(None),
+            model.created_at >= now - timedelta(hours=config.hotspot_window_hours),
+        )
+        rows = np.array(self.db.execute(query).all(), dtype=np.float64).reshape(-1, 3)
+        return rows[:, 0], rows[:, 1], rows[:, 2]
+
+    def replace(self, source: str, hotspots: List[HotspotArea]) -> None:
+        """Ersetzt die Hotspots der Quelle in einer Transaktion"""
+        self.db.execute(delete(Hotspot).where(Hotspot.source == source))
+        if hotspots:
+            computed_at = self.db.execute(select(func.localtimestamp())).scalar_one()
+            self.db.execute(
+                insert(Hotspot),
+                [
+                    {
+                        "source": source,
+                        "area": from_shape(hotspot.polygon, srid=4326),
+                        "score": hotspot.score,
+                        "density": hotspot.density,
+                        "events": hotspot.events,
+                        "computed_at": computed_at,
+                    }
+                    for hotspot in hotspots
+                ],
+            )
+        self.db.commit()
+
+    def get(self, source: str) -> List[Hotspot]:
+        query = (
+            select(Hotspot)
+            .where(Hotspot.source == source)
+            .order_by(Hotspot.score.desc(), Hotspot.id)
+        )
+        return self.db.execute(query).scalars().all()
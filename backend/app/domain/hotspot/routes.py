@@ -0,0 +1,21 @@
+from typing import List
+
+from fastapi import APIRouter, Depends
+
+from dependencies.repository_dependencies import get_hotspot_repository
+from domain.hotspot.dto import HotspotResponse, HotspotSource
+from domain.hotspot.repository import HotspotRepository
+
+hotspot_router = APIRouter(prefix="/hotspot")
+
+
+@hotspot_router.get("", response_model=List[HotspotResponse])
+def get_hotspots(
+    source: HotspotSource = "event",
+    repository: HotspotRepository = Depends(get_hotspot_repository),
+):
+    """
+    Hotspots of recent events or issues, strongest first; computed periodically
+    by the hotspot worker, not per request
+    """
+    return repository.get(source)
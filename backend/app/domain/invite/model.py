@@ -18,7 +18,7 @@ class Invite(Base):
         UUID(as_uuid=True), default=uuid.uuid4, unique=True, index=True
     )
     email: Mapped[str] = mapped_column(String, nullable=False, index=True)
-    expire_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expire_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), onupdate=func.now()
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import delete, select, func
 from sqlalchemy.orm import Session
 
 from domain.invite.model import Invite
@@ -81,3 +81,15 @@ class InviteRepository:
             self.db.commit()
             return True
         return False
+
+    def purge_expired(self, expired_before: datetime, batch_size: int) -> int:
+        """Löscht bis zu batch_size Einladungen, die vor expired_before abliefen"""
+        ids = (
+            select(Invite.id)
+            .where(Invite.expire_date < expired_before)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = self.db.execute(delete(Invite).where(Invite.id.in_(ids)))
+        self.db.commit()
+        return result.rowcount
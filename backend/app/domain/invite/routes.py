@@ -3,7 +3,6 @@ from fastapi import Request
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from starlette import status
-from fastapi_mail import MessageType
 
 from domain.invite.dto import (
     InviteCreate,
@@ -11,11 +10,13 @@ from domain.invite.dto import (
     InviteList,
 )
 from domain.invite.repository import InviteRepository
-from domain.user.repository import UserRepository
+from domain.user.dependency import CurrentUser
 from infrastructure.postgresql.db import get_db
-from fastapi_mail import FastMail, MessageSchema
+from fastapi_mail import FastMail
 from infrastructure.mail.client import get_mail_client
-from dependencies.repository_dependencies import get_user_repository, get_invite_repo
+from infrastructure.mail.queue import MailQueue, get_mail_queue
+from infrastructure.mail.templates import render_mail_template
+from dependencies.repository_dependencies import get_invite_repo
 from config.config_provider import get_config
 from misc.sign import create_signed_token
 
@@ -26,16 +27,13 @@ invite_router = APIRouter(prefix="/invite")
 @invite_router.post(
     "", response_model=InviteResponse, status_code=status.HTTP_201_CREATED
 )
-async def create_invite(
+def create_invite(
     invite_data: InviteCreate,
     request: Request,
-    user_repo: UserRepository = Depends(get_user_repository),
+    current_user: CurrentUser,
     invite_repo: InviteRepository = Depends(get_invite_repo),
-    mail_client: FastMail = Depends(get_mail_client),
+    mail_queue: MailQueue = Depends(get_mail_queue),
 ):
-    # Initialize repository
-    current_user = user_repo.get_user_by_id(request.state.user_id)
-
     # Check if there's already a valid invite for this email
     existing_invite = invite_repo.get_by_email(invite_data.email)
     if existing_invite:
@@ -55,17 +53,12 @@ async def create_invite(
     base_url = str(request.base_url).rstrip("/")
     invite_link = f"{base_url}/register?invitation={invite_token}"
 
-    with open("./mail_templates/invite.html.jinja", "r") as f:
-        content = f.read()
-        content = content.replace("{invite_link}", invite_link)
-
-        message = MessageSchema(
-            subject="Einladung zur Fire Map Plattform",
-            recipients=[invite_data.email],
-            body=content,
-            subtype=MessageType.html,
-        )
-        await mail_client.send_message(message)
+    content = render_mail_template("invite.html.jinja", invite_link=invite_link)
+    mail_queue.enqueue(
+        subject="Einladung zur Fire Map Plattform",
+        recipients=[invite_data.email],
+        body=content,
+    )
 
     return invite
 
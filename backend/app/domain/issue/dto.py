@@ -4,6 +4,10 @@ from datetime import datetime
 from geoalchemy2.shape import to_shape
 from shapely.geometry import mapping
 
+from domain.common.dto import BatchItemResult
+
+MAX_BATCH_ITEMS = 500
+
 
 class TagResponse(BaseModel):
     id: int
@@ -29,6 +33,26 @@ class IssueUpdate(BaseModel):
     location: Optional[List[float]] = None
 
 
+class IssueBatchUpdate(IssueUpdate):
+    id: int
+
+
+class IssueBatchRequest(BaseModel):
+    """Batch-Operationen für Issues, die in einer Transaktion ausgeführt werden"""
+
+    create: List[IssueCreate] = Field(default_factory=list, max_length=MAX_BATCH_ITEMS)
+    update: List[IssueBatchUpdate] = Field(
+        default_factory=list, max_length=MAX_BATCH_ITEMS
+    )
+    delete: List[int] = Field(default_factory=list, max_length=MAX_BATCH_ITEMS)
+
+
+class IssueBatchResponse(BaseModel):
+    """Ergebnisliste eines Batch-Requests (eine Zeile pro Operation)"""
+
+    results: List[BatchItemResult]
+
+
 class IssueResponse(BaseModel):
     id: int
     name: str
@@ -72,6 +96,15 @@ class IssueFilter(BaseModel):
     model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
 
+class IssueChangesResponse(BaseModel):
+    """Seite des Änderungs-Feeds (Delta-Sync)"""
+
+    issues: List[IssueResponse] = Field(description="Angelegte/geänderte Issues")
+    deleted_ids: List[int] = Field(description="IDs gelöschter Issues")
+    next_cursor: str = Field(description="Cursor für die nächste Abfrage")
+    has_more: bool = Field(description="Weitere Änderungen sofort abrufbar")
+
+
 class PaginatedIssueResponse(BaseModel):
     """Paginierte Response für Issues"""
     
@@ -2,7 +2,17 @@ from datetime import datetime
 from typing import List
 
 from infrastructure.postgresql.db import Base
-from sqlalchemy import Integer, String, DateTime, ForeignKey, Text, func, Table, Column
+from sqlalchemy import (
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    Text,
+    func,
+    Table,
+    Column,
+    Index,
+)
 from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.orm import mapped_column
 from geoalchemy2 import Geometry
@@ -25,6 +35,10 @@ issue_tags = Table(
 
 class Issue(Base):
     __tablename__ = "issue"
+    __table_args__ = (
+        # Keyset-Scan des Änderungs-Feeds: (updated_at, id) > (?, ?)
+        Index("ix_issue_updated_at_id", "updated_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, autoincrement=True, index=True
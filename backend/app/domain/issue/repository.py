@@ -1,14 +1,21 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete, and_, func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import select, update, insert, delete, and_, func
 from typing import List, Optional, Tuple
+from datetime import datetime
 from geoalchemy2.functions import ST_GeomFromText
 from geoalchemy2.shape import to_shape
 import json
 
-from domain.issue.model import Issue
-from domain.issue.dto import IssueCreate, IssueUpdate, IssueFilter
+from domain.issue.model import Issue, issue_tags
+from domain.issue.dto import IssueCreate, IssueUpdate, IssueFilter, IssueBatchRequest
+from domain.common.dto import BatchItemResult, repeated_ids
+from domain.common.reference_cache import reference_cache
 from domain.user.model import User
 from domain.tag.model import Tag
+from domain.sync.repository import ChangeSet, SyncCursor, SyncRepository
+
+BATCH_OPERATION_ORDER = ("create", "update", "delete")
 
 
 class IssueRepository:
@@ -35,12 +42,11 @@ class IssueRepository:
 
         # Add tags if provided
         if issue_data.tag_ids:
-            tags = self.db.query(Tag).filter(Tag.id.in_(issue_data.tag_ids)).all()
-            db_issue.tags = tags
+            db_issue.tags = reference_cache.tags.instances(self.db, issue_data.tag_ids)
 
         self.db.add(db_issue)
         self.db.commit()
-        self.db.refresh(db_issue)
+        self.db.refresh(db_issue, ["location", "created_at", "updated_at"])
 
         # Convert location to coordinates before returning
         return db_issue
@@ -51,6 +57,11 @@ class IssueRepository:
         result = self.db.execute(query).scalar_one_or_none()
         return result
 
+    def get_updated_at(self, issue_id: int) -> Optional[datetime]:
+        """Get only the last modification time of an issue (for ETags)"""
+        query = select(Issue.updated_at).where(Issue.id == issue_id)
+        return self.db.execute(query).scalar_one_or_none()
+
     def get_filtered_issues(self, filter: IssueFilter) -> Tuple[List[Issue], int]:
         """Get filtered issues with pagination and total count"""
         query = select(Issue)
@@ -76,7 +87,11 @@ class IssueRepository:
 
         # Paginierung anwenden
         offset = (filter.page - 1) * filter.limit
-        paginated_query = query.offset(offset).limit(filter.limit)
+        paginated_query = (
+            query.offset(offset)
+            .limit(filter.limit)
+            .options(selectinload(Issue.tags))
+        )
         
         # Issues abrufen
         issues = self.db.execute(paginated_query).scalars().all()
@@ -97,6 +112,12 @@ class IssueRepository:
         
         return issues, total_count
 
+    def get_changes(self, cursor: SyncCursor, limit: int) -> ChangeSet:
+        """Seit dem Cursor geänderte und gelöschte Issues (Delta-Sync)"""
+        return SyncRepository(self.db).changes(
+            Issue, cursor, limit, options=(selectinload(Issue.tags),)
+        )
+
     def get_by_user(self, user_id: int) -> List[Issue]:
         """Get all issues created by a specific user"""
         query = select(Issue).where(Issue.created_by_user_id == user_id)
@@ -113,42 +134,240 @@ class IssueRepository:
         return result
 
     def update(self, issue_id: int, issue_data: IssueUpdate) -> Optional[Issue]:
-        """Update an issue"""
-        # First check if the issue exists
-        db_issue = self.get_by_id(issue_id)
-        if not db_issue:
-            return None
-
-        # Update basic fields
+        """Update an issue with a single UPDATE ... RETURNING"""
+        values = {}
         if issue_data.name is not None:
-            db_issue.name = issue_data.name
+            values["name"] = issue_data.name
         if issue_data.description is not None:
-            db_issue.description = issue_data.description
-
-        # Update location if provided
+            values["description"] = issue_data.description
         if issue_data.location is not None:
-            db_issue.location = ST_GeomFromText(
-                f"POINT({issue_data.location[0]} {issue_data.location[1]})"
-            )
+            values["location"] = self._location_ewkt(issue_data.location)
+        if not values:
+            # Auch reine Tag-Änderungen liefern so die Zeile zurück
+            values["updated_at"] = func.now()
+
+        stmt = (
+            update(Issue).where(Issue.id == issue_id).values(**values).returning(Issue)
+        )
+        db_issue = self.db.execute(stmt).scalar_one_or_none()
+        if not db_issue:
+            return None
 
         # Update tags if provided
         if issue_data.tag_ids is not None:
-            tags = self.db.query(Tag).filter(Tag.id.in_(issue_data.tag_ids)).all()
-            db_issue.tags = tags
+            tags = reference_cache.tags.instances(self.db, issue_data.tag_ids)
+            self.db.execute(delete(issue_tags).where(issue_tags.c.issue_id == issue_id))
+            if tags:
+                self.db.execute(
+                    insert(issue_tags),
+                    [{"issue_id": issue_id, "tag_id": tag.id} for tag in tags],
+                )
+            set_committed_value(db_issue, "tags", tags)
 
         self.db.commit()
-        self.db.refresh(db_issue)
-
         return db_issue
 
     def delete(self, issue_id: int) -> bool:
-        """Delete an issue"""
-        # First check if the issue exists
-        db_issue = self.get_by_id(issue_id)
-        if not db_issue:
+        """Delete an issue with a single DELETE ... RETURNING"""
+        stmt = (
+            delete(Issue)
+            .where(Issue.id == issue_id)
+            .returning(Issue.id)
+            .execution_options(synchronize_session=False)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is None:
             return False
-
-        # Execute delete
-        self.db.delete(db_issue)
+        SyncRepository(self.db).record_deletes(Issue.__tablename__, [issue_id])
         self.db.commit()
         return True
+
+    def batch(
+        self, batch: IssueBatchRequest, current_user: Optional[User] = None
+    ) -> List[BatchItemResult]:
+        """
+        Führt Create-, Update- und Delete-Operationen in einer Transaktion aus.
+
+        Creates werden mit einem einzigen INSERT ... RETURNING angelegt, die
+        Tag-Zuordnungen per executemany eingefügt. Nicht gefundene sowie
+        mehrfach in update/delete genannte Issues (409) werden pro Eintrag
+        gemeldet, ohne den restlichen Batch abzubrechen.
+        """
+        results: List[BatchItemResult] = []
+
+        # Existenz der Issues für Update/Delete mit einer Abfrage prüfen
+        target_ids = {item.id for item in batch.update} | set(batch.delete)
+        existing_ids = set()
+        if target_ids:
+            existing_ids = set(
+                self.db.execute(
+                    select(Issue.id).where(Issue.id.in_(target_ids))
+                ).scalars()
+            )
+
+        conflicting_ids = repeated_ids(
+            [item.id for item in batch.update], batch.delete
+        )
+
+        def check_exists(operation: str, index: int, issue_id: int) -> bool:
+            if issue_id in conflicting_ids:
+                results.append(
+                    BatchItemResult(
+                        operation=operation,
+                        index=index,
+                        id=issue_id,
+                        status=409,
+                        detail=f"Issue with ID {issue_id} is listed more than once",
+                    )
+                )
+                return False
+            if issue_id in existing_ids:
+                return True
+            results.append(
+                BatchItemResult(
+                    operation=operation,
+                    index=index,
+                    id=issue_id,
+                    status=404,
+                    detail=f"Issue with ID {issue_id} not found",
+                )
+            )
+            return False
+
+        updates = [
+            (index, item)
+            for index, item in enumerate(batch.update)
+            if check_exists("update", index, item.id)
+        ]
+        deletes = [
+            (index, issue_id)
+            for index, issue_id in enumerate(batch.delete)
+            if check_exists("delete", index, issue_id)
+        ]
+
+        # Nur existierende Tags zuordnen (wie bei create/update)
+        requested_tag_ids = {
+            tag_id
+            for item in [*batch.create, *batch.update]
+            for tag_id in item.tag_ids or []
+        }
+        valid_tag_ids = reference_cache.tags.existing_ids(self.db, requested_tag_ids)
+
+        try:
+            tag_rows = []
+
+            # Creates: ein INSERT ... RETURNING für alle Issues
+            if batch.create:
+                created_ids = (
+                    self.db.execute(
+                        insert(Issue).returning(Issue.id, sort_by_parameter_order=True),
+                        [
+                            {
+                                "name": item.name,
+                                "description": item.description,
+                                "created_by_user_id": current_user.id
+                                if current_user
+                                else None,
+                                "location": self._location_ewkt(item.location),
+                            }
+                            for item in batch.create
+                        ],
+                    )
+                    .scalars()
+                    .all()
+                )
+                for index, (item, issue_id) in enumerate(
+                    zip(batch.create, created_ids)
+                ):
+                    tag_rows += [
+                        {"issue_id": issue_id, "tag_id": tag_id}
+                        for tag_id in dict.fromkeys(item.tag_ids or [])
+                        if tag_id in valid_tag_ids
+                    ]
+                    results.append(
+                        BatchItemResult(
+                            operation="create", index=index, id=issue_id, status=201
+                        )
+                    )
+
+            # Updates: Bulk-UPDATE per Primärschlüssel, Tags ersetzen
+            if updates:
+                update_rows = []
+                touched_ids = []
+                replace_tags = []
+                for _, item in updates:
+                    values = {"id": item.id}
+                    if item.name is not None:
+                        values["name"] = item.name
+                    if item.description is not None:
+                        values["description"] = item.description
+                    if item.location is not None:
+                        values["location"] = self._location_ewkt(item.location)
+                    if len(values) > 1:
+                        update_rows.append(values)
+                    else:
+                        touched_ids.append(item.id)
+
+                    if item.tag_ids is not None:
+                        replace_tags.append(item.id)
+                        tag_rows += [
+                            {"issue_id": item.id, "tag_id": tag_id}
+                            for tag_id in dict.fromkeys(item.tag_ids)
+                            if tag_id in valid_tag_ids
+                        ]
+
+                if update_rows:
+                    self.db.execute(update(Issue), update_rows)
+                if touched_ids:
+                    self.db.execute(
+                        update(Issue)
+                        .where(Issue.id.in_(touched_ids))
+                        .values(updated_at=func.now())
+                        .execution_options(synchronize_session=False)
+                    )
+                if replace_tags:
+                    self.db.execute(
+                        delete(issue_tags).where(
+                            issue_tags.c.issue_id.in_(replace_tags)
+                        )
+                    )
+                results += [
+                    BatchItemResult(
+                        operation="update", index=index, id=item.id, status=200
+                    )
+                    for index, item in updates
+                ]
+
+            # Tag-Zuordnungen für Creates und Updates gesammelt einfügen
+            if tag_rows:
+                self.db.execute(insert(issue_tags), tag_rows)
+
+            # Deletes: ein DELETE für alle Issues
+            if deletes:
+                deleted_ids = [issue_id for _, issue_id in deletes]
+                self.db.execute(
+                    delete(Issue)
+                    .where(Issue.id.in_(deleted_ids))
+                    .execution_options(synchronize_session=False)
+                )
+                SyncRepository(self.db).record_deletes(Issue.__tablename__, deleted_ids)
+                results += [
+                    BatchItemResult(
+                        operation="delete", index=index, id=issue_id, status=204
+                    )
+                    for index, issue_id in deletes
+                ]
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        results.sort(key=lambda r: (BATCH_OPERATION_ORDER.index(r.operation), r.index))
+        return results
+
+    @staticmethod
+    def _location_ewkt(location: Optional[List[float]]) -> Optional[str]:
+        """Wandelt [longitude, latitude] in einen EWKT-Punkt um"""
+        if location and len(location) >= 2:
+            return f"SRID=4326;POINT({location[0]} {location[1]})"
+        return None
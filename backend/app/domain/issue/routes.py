@@ -1,16 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Query,
+    Request,
+    Response,
+)
 from typing import List, Annotated
+from datetime import datetime
 from sqlalchemy.orm import Session
 
 from infrastructure.postgresql.db import get_db
 from domain.user.model import User
 from domain.issue.repository import IssueRepository
-from domain.issue.dto import IssueCreate, IssueUpdate, IssueResponse, IssueFilter, PaginatedIssueResponse
-from dependencies.repository_dependencies import (
-    get_issue_repository,
-    get_user_repository,
+from domain.tag.model import Tag
+from infrastructure.redis.table_versions import TableVersions, get_table_versions
+from misc.http_cache import (
+    RESOURCE_CACHE_CONTROL,
+    etag_matches,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+    timestamp_part,
+)
+from domain.issue.dto import (
+    IssueCreate,
+    IssueUpdate,
+    IssueResponse,
+    IssueFilter,
+    PaginatedIssueResponse,
+    IssueBatchRequest,
+    IssueBatchResponse,
+    IssueChangesResponse,
 )
-from domain.user.repository import UserRepository
+from domain.sync.dependency import SyncCursorParam, fetch_changes
+from dependencies.repository_dependencies import get_issue_repository
+from domain.user.dependency import CurrentUser
 
 # Create router
 issue_router = APIRouter(prefix="/issue")
@@ -21,15 +47,24 @@ issue_router = APIRouter(prefix="/issue")
 )
 def create_issue(
     issue_data: IssueCreate,
-    request: Request,
+    current_user: CurrentUser,
     issue_repository: IssueRepository = Depends(get_issue_repository),
-    user_repository: UserRepository = Depends(get_user_repository),
 ):
     """Create a new issue"""
-    current_user = user_repository.get_user_by_id(request.state.user_id)
     return issue_repository.create(issue_data, current_user)
 
 
+@issue_router.post("/batch", response_model=IssueBatchResponse)
+def batch_issues(
+    batch: IssueBatchRequest,
+    current_user: CurrentUser,
+    issue_repository: IssueRepository = Depends(get_issue_repository),
+):
+    """Create, update and delete multiple issues in one transaction"""
+    results = issue_repository.batch(batch, current_user)
+    return IssueBatchResponse(results=results)
+
+
 @issue_router.get("", response_model=PaginatedIssueResponse)
 def get_all_issues(
     filters: Annotated[IssueFilter, Query()],
@@ -52,18 +87,51 @@ def get_all_issues(
     )
 
 
+@issue_router.get("/changes", response_model=IssueChangesResponse)
+def get_issue_changes(
+    cursor: SyncCursorParam,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 200,
+    issue_repository: IssueRepository = Depends(get_issue_repository),
+):
+    """Issues changed or deleted since the cursor (delta sync)"""
+    changes = fetch_changes(issue_repository.get_changes, cursor, limit)
+    return IssueChangesResponse(
+        issues=changes.changed,
+        deleted_ids=changes.deleted_ids,
+        next_cursor=changes.cursor.encode(),
+        has_more=changes.has_more,
+    )
+
+
 @issue_router.get("/{issue_id}", response_model=IssueResponse)
 def get_issue(
     issue_id: int,
+    request: Request,
+    response: Response,
     issue_repository: IssueRepository = Depends(get_issue_repository),
+    versions: TableVersions = Depends(get_table_versions),
 ):
-    """Get an issue by ID"""
+    """Get an issue by ID (conditional GET via ETag)"""
+    # Umbenannte Tags ändern die Antwort, aber nicht updated_at
+    tag_version = versions.version(Tag.__tablename__)
+    if request.headers.get("if-none-match"):
+        updated_at = issue_repository.get_updated_at(issue_id)
+        if updated_at is not None:
+            etag = _issue_etag(issue_id, updated_at, tag_version)
+            if etag_matches(request, etag):
+                return not_modified(etag, RESOURCE_CACHE_CONTROL)
+
     issue = issue_repository.get_by_id(issue_id)
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Issue with ID {issue_id} not found",
         )
+    set_cache_headers(
+        response,
+        _issue_etag(issue.id, issue.updated_at, tag_version),
+        RESOURCE_CACHE_CONTROL,
+    )
     return issue
 
 
@@ -96,3 +164,7 @@ def delete_issue(
             detail=f"Issue with ID {issue_id} not found",
         )
     return None
+
+
+def _issue_etag(issue_id: int, updated_at: datetime, tag_version: int) -> str:
+    return make_etag("issue", issue_id, timestamp_part(updated_at), tag_version)
@@ -4,6 +4,7 @@ from typing import List, Optional
 
 from domain.role.model import Role
 from domain.role.dto import RoleCreate, RoleUpdate
+from domain.common.reference_cache import reference_cache
 
 
 class RoleRepository:
@@ -19,6 +20,7 @@ class RoleRepository:
 
         self.db.add(db_role)
         self.db.commit()
+        reference_cache.changed(Role.__tablename__)
         self.db.refresh(db_role)
         return db_role
 
@@ -29,9 +31,9 @@ class RoleRepository:
         return result
 
     def get_by_name(self, name: str) -> Optional[Role]:
-        """Get a role by its name"""
-        query = select(Role).where(Role.name == name)
-        return self.db.execute(query).scalar_one_or_none()
+        """Get a role by its name (aus dem Stammdaten-Cache)"""
+        role = reference_cache.roles.get_by_name(self.db, name)
+        return reference_cache.roles.instance(self.db, role["id"]) if role else None
 
     def get_all(self) -> List[Role]:
         """Get all roles"""
@@ -58,6 +60,7 @@ class RoleRepository:
             stmt = update(Role).where(Role.id == role_id).values(**update_data)
             self.db.execute(stmt)
             self.db.commit()
+            reference_cache.changed(Role.__tablename__)
 
             # Refresh the role object
             return self.get_by_id(role_id)
@@ -74,4 +77,5 @@ class RoleRepository:
         stmt = delete(Role).where(Role.id == role_id)
         self.db.execute(stmt)
         self.db.commit()
+        reference_cache.changed(Role.__tablename__)
         return True
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from typing import List
 from sqlalchemy.orm import Session
 
@@ -6,6 +6,15 @@ from infrastructure.postgresql.db import get_db
 from domain.user.model import User
 from domain.role.repository import RoleRepository
 from domain.role.dto import RoleCreate, RoleUpdate, RoleResponse
+from domain.role.model import Role
+from infrastructure.redis.table_versions import TableVersions, get_table_versions
+from misc.http_cache import (
+    etag_matches,
+    make_etag,
+    not_modified,
+    reference_cache_control,
+    set_cache_headers,
+)
 
 # Create router
 role_router = APIRouter(prefix="/role")
@@ -22,8 +31,17 @@ def create_role(
 
 
 @role_router.get("", response_model=List[RoleResponse])
-def get_all_roles(db: Session = Depends(get_db)):
-    """Get all roles"""
+def get_all_roles(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    versions: TableVersions = Depends(get_table_versions),
+):
+    """Get all roles (conditional GET via ETag)"""
+    etag = make_etag(Role.__tablename__, versions.version(Role.__tablename__))
+    if etag_matches(request, etag):
+        return not_modified(etag, reference_cache_control())
+    set_cache_headers(response, etag, reference_cache_control())
     repository = RoleRepository(db)
     return repository.get_all()
 
@@ -0,0 +1,27 @@
+from datetime import date
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+StatisticsDimension = Literal["day", "week", "month", "tag", "vehicle", "cell"]
+
+
+class StatisticsRow(BaseModel):
+    """Eine Gruppe; nur die Felder der gewählten Dimensionen sind gesetzt"""
+
+    day: Optional[date] = None
+    week: Optional[date] = Field(None, description="Montag der Woche")
+    month: Optional[date] = Field(None, description="Erster Tag des Monats")
+    tag_id: Optional[int] = None
+    vehicle_id: Optional[int] = None
+    cell: Optional[int] = Field(None, description="Rasterzelle (-1: ohne Standort)")
+    cell_bbox: Optional[List[float]] = Field(
+        None, description="min_lon, min_lat, max_lon, max_lat der Rasterzelle"
+    )
+    events: int = Field(description="Anzahl der Events")
+
+
+class StatisticsResponse(BaseModel):
+    group_by: List[StatisticsDimension]
+    grid_degrees: float = Field(description="Kantenlänge der Rasterzellen in Grad")
+    rows: List[StatisticsRow]
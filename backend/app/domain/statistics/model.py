@@ -0,0 +1,33 @@
+from datetime import date
+
+from infrastructure.postgresql.db import Base
+from sqlalchemy import Date, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+# tag_id/vehicle_id dieses Werts: Summe über alle Tags bzw. Fahrzeugtypen
+ALL = 0
+# cell für Events ohne Standort
+NO_CELL = -1
+
+
+class EventRollup(Base):
+    """
+    Vorsummierte Event-Anzahlen pro Tag x Fahrzeugtyp x Tag (Datum) x Rasterzelle
+
+    Neben den Kombinationen (tag, vehicle) enthält die Tabelle die Ebenen
+    (tag, ALL), (ALL, vehicle) und (ALL, ALL). Ein Event mit mehreren Tags
+    wird so pro Ebene genau einmal gezählt, Summen über day und cell sind
+    exakt.
+    """
+
+    __tablename__ = "event_rollup"
+    __table_args__ = (
+        # Auswertungen wählen zuerst die Ebene und dann den Zeitraum
+        Index("ix_event_rollup_tag_vehicle_day", "tag_id", "vehicle_id", "day"),
+    )
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    cell: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tag_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    vehicle_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    events: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,203 @@
+"""
+Statistik-Würfel der Events (event_rollup)
+
+Die Tabelle wird tageweise aus event, event_tags und event_vehicles neu
+berechnet: Event-Änderungen markieren ihren Tag (created_at) als veraltet,
+workers/statistics_worker.py berechnet die markierten Tage neu. Auswertungen
+lesen nur noch die vorsummierten Zeilen.
+"""
+
+import math
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Date,
+    Integer,
+    and_,
+    case,
+    cast,
+    delete,
+    distinct,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.orm import Session
+
+from config.config_provider import get_config
+from domain.event.model import Event, event_tags, event_vehicles
+from domain.statistics.model import ALL, NO_CELL, EventRollup
+
+config = get_config()
+
+# Auswertbare Dimensionen; week/month fassen Tage zusammen (date_trunc)
+PERIODS = ("day", "week", "month")
+DIMENSIONS = PERIODS + ("tag", "vehicle", "cell")
+
+
+def grid_shape() -> Tuple[int, int]:
+    """(Zeilen, Spalten) des Rasters aus statistics_grid_degrees"""
+    size = config.statistics_grid_degrees
+    return math.ceil(180 / size), math.ceil(360 / size)
+
+
+def cell_bounds(cell: int) -> Optional[Tuple[float, float, float, float]]:
+    """(min_lon, min_lat, max_lon, max_lat) einer Rasterzelle"""
+    if cell == NO_CELL:
+        return None
+    size = config.statistics_grid_degrees
+    row, column = divmod(cell, grid_shape()[1])
+    min_lon, min_lat = column * size - 180, row * size - 90
+    return (min_lon, min_lat, min(min_lon + size, 180), min(min_lat + size, 90))
+
+
+class InvalidSlice(ValueError):
+    pass
+
+
+class StatisticsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh(self, days: Optional[Iterable[date]] = None) -> int:
+        """
+        Berechnet die Rollup-Zeilen der übergebenen Tage neu (None: alle Tage)
+
+        Eine Transaktion: Zeilen der Tage löschen, dann alle Ebenen des
+        Würfels mit GROUPING SETS in einem INSERT ... SELECT neu schreiben.
+
+        Returns:
+            Anzahl der geschriebenen Rollup-Zeilen
+        """
+        day = cast(Event.created_at, Date)
+        conditions = []
+        if days is not None:
+            days = sorted(set(days))
+            if not days:
+                return 0
+            conditions.append(day.in_(days))
+
+        rows, columns = grid_shape()
+        size = config.statistics_grid_degrees
+        column = func.least(
+            func.floor((func.ST_X(Event.location) + 180) / size), columns - 1
+        )
+        row = func.least(func.floor((func.ST_Y(Event.location) + 90) / size), rows - 1)
+        source = (
+            select(
+                Event.id.label("event_id"),
+                day.label("day"),
+                func.coalesce(cast(row * columns + column, Integer), NO_CELL).label(
+                    "cell"
+                ),
+                event_tags.c.tag_id,
+                event_vehicles.c.vehicle_id,
+            )
+            .outerjoin(event_tags, event_tags.c.event_id == Event.id)
+            .outerjoin(event_vehicles, event_vehicles.c.event_id == Event.id)
+            .where(*conditions)
+            .subquery()
+        )
+        tag, vehicle = source.c.tag_id, source.c.vehicle_id
+        cube = (
+            select(
+                source.c.day,
+                source.c.cell,
+                case((func.grouping(tag) == 1, ALL), else_=tag),
+                case((func.grouping(vehicle) == 1, ALL), else_=vehicle),
+                func.count(distinct(source.c.event_id)),
+            )
+            .group_by(
+                func.grouping_sets(
+                    tuple_(source.c.day, source.c.cell, tag, vehicle),
+                    tuple_(source.c.day, source.c.cell, tag),
+                    tuple_(source.c.day, source.c.cell, vehicle),
+                    tuple_(source.c.day, source.c.cell),
+                )
+            )
+            # Events ohne Tags/Fahrzeuge zählen nur in den ALL-Ebenen
+            .having(or_(func.grouping(tag) == 1, tag.is_not(None)))
+            .having(or_(func.grouping(vehicle) == 1, vehicle.is_not(None)))
+        )
+
+        stmt = delete(EventRollup)
+        if days is not None:
+            stmt = stmt.where(EventRollup.day.in_(days))
+        self.db.execute(stmt)
+        result = self.db.execute(
+            insert(EventRollup).from_select(
+                ["day", "cell", "tag_id", "vehicle_id", "events"], cube
+            )
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def slice(
+        self,
+        group_by: Sequence[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        tag_ids: Optional[List[int]] = None,
+        vehicle_ids: Optional[List[int]] = None,
+    ) -> List[Dict]:
+        """
+        Summen der Events, gruppiert nach den Dimensionen in group_by
+
+        Ohne Gruppierung nach Tag werden die (ALL, ...)-Zeilen gelesen, mit
+        Gruppierung oder Filter die Zeilen der einzelnen Tags (Fahrzeuge
+        entsprechend).
+
+        Raises:
+            InvalidSlice: Mehrere Tags/Fahrzeuge ohne Gruppierung danach; ein
+                Event mit mehreren davon würde mehrfach gezählt.
+        """
+        for dimension, ids in (("tag", tag_ids), ("vehicle", vehicle_ids)):
+            if ids and len(set(ids)) > 1 and dimension not in group_by:
+                raise InvalidSlice(
+                    f"Filtering by several {dimension}s requires group_by={dimension}"
+                )
+
+        conditions = [
+            self._level(EventRollup.tag_id, tag_ids, "tag" in group_by),
+            self._level(EventRollup.vehicle_id, vehicle_ids, "vehicle" in group_by),
+        ]
+        if start_date:
+            conditions.append(EventRollup.day >= start_date)
+        if end_date:
+            conditions.append(EventRollup.day <= end_date)
+
+        columns = {
+            "tag": EventRollup.tag_id,
+            "vehicle": EventRollup.vehicle_id,
+            "cell": EventRollup.cell,
+        }
+        for period in PERIODS:
+            if period in group_by:
+                # Literal, damit SELECT und GROUP BY denselben Ausdruck enthalten
+                columns[period] = cast(
+                    func.date_trunc(
+                        literal(period, literal_execute=True), EventRollup.day
+                    ),
+                    Date,
+                )
+        keys = [dimension for dimension in DIMENSIONS if dimension in group_by]
+        grouped = [columns[key].label(key) for key in keys]
+        query = (
+            select(*grouped, func.sum(EventRollup.events).label("events"))
+            .where(and_(*conditions))
+            .group_by(*grouped)
+            .order_by(*grouped)
+        )
+        return [dict(row._mapping) for row in self.db.execute(query)]
+
+    @staticmethod
+    def _level(column, ids: Optional[List[int]], grouped: bool):
+        if ids:
+            return column.in_(ids)
+        if grouped:
+            return column != ALL
+        return column == ALL
@@ -0,0 +1,65 @@
+from datetime import date
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from config.config_provider import get_config
+from dependencies.repository_dependencies import get_statistics_repository
+from domain.statistics.dto import (
+    StatisticsDimension,
+    StatisticsResponse,
+    StatisticsRow,
+)
+from domain.statistics.repository import (
+    InvalidSlice,
+    StatisticsRepository,
+    cell_bounds,
+)
+
+config = get_config()
+
+statistics_router = APIRouter(prefix="/statistics")
+
+
+@statistics_router.get("/events", response_model=StatisticsResponse)
+def get_event_statistics(
+    group_by: Annotated[Optional[List[StatisticsDimension]], Query()] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    tag_ids: Annotated[Optional[List[int]], Query()] = None,
+    vehicle_ids: Annotated[Optional[List[int]], Query()] = None,
+    repository: StatisticsRepository = Depends(get_statistics_repository),
+):
+    """
+    Event counts from the pre-aggregated rollup, grouped by any combination of
+    period (day/week/month), tag, vehicle type and grid cell
+    """
+    group_by = list(dict.fromkeys(group_by or []))
+    try:
+        groups = repository.slice(
+            group_by, start_date, end_date, tag_ids, vehicle_ids
+        )
+    except InvalidSlice as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+    rows = []
+    for group in groups:
+        row = StatisticsRow(
+            day=group.get("day"),
+            week=group.get("week"),
+            month=group.get("month"),
+            tag_id=group.get("tag"),
+            vehicle_id=group.get("vehicle"),
+            cell=group.get("cell"),
+            events=group["events"],
+        )
+        if row.cell is not None:
+            bounds = cell_bounds(row.cell)
+            row.cell_bbox = list(bounds) if bounds else None
+        rows.append(row)
+    return StatisticsResponse(
+        group_by=group_by,
+        grid_degrees=config.statistics_grid_degrees,
+        rows=rows,
+    )
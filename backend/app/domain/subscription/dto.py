@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import List, Optional
+
+from geoalchemy2.shape import to_shape
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from shapely.geometry import Polygon
+
+
+class AreaSubscriptionCreate(BaseModel):
+    """Entweder polygon oder center mit radius_m"""
+
+    name: str = Field(..., min_length=1, max_length=50)
+    polygon: Optional[List[List[float]]] = Field(
+        None, description="Äußerer Ring als [[longitude, latitude], ...]"
+    )
+    center: Optional[List[float]] = Field(
+        None, min_length=2, max_length=2, description="[longitude, latitude]"
+    )
+    radius_m: Optional[float] = Field(
+        None, gt=0, le=100_000, description="Umkreis in Metern (max. 100 km)"
+    )
+
+    @field_validator("polygon")
+    def polygon_must_be_valid(cls, value):
+        if value is None:
+            return None
+        if len(value) < 3 or any(len(point) != 2 for point in value):
+            raise ValueError("polygon needs at least three [lon, lat] points")
+        if any(abs(lon) > 180 or abs(lat) > 90 for lon, lat in value):
+            raise ValueError("polygon coordinates out of range")
+        if not Polygon(value).is_valid:
+            raise ValueError("polygon must not intersect itself")
+        return value
+
+    @model_validator(mode="after")
+    def polygon_or_radius(self):
+        has_polygon = self.polygon is not None
+        has_radius = self.center is not None and self.radius_m is not None
+        if has_polygon == has_radius:
+            raise ValueError("Provide either polygon or center with radius_m")
+        return self
+
+
+class AreaSubscriptionResponse(BaseModel):
+    id: int
+    name: str
+    area: List[List[float]] = Field(description="Äußerer Ring des Gebiets")
+    created_at: datetime
+
+    @field_validator("area", mode="before")
+    def area_to_coordinates(cls, value):
+        polygon = to_shape(value)
+        return [[float(x), float(y)] for x, y in polygon.exterior.coords]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AreaNotification(BaseModel):
+    """Neues Event in einem abonnierten Gebiet"""
+
+    subscription_id: int
+    subscription_name: str
+    event_id: int
+    event_name: str
+    location: List[float]
+    created_at: float
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from geoalchemy2 import Geometry
+from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.postgresql.db import Base
+
+
+class AreaSubscription(Base):
+    """Gebiet (Polygon oder Umkreis), für das ein Benutzer neue Events erhält"""
+
+    __tablename__ = "area_subscription"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+    # GiST-Index (idx_area_subscription_area) für die Umkehrsuche Punkt -> Gebiete
+    area: Mapped[Geometry] = mapped_column(
+        Geometry(geometry_type="POLYGON", srid=4326), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
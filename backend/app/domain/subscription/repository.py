@@ -0,0 +1,93 @@
+from typing import Dict, List
+
+from geoalchemy2 import Geometry
+from geoalchemy2.functions import ST_Buffer, ST_GeomFromText, ST_Intersects
+from shapely.geometry import Point, Polygon
+from sqlalchemy import cast, delete, func, select
+from sqlalchemy.orm import Session
+
+from domain.event.model import Event
+from domain.subscription.dto import AreaSubscriptionCreate
+from domain.subscription.model import AreaSubscription
+
+
+class AreaSubscriptionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, data: AreaSubscriptionCreate, user_id: int) -> AreaSubscription:
+        if data.polygon is not None:
+            area = ST_GeomFromText(Polygon(data.polygon).wkt, 4326)
+        else:
+            # Umkreis in Metern: Puffer auf geography, zurück als Polygon in 4326
+            center = func.ST_GeogFromText(f"SRID=4326;{Point(data.center).wkt}")
+            area = cast(
+                ST_Buffer(center, data.radius_m),
+                Geometry(geometry_type="POLYGON", srid=4326),
+            )
+        subscription = AreaSubscription(user_id=user_id, name=data.name, area=area)
+        self.db.add(subscription)
+        self.db.commit()
+        self.db.refresh(subscription, ["area", "created_at"])
+        return subscription
+
+    def count_for_user(self, user_id: int) -> int:
+        query = select(func.count()).where(AreaSubscription.user_id == user_id)
+        return self.db.execute(query).scalar_one()
+
+    def get_for_user(self, user_id: int) -> List[AreaSubscription]:
+        query = (
+            select(AreaSubscription)
+            .where(AreaSubscription.user_id == user_id)
+            .order_by(AreaSubscription.id)
+        )
+        return self.db.execute(query).scalars().all()
+
+    def delete(self, subscription_id: int, user_id: int) -> bool:
+        stmt = (
+            delete(AreaSubscription)
+            .where(AreaSubscription.id == subscription_id)
+            .where(AreaSubscription.user_id == user_id)
+            .returning(AreaSubscription.id)
+            .execution_options(synchronize_session=False)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is None:
+            return False
+        self.db.commit()
+        return True
+
+    def match_events(self, event_ids: List[int]) -> List[Dict]:
+        """
+        Abonnements, in deren Gebiet die Events liegen
+
+        Eine Umkehrsuche für alle Events: pro Event-Punkt liefert der GiST-Index
+        auf area die Kandidaten, statt alle Abonnements einzeln zu prüfen.
+        Eigene Events lösen keine Benachrichtigung aus.
+        """
+        if not event_ids:
+            return []
+        query = (
+            select(
+                AreaSubscription.id,
+                AreaSubscription.user_id,
+                AreaSubscription.name,
+                Event.id.label("event_id"),
+                Event.name.label("event_name"),
+                func.ST_X(Event.location).label("lon"),
+                func.ST_Y(Event.location).label("lat"),
+            )
+            .join(Event, ST_Intersects(AreaSubscription.area, Event.location))
+            .where(Event.id.in_(event_ids))
+            .where(AreaSubscription.user_id.is_distinct_from(Event.created_by))
+        )
+        return [
+            {
+                "user_id": row.user_id,
+                "subscription_id": row.id,
+                "subscription_name": row.name,
+                "event_id": row.event_id,
+                "event_name": row.event_name,
+                "location": [row.lon, row.lat],
+            }
+            for row in self.db.execute(query)
+        ]
@@ -0,0 +1,77 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from config.config_provider import get_config
+from dependencies.repository_dependencies import get_area_subscription_repository
+from domain.subscription.dto import (
+    AreaNotification,
+    AreaSubscriptionCreate,
+    AreaSubscriptionResponse,
+)
+from domain.subscription.repository import AreaSubscriptionRepository
+from domain.user.dependency import CurrentUser
+from infrastructure.redis.notification_queue import (
+    NotificationQueue,
+    get_notification_queue,
+)
+
+config = get_config()
+
+subscription_router = APIRouter(prefix="/subscription")
+
+
+@subscription_router.post(
+    "", response_model=AreaSubscriptionResponse, status_code=status.HTTP_201_CREATED
+)
+def create_subscription(
+    data: AreaSubscriptionCreate,
+    current_user: CurrentUser,
+    repository: AreaSubscriptionRepository = Depends(
+        get_area_subscription_repository
+    ),
+):
+    """Subscribe to new events inside a polygon or radius"""
+    if repository.count_for_user(current_user.id) >= config.area_subscriptions_per_user:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Maximum number of area subscriptions reached",
+        )
+    return repository.create(data, current_user.id)
+
+
+@subscription_router.get("", response_model=List[AreaSubscriptionResponse])
+def get_subscriptions(
+    current_user: CurrentUser,
+    repository: AreaSubscriptionRepository = Depends(
+        get_area_subscription_repository
+    ),
+):
+    return repository.get_for_user(current_user.id)
+
+
+@subscription_router.get("/notifications", response_model=List[AreaNotification])
+def pop_notifications(
+    current_user: CurrentUser,
+    queue: NotificationQueue = Depends(get_notification_queue),
+):
+    """New events in subscribed areas since the last call (oldest first)"""
+    return queue.pop_all(current_user.id)
+
+
+@subscription_router.delete(
+    "/{subscription_id}", status_code=status.HTTP_204_NO_CONTENT
+)
+def delete_subscription(
+    subscription_id: int,
+    current_user: CurrentUser,
+    repository: AreaSubscriptionRepository = Depends(
+        get_area_subscription_repository
+    ),
+):
+    if not repository.delete(subscription_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Subscription with ID {subscription_id} not found",
+        )
+    return None
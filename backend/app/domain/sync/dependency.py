@@ -0,0 +1,35 @@
+from typing import Annotated, Callable, Optional
+
+from fastapi import Depends, HTTPException, Query, status
+
+from domain.sync.repository import (
+    ChangeSet,
+    ExpiredCursor,
+    InvalidCursor,
+    SyncCursor,
+)
+
+
+def get_sync_cursor(
+    cursor: Annotated[
+        Optional[str],
+        Query(description="next_cursor of the previous response (empty = full sync)"),
+    ] = None,
+) -> SyncCursor:
+    try:
+        return SyncCursor.decode(cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def fetch_changes(
+    get_changes: Callable[[SyncCursor, int], ChangeSet], cursor: SyncCursor, limit: int
+) -> ChangeSet:
+    """Ruft den Feed ab; abgelaufene Cursor werden zu 410 (Vollsync nötig)"""
+    try:
+        return get_changes(cursor, limit)
+    except ExpiredCursor as e:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e))
+
+
+SyncCursorParam = Annotated[SyncCursor, Depends(get_sync_cursor)]
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from infrastructure.postgresql.db import Base
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class Tombstone(Base):
+    """Gelöschter Datensatz, damit der Änderungs-Feed Löschungen melden kann"""
+
+    __tablename__ = "tombstone"
+    __table_args__ = (
+        # Keyset-Scan des Feeds: WHERE entity = ? AND (deleted_at, id) > (?, ?)
+        Index("ix_tombstone_entity_deleted_at_id", "entity", "deleted_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    entity: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False, index=True
+    )
@@ -0,0 +1,157 @@
+"""
+Änderungs-Feed (Delta-Sync) für Events und Issues
+
+Clients übergeben den Cursor der letzten Antwort und erhalten nur die seitdem
+angelegten/geänderten Datensätze sowie die IDs gelöschter Datensätze. Beide
+Teile werden per Keyset-Scan über (updated_at, id) bzw. (deleted_at, id)
+gelesen, der Cursor enthält die Position in beiden.
+
+updated_at ist der Start der schreibenden Transaktion. Eine Transaktion, die
+früher beginnt, aber später committet, bekäme einen Zeitstempel hinter einem
+schon ausgelieferten Cursor. Der Feed liefert deshalb nur Änderungen, die
+älter als sync_settle_seconds sind.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from config.config_provider import get_config
+from domain.sync.model import Tombstone
+
+config = get_config()
+
+# Position vor allen Datensätzen
+_START = (datetime.min, 0)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class ExpiredCursor(ValueError):
+    """Löschungen vor dem Cursor sind bereits aufgeräumt: Vollsync nötig"""
+
+
+@dataclass(frozen=True)
+class SyncCursor:
+    changed: Tuple[datetime, int] = _START
+    deleted: Tuple[datetime, int] = _START
+    # Alle Löschungen bis zu diesem Zeitpunkt hat der Client gesehen
+    synced: datetime = datetime.min
+
+    def encode(self) -> str:
+        data = {
+            "c": [self.changed[0].isoformat(), self.changed[1]],
+            "d": [self.deleted[0].isoformat(), self.deleted[1]],
+            "s": self.synced.isoformat(),
+        }
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: Optional[str]) -> "SyncCursor":
+        if not cursor:
+            return cls()
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            data = json.loads(raw)
+            return cls(
+                changed=(datetime.fromisoformat(data["c"][0]), int(data["c"][1])),
+                deleted=(datetime.fromisoformat(data["d"][0]), int(data["d"][1])),
+                synced=datetime.fromisoformat(data["s"]),
+            )
+        except (ValueError, KeyError, TypeError, IndexError) as e:
+            raise InvalidCursor("Invalid sync cursor") from e
+
+
+@dataclass
+class ChangeSet:
+    changed: List
+    deleted_ids: List[int]
+    cursor: SyncCursor
+    has_more: bool
+
+
+class SyncRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def changes(self, model, cursor: SyncCursor, limit: int, options=()) -> ChangeSet:
+        """
+        Nächste Seite des Feeds für eine Tabelle (Event oder Issue)
+
+        Raises:
+            ExpiredCursor: Cursor liegt vor der Aufbewahrungsfrist der Tombstones
+        """
+        # Uhr der Datenbank, mit der auch updated_at geschrieben wird
+        now = self.db.execute(select(func.localtimestamp())).scalar_one()
+        retention = timedelta(days=config.sync_tombstone_retention_days)
+        if cursor != SyncCursor() and cursor.synced < now - retention:
+            raise ExpiredCursor("Sync cursor expired, full resync required")
+
+        settled = now - timedelta(seconds=config.sync_settle_seconds)
+        changed = (
+            self.db.execute(
+                select(model)
+                .options(*options)
+                .where(tuple_(model.updated_at, model.id) > cursor.changed)
+                .where(model.updated_at <= settled)
+                .order_by(model.updated_at, model.id)
+                .limit(limit + 1)
+            )
+            .scalars()
+            .all()
+        )
+        deleted = self.db.execute(
+            select(Tombstone.deleted_at, Tombstone.id, Tombstone.entity_id)
+            .where(Tombstone.entity == model.__tablename__)
+            .where(tuple_(Tombstone.deleted_at, Tombstone.id) > cursor.deleted)
+            .where(Tombstone.deleted_at <= settled)
+            .order_by(Tombstone.deleted_at, Tombstone.id)
+            .limit(limit + 1)
+        ).all()
+
+        more_deleted = len(deleted) > limit
+        has_more = len(changed) > limit or more_deleted
+        changed, deleted = changed[:limit], deleted[:limit]
+        last_changed, last_deleted = cursor.changed, cursor.deleted
+        if changed:
+            last_changed = (changed[-1].updated_at, changed[-1].id)
+        if deleted:
+            last_deleted = (deleted[-1].deleted_at, deleted[-1].id)
+        next_cursor = SyncCursor(
+            changed=last_changed,
+            deleted=last_deleted,
+            synced=last_deleted[0] if more_deleted else settled,
+        )
+        return ChangeSet(
+            changed=changed,
+            deleted_ids=[row.entity_id for row in deleted],
+            cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    def record_deletes(self, entity: str, ids: List[int]) -> None:
+        """Schreibt Tombstones in der laufenden Transaktion (vor dem Commit)"""
+        if ids:
+            self.db.execute(
+                insert(Tombstone), [{"entity": entity, "entity_id": i} for i in ids]
+            )
+
+    def purge_tombstones(self, deleted_before: datetime, batch_size: int) -> int:
+        """Löscht bis zu batch_size Tombstones, die älter als deleted_before sind"""
+        ids = (
+            select(Tombstone.id)
+            .where(Tombstone.deleted_at < deleted_before)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = self.db.execute(delete(Tombstone).where(Tombstone.id.in_(ids)))
+        self.db.commit()
+        return result.rowcount
@@ -4,6 +4,9 @@ from typing import List, Optional
 
 from domain.tag.model import Tag
 from domain.tag.dto import TagCreate, TagUpdate
+from domain.common.reference_cache import reference_cache
+from domain.event.model import event_tags
+from domain.event.repository import EventRepository, linked_days
 
 
 class TagRepository:
@@ -18,6 +21,7 @@ class TagRepository:
 
         self.db.add(db_tag)
         self.db.commit()
+        reference_cache.changed(Tag.__tablename__)
         self.db.refresh(db_tag)
         return db_tag
 
@@ -40,36 +44,40 @@ class TagRepository:
         return result
 
     def update(self, tag_id: int, tag_data: TagUpdate) -> Optional[Tag]:
-        """Update a tag"""
-        # First check if the tag exists
-        db_tag = self.get_by_id(tag_id)
-        if not db_tag:
-            return None
-
+        """Update a tag with a single UPDATE ... RETURNING"""
         # Prepare update data
         update_data = {}
         if tag_data.name is not None:
             update_data["name"] = tag_data.name
 
-        # Execute update if there's data to update
-        if update_data:
-            stmt = update(Tag).where(Tag.id == tag_id).values(**update_data)
-            self.db.execute(stmt)
-            self.db.commit()
-
-            # Refresh the tag object
+        # Without changes there is nothing to write, a plain read is sufficient
+        if not update_data:
             return self.get_by_id(tag_id)
+
+        stmt = (
+            update(Tag)
+            .where(Tag.id == tag_id)
+            .values(**update_data)
+            .returning(Tag)
+        )
+        db_tag = self.db.execute(stmt).scalar_one_or_none()
+        if db_tag:
+            self.db.commit()
+            reference_cache.changed(Tag.__tablename__)
         return db_tag
 
     def delete(self, tag_id: int) -> bool:
-        """Delete a tag"""
-        # First check if the tag exists
-        db_tag = self.get_by_id(tag_id)
-        if not db_tag:
+        """Delete a tag with a single DELETE ... RETURNING"""
+        stmt = (
+            delete(Tag)
+            .where(Tag.id == tag_id)
+            .returning(Tag.id, linked_days(event_tags.c.tag_id, tag_id))
+            .execution_options(synchronize_session=False)
+        )
+        deleted = self.db.execute(stmt).one_or_none()
+        if deleted is None:
             return False
-
-        # Execute delete
-        stmt = delete(Tag).where(Tag.id == tag_id)
-        self.db.execute(stmt)
         self.db.commit()
+        reference_cache.changed(Tag.__tablename__)
+        EventRepository(self.db).links_deleted(deleted[1])
         return True
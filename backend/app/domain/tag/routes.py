@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from typing import List
 from sqlalchemy.orm import Session
 
@@ -7,6 +7,15 @@ from infrastructure.postgresql.db import get_db
 from domain.user.model import User
 from domain.tag.repository import TagRepository
 from domain.tag.dto import TagCreate, TagUpdate, TagResponse
+from domain.tag.model import Tag
+from infrastructure.redis.table_versions import TableVersions, get_table_versions
+from misc.http_cache import (
+    etag_matches,
+    make_etag,
+    not_modified,
+    reference_cache_control,
+    set_cache_headers,
+)
 
 # Create router
 tag_router = APIRouter(prefix="/tag")
@@ -21,8 +30,17 @@ def create_tag(
 
 
 @tag_router.get("", response_model=List[TagResponse])
-def get_all_tags(tag_repository: TagRepository = Depends(get_tag_repository)):
-    """Get all tags"""
+def get_all_tags(
+    request: Request,
+    response: Response,
+    tag_repository: TagRepository = Depends(get_tag_repository),
+    versions: TableVersions = Depends(get_table_versions),
+):
+    """Get all tags (conditional GET via ETag)"""
+    etag = make_etag(Tag.__tablename__, versions.version(Tag.__tablename__))
+    if etag_matches(request, etag):
+        return not_modified(etag, reference_cache_control())
+    set_cache_headers(response, etag, reference_cache_control())
     return tag_repository.get_all()
 
 
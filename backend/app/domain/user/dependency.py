@@ -1,5 +1,62 @@
+from typing import Annotated, Optional, Union
+
+from fastapi import Depends, HTTPException, Request
+from starlette import status
+
+from dependencies.repository_dependencies import get_user_repository
 from domain.user.model import User
+from domain.user.principal import Principal, role_name
+from domain.user.repository import UserRepository
+from infrastructure.redis.redis_client import session_manager
+
+
+def is_admin(user: Union[User, Principal]) -> bool:
+    if isinstance(user, Principal):
+        return user.is_admin
+    return role_name(user).lower() == "admin"
+
+
+def _cached_principal(session: Optional[dict], user_id: int) -> Optional[Principal]:
+    data = session.get("principal") if session else None
+    if not data or data.get("version") != session_manager.principal_version(user_id):
+        return None
+    return Principal.from_session(data)
+
+
+def get_current_user(
+    request: Request,
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> Principal:
+    """
+    Principal des angemeldeten Benutzers aus der Session
+
+    Nur wenn die Session keinen oder einen veralteten Principal enthält
+    (Rolle, Deaktivierung, Passwort oder 2FA geändert), wird der Benutzer aus
+    der Datenbank geladen und die Session aktualisiert.
+    """
+    user_id = getattr(request.state, "user_id", None)
+    if user_id is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    session = getattr(request.state, "session", None)
+    principal = _cached_principal(session, user_id)
+    if principal is not None:
+        return principal
+
+    # Version vor dem Laden lesen: eine parallele Invalidierung erhöht sie
+    # danach und erzwingt beim nächsten Request erneut ein Nachladen
+    version = session_manager.principal_version(user_id)
+    user = user_repo.get_user_by_id(user_id)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    principal = Principal.from_user(user)
+
+    session_id = getattr(request.state, "session_id", None)
+    if session_id:
+        session_manager.update_principal(
+            session_id, dict(principal.to_session(), version=version)
+        )
+    return principal
 
 
-def is_admin(user: User) -> bool:
-    return user.role.name.lower() == "admin"
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
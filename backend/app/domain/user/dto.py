@@ -102,6 +102,7 @@ class ForgotPassword(BaseModel):
 
 
 class ConfirmForgotPassword(BaseModel):
+    email: str
     code: str
     new_password: str
 
@@ -120,6 +121,13 @@ class UserResponse(BaseModel):
     deactivated: bool
 
 
+class UserSessionResponse(BaseModel):
+    session_ref: str
+    created_at: Optional[datetime] = None
+    last_accessed: Optional[datetime] = None
+    expires_at: datetime
+
+
 class RoleUpdate(BaseModel):
     role_name: Literal["user", "admin"] = Field(...)
 
@@ -2,7 +2,17 @@ import uuid
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 from infrastructure.postgresql.db import Base
-from sqlalchemy import Integer, String, DateTime, func, ForeignKey, Boolean, Enum
+from sqlalchemy import (
+    Integer,
+    String,
+    DateTime,
+    func,
+    ForeignKey,
+    Boolean,
+    Enum,
+    Index,
+    text,
+)
 import enum
 from typing import Optional
 from sqlalchemy.orm import Mapped, relationship
@@ -70,6 +80,16 @@ class PasswordResetType(enum.Enum):
 
 class PasswordReset(Base):
     __tablename__ = "pw_reset"
+    __table_args__ = (
+        # Codes sind nur pro Benutzer eindeutig; gesucht wird nur unter den
+        # offenen Resets, benutzte bleiben bis zum Aufräumen außen vor
+        Index(
+            "ix_pw_reset_open_code",
+            "for_user_id",
+            "reset_code",
+            postgresql_where=text("is_used = false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, autoincrement=True, index=True
@@ -77,9 +97,9 @@ class PasswordReset(Base):
     reset_type: Mapped[PasswordResetType] = mapped_column(
         Enum(PasswordResetType), nullable=False
     )
-    reset_code: Mapped[Optional[str]] = mapped_column(String, unique=True, index=True)
+    reset_code: Mapped[Optional[str]] = mapped_column(String)
     reset_token: Mapped[Optional[str]] = mapped_column(String, index=True)
-    expire_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expire_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), onupdate=func.now()
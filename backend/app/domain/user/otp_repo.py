@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from domain.user.model import OtpSettings
 from sqlalchemy import delete
+from infrastructure.redis.redis_client import session_manager
 
 
 class OTPRepo:
@@ -10,10 +11,12 @@ class OTPRepo:
     def save(self, otp_settings: OtpSettings):
         self.session.add(otp_settings)
         self.session.commit()
+        session_manager.invalidate_principal(otp_settings.user_id)
 
     def disable(self, user_id: int):
         self.session.execute(delete(OtpSettings).where(OtpSettings.user_id == user_id))
         self.session.commit()
+        session_manager.invalidate_principal(user_id)
 
     def set_otp_enabled(self, user_id: int):
         self.session.query(OtpSettings).filter(OtpSettings.user_id == user_id).update(
@@ -22,3 +25,4 @@ class OTPRepo:
             }
         )
         self.session.commit()
+        session_manager.invalidate_principal(user_id)
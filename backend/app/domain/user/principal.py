@@ -0,0 +1,55 @@
+from dataclasses import asdict, dataclass
+
+from sqlalchemy.orm import object_session
+
+from domain.common.reference_cache import reference_cache
+from domain.user.model import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Kompakte Benutzerdaten für die Autorisierung
+
+    Wird in der Session gespeichert, damit geschützte Routen ohne
+    Datenbankabfrage prüfen können, wer den Request stellt.
+    """
+
+    id: int
+    role: str
+    deactivated: bool
+    otp_configured: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            role=role_name(user),
+            deactivated=user.deactivated,
+            otp_configured=bool(
+                user.otp_settings and user.otp_settings.otp_configured
+            ),
+        )
+
+    @classmethod
+    def from_session(cls, data: dict) -> "Principal":
+        return cls(
+            id=data["id"],
+            role=data["role"],
+            deactivated=data["deactivated"],
+            otp_configured=data["otp_configured"],
+        )
+
+    def to_session(self) -> dict:
+        return asdict(self)
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role.lower() == "admin"
+
+
+def role_name(user: User) -> str:
+    """Name der Rolle aus dem Stammdaten-Cache, ohne user.role zu laden"""
+    db = object_session(user)
+    role = reference_cache.roles.get(db, user.role_id) if db is not None else None
+    return role["name"] if role else user.role.name
@@ -1,7 +1,11 @@
+from datetime import datetime
+
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from domain.role.model import Role
 from domain.user.model import User, PasswordReset
+from infrastructure.redis.redis_client import session_manager
 
 
 class UserRepository:
@@ -25,26 +29,36 @@ class UserRepository:
     def set_role(self, user_id: int, role_id: int):
         self.db.query(User).filter(User.id == user_id).update({"role_id": role_id})
         self.db.commit()
+        session_manager.invalidate_principal(user_id)
 
     def deactivate_otp(self, user: User):
         self.db.query(User).filter(User.id == user.id).update(
             {"otp_configured": False, "otp_secret": None}
         )
         self.db.commit()
+        session_manager.invalidate_principal(user.id)
 
     def deactivate_user(self, user: User, deactivate_bool: bool):
         self.db.query(User).filter(User.id == user.id).update(
             {"deactivated": deactivate_bool}
         )
         self.db.commit()
+        session_manager.invalidate_principal(user.id)
+        if deactivate_bool:
+            session_manager.revoke_sessions(user.id)
         self.db.refresh(user)
         return user
 
-    def change_password(self, user_id: int, new_password: str):
+    def change_password(
+        self, user_id: int, new_password: str, keep_session_id: str = None
+    ):
+        """Setzt das Passwort und meldet alle anderen Sessions ab"""
         self.db.query(User).filter(User.id == user_id).update(
             {"password": new_password}
         )
         self.db.commit()
+        session_manager.invalidate_principal(user_id)
+        session_manager.revoke_sessions(user_id, except_session_id=keep_session_id)
 
     def create_pw_reset(self, pw_reset: PasswordReset):
         self.db.add(pw_reset)
@@ -69,19 +83,37 @@ class UserRepository:
         )
         self.db.commit()
 
-    def get_pw_reset_by_code(self, code: str):
+    def get_open_pw_reset_by_code(self, email: str, code: str):
+        """Offener Reset mit diesem Code für die E-Mail-Adresse"""
         return (
             self.db.query(PasswordReset)
-            .filter(PasswordReset.reset_code == code)
-            .one_or_none()
+            .join(User, User.id == PasswordReset.for_user_id)
+            .filter(
+                User.email == email,
+                PasswordReset.reset_code == code,
+                # "= false" statt "IS false", damit ix_pw_reset_open_code greift
+                PasswordReset.is_used == False,  # noqa: E712
+            )
+            .order_by(PasswordReset.id.desc())
+            .first()
         )
 
-    def set_pw_reset_code_used(self, reset_code: str):
-        self.db.query(PasswordReset).filter(
-            PasswordReset.reset_code == reset_code
-        ).update(
+    def set_pw_reset_used(self, pw_reset_id: int):
+        self.db.query(PasswordReset).filter(PasswordReset.id == pw_reset_id).update(
             {
                 "is_used": True,
             }
         )
         self.db.commit()
+
+    def purge_pw_resets(self, expired_before: datetime, batch_size: int) -> int:
+        """Löscht bis zu batch_size Resets, die vor expired_before abgelaufen sind"""
+        ids = (
+            select(PasswordReset.id)
+            .where(PasswordReset.expire_date < expired_before)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = self.db.execute(delete(PasswordReset).where(PasswordReset.id.in_(ids)))
+        self.db.commit()
+        return result.rowcount
@@ -7,10 +7,9 @@ import pyotp
 import qrcode
 import secrets
 from datetime import timedelta, datetime
-from jinja2 import Environment, FileSystemLoader, Template
 from loguru import logger
-from fastapi_mail import FastMail, MessageSchema, MessageType
-from infrastructure.mail.client import get_mail_client
+from infrastructure.mail.queue import MailQueue, get_mail_queue
+from infrastructure.mail.templates import render_mail_template
 from domain.role.repository import RoleRepository
 from domain.user.dto import (
     MeResponse,
@@ -23,6 +22,7 @@ from domain.user.dto import (
     RoleUpdate,
     DeactivateUser,
     ConfirmForgotPassword,
+    UserSessionResponse,
 )
 from domain.auth.service import hash_password, verify_password
 from domain.user.model import User, OtpSettings, PasswordReset, PasswordResetType
@@ -36,8 +36,14 @@ from dependencies.repository_dependencies import (
     get_user_repository,
     get_role_repository,
 )
+from dependencies.rate_limit_dependencies import (
+    confirm_forgot_password_rate_limit,
+    forgot_password_rate_limit,
+    verify_2fa_rate_limit,
+)
 from infrastructure.redis.redis_client import session_manager
-from domain.user.dependency import is_admin
+from domain.user.dependency import CurrentUser, is_admin, role_name
+from domain.user.principal import Principal
 from misc.sign import (
     create_signed_token,
     verify_signed_signed_token,
@@ -64,7 +70,7 @@ def get_user_details(
         otp_configured=current_user.otp_settings.otp_configured
         if current_user.otp_settings
         else False,
-        role=current_user.role.name,
+        role=role_name(current_user),
     )
 
 
@@ -131,7 +137,7 @@ def setup_2fa(
     )
 
 
-@user_router.post("/2fa/verify")
+@user_router.post("/2fa/verify", dependencies=[Depends(verify_2fa_rate_limit)])
 async def verify_2fa(
     otp_data: OtpVerify,
     request: Request,
@@ -158,7 +164,9 @@ async def verify_2fa(
     otp_repo.set_otp_enabled(current_user.id)
     # Handle session management only if there's a temp session (login flow)
     if temp_session_id:
-        sid = session_manager.create_session(current_user.id)
+        sid = session_manager.create_session(
+            current_user.id, principal=Principal.from_user(current_user).to_session()
+        )
         response = Response(status_code=status.HTTP_200_OK)
         response.delete_cookie(key=config.temp_session_cookie_id)
         response.set_cookie(
@@ -226,11 +234,10 @@ async def disable_2fa(
 ### User Admin routes
 @user_router.get("", response_model=list[UserResponse])
 def get_users(
-    request: Request, user_repo: UserRepository = Depends(get_user_repository)
+    current_user: CurrentUser,
+    user_repo: UserRepository = Depends(get_user_repository),
 ):
-    user_id = request.state.user_id
-    user = user_repo.get_user_by_id(user_id)
-    if not is_admin(user):
+    if not is_admin(current_user):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
         )
@@ -242,7 +249,7 @@ def get_users(
             last_name=u.last_name,
             email=u.email,
             created_at=u.created_at.isoformat(),
-            role=u.role.name,
+            role=role_name(u),
             deactivated=u.deactivated,
         )
         for u in users
@@ -251,13 +258,12 @@ def get_users(
 
 @user_router.patch("/edit_role/{user_id}")
 def edit_role(
-    request: Request,
     user_id: int,
+    current_user: CurrentUser,
     role_data: RoleUpdate = Body(...),
     user_repo: UserRepository = Depends(get_user_repository),
     role_repo: RoleRepository = Depends(get_role_repository),
 ):
-    current_user = user_repo.get_user_by_id(request.state.user_id)
     if not is_admin(current_user):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -279,12 +285,11 @@ def edit_role(
 
 @user_router.patch("/deactivate/{user_id}", response_model=UserResponse)
 def deactivate(
-    request: Request,
     user_id: int,
+    current_user: CurrentUser,
     deactivate_body: DeactivateUser = Body(...),
     user_repo: UserRepository = Depends(get_user_repository),
 ):
-    current_user = user_repo.get_user_by_id(request.state.user_id)
     if not is_admin(current_user):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
     try:
@@ -296,7 +301,7 @@ def deactivate(
             last_name=user.last_name,
             email=user.email,
             created_at=user.created_at.isoformat(),
-            role=user.role.name,
+            role=role_name(user),
             deactivated=user.deactivated,
         )
     except Exception as e:
@@ -305,19 +310,35 @@ def deactivate(
         )
 
 
+@user_router.get("/{user_id}/sessions", response_model=list[UserSessionResponse])
+def get_user_sessions(user_id: int, current_user: CurrentUser):
+    """Aktive Sessions eines Benutzers (nur Admins)"""
+    if not is_admin(current_user):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    return session_manager.list_sessions(user_id)
+
+
+@user_router.delete("/{user_id}/sessions", status_code=status.HTTP_204_NO_CONTENT)
+def revoke_user_sessions(user_id: int, current_user: CurrentUser):
+    """Meldet einen Benutzer auf allen Geräten ab (nur Admins)"""
+    if not is_admin(current_user):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    session_manager.revoke_sessions(user_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @user_router.post("/admin_reset_password")
-async def admin_reset_password(
-    request: Request,
+def admin_reset_password(
+    current_user: CurrentUser,
     reset_password: ResetPassword = Body(...),
     user_repo: UserRepository = Depends(get_user_repository),
-    mail_client: FastMail = Depends(get_mail_client),
+    mail_queue: MailQueue = Depends(get_mail_queue),
 ):
     """
     Reset password for a user by sending a password reset email.
     Only admins can trigger password resets for other users.
     """
     try:
-        current_user = user_repo.get_user_by_id(request.state.user_id)
         if not is_admin(current_user):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
@@ -345,16 +366,14 @@ async def admin_reset_password(
 
         # Generate reset link
         reset_link = f"{config.frontend_url}/reset-password?token={reset_token_hmac}"
-        with open("./mail_templates/reset_pw.html.jinja", "r") as f:
-            template = Template(f.read())
-            html_content = template.render(reset_link=reset_link)
-            message = MessageSchema(
-                subject="Passwort zurücksetzen",
-                recipients=[target_user.email],
-                body=html_content,
-                subtype=MessageType.html,
-            )
-            await mail_client.send_message(message)
+        html_content = render_mail_template(
+            "reset_pw.html.jinja", reset_link=reset_link
+        )
+        mail_queue.enqueue(
+            subject="Passwort zurücksetzen",
+            recipients=[target_user.email],
+            body=html_content,
+        )
 
         return Response(
             status_code=status.HTTP_204_NO_CONTENT,
@@ -425,59 +444,61 @@ def self_reset_password(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
-    user_repo.change_password(current_user.id, hash_password(body.new_password))
+    user_repo.change_password(
+        current_user.id,
+        hash_password(body.new_password),
+        keep_session_id=request.cookies.get(config.session_cookie_id),
+    )
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@user_router.post("/forgot_password")
-async def email_reset_password(
+@user_router.post(
+    "/forgot_password", dependencies=[Depends(forgot_password_rate_limit)]
+)
+def email_reset_password(
     body: ForgotPassword = Body(...),
     user_repo: UserRepository = Depends(get_user_repository),
-    mail_client: FastMail = Depends(get_mail_client),
+    mail_queue: MailQueue = Depends(get_mail_queue),
 ):
     current_user = user_repo.get_user_by_email(body.email)
     if current_user:
-        with open("./mail_templates/forgot_password.html.jinja", "r") as f:
-            template = Template(f.read())
-            reset_code = generate_forgot_password_code()
-            expire_mins = 15
-            expire_date = datetime.now() + timedelta(minutes=expire_mins)
-            pw_reset = PasswordReset(
-                reset_type=PasswordResetType.FORGOT,
-                reset_code=reset_code,
-                expire_date=expire_date,
-                for_user_id=current_user.id,
-            )
-            user_repo.create_pw_reset(pw_reset)
-            html_content = template.render(code=reset_code)
-            message = MessageSchema(
-                subject="Neues Password vergeben",
-                recipients=[current_user.email],
-                body=html_content,
-                subtype=MessageType.html,
-            )
-            await mail_client.send_message(message)
+        reset_code = generate_forgot_password_code()
+        expire_mins = 15
+        expire_date = datetime.now() + timedelta(minutes=expire_mins)
+        pw_reset = PasswordReset(
+            reset_type=PasswordResetType.FORGOT,
+            reset_code=reset_code,
+            expire_date=expire_date,
+            for_user_id=current_user.id,
+        )
+        user_repo.create_pw_reset(pw_reset)
+        html_content = render_mail_template(
+            "forgot_password.html.jinja", code=reset_code
+        )
+        mail_queue.enqueue(
+            subject="Neues Password vergeben",
+            recipients=[current_user.email],
+            body=html_content,
+        )
 
         return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@user_router.post("/confirm_forgot_password")
+@user_router.post(
+    "/confirm_forgot_password",
+    dependencies=[Depends(confirm_forgot_password_rate_limit)],
+)
 def confirm_forgot_password(
     body: ConfirmForgotPassword = Body(...),
     user_repo: UserRepository = Depends(get_user_repository),
 ):
-    pw_reset = user_repo.get_pw_reset_by_code(body.code)
+    # Benutzte Codes werden nicht gefunden
+    pw_reset = user_repo.get_open_pw_reset_by_code(body.email, body.code)
     if not pw_reset:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND, content="Invitation not found"
         )
 
-    if pw_reset.is_used:
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content="Invitation has already been used",
-        )
-
     from datetime import datetime
 
     if pw_reset.expire_date < datetime.now():
@@ -487,4 +508,4 @@ def confirm_forgot_password(
         )
 
     user_repo.change_password(pw_reset.for_user_id, hash_password(body.new_password))
-    user_repo.set_pw_reset_code_used(body.code)
+    user_repo.set_pw_reset_used(pw_reset.id)
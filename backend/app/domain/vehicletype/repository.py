@@ -4,6 +4,9 @@ from typing import List, Optional
 
 from domain.vehicletype.model import VehicleType
 from domain.vehicletype.dto import VehicleTypeCreate, VehicleTypeUpdate
+from domain.common.reference_cache import reference_cache
+from domain.event.model import event_vehicles
+from domain.event.repository import EventRepository, linked_days
 
 
 class VehicleTypeRepository:
@@ -18,6 +21,7 @@ class VehicleTypeRepository:
 
         self.db.add(db_vehicle)
         self.db.commit()
+        reference_cache.changed(VehicleType.__tablename__)
         self.db.refresh(db_vehicle)
         return db_vehicle
 
@@ -42,40 +46,42 @@ class VehicleTypeRepository:
     def update(
         self, vehicle_id: int, vehicle_data: VehicleTypeUpdate
     ) -> Optional[VehicleType]:
-        """Update a vehicle type"""
-        # First check if the vehicle type exists
-        db_vehicle = self.get_by_id(vehicle_id)
-        if not db_vehicle:
-            return None
-
+        """Update a vehicle type with a single UPDATE ... RETURNING"""
         # Prepare update data
         update_data = {}
         if vehicle_data.name is not None:
             update_data["name"] = vehicle_data.name
 
-        # Execute update if there's data to update
-        if update_data:
-            stmt = (
-                update(VehicleType)
-                .where(VehicleType.id == vehicle_id)
-                .values(**update_data)
-            )
-            self.db.execute(stmt)
-            self.db.commit()
-
-            # Refresh the vehicle type object
+        # Without changes there is nothing to write, a plain read is sufficient
+        if not update_data:
             return self.get_by_id(vehicle_id)
+
+        stmt = (
+            update(VehicleType)
+            .where(VehicleType.id == vehicle_id)
+            .values(**update_data)
+            .returning(VehicleType)
+        )
+        db_vehicle = self.db.execute(stmt).scalar_one_or_none()
+        if db_vehicle:
+            self.db.commit()
+            reference_cache.changed(VehicleType.__tablename__)
         return db_vehicle
 
     def delete(self, vehicle_id: int) -> bool:
-        """Delete a vehicle type"""
-        # First check if the vehicle type exists
-        db_vehicle = self.get_by_id(vehicle_id)
-        if not db_vehicle:
+        """Delete a vehicle type with a single DELETE ... RETURNING"""
+        stmt = (
+            delete(VehicleType)
+            .where(VehicleType.id == vehicle_id)
+            .returning(
+                VehicleType.id, linked_days(event_vehicles.c.vehicle_id, vehicle_id)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        deleted = self.db.execute(stmt).one_or_none()
+        if deleted is None:
             return False
-
-        # Execute delete
-        stmt = delete(VehicleType).where(VehicleType.id == vehicle_id)
-        self.db.execute(stmt)
         self.db.commit()
+        reference_cache.changed(VehicleType.__tablename__)
+        EventRepository(self.db).links_deleted(deleted[1])
         return True
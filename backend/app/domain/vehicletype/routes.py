@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from typing import List
 from sqlalchemy.orm import Session
 
@@ -10,7 +10,16 @@ from domain.vehicletype.dto import (
     VehicleTypeUpdate,
     VehicleTypeResponse,
 )
+from domain.vehicletype.model import VehicleType
 from dependencies.repository_dependencies import get_vehicle_type_repository
+from infrastructure.redis.table_versions import TableVersions, get_table_versions
+from misc.http_cache import (
+    etag_matches,
+    make_etag,
+    not_modified,
+    reference_cache_control,
+    set_cache_headers,
+)
 
 # Create router
 vehicle_router = APIRouter(prefix="/vehicle")
@@ -31,11 +40,19 @@ def create_vehicle_type(
 
 @vehicle_router.get("", response_model=List[VehicleTypeResponse])
 def get_all_vehicle_types(
+    request: Request,
+    response: Response,
     vehicle_type_repository: VehicleTypeRepository = Depends(
         get_vehicle_type_repository
     ),
+    versions: TableVersions = Depends(get_table_versions),
 ):
-    """Get all vehicle types"""
+    """Get all vehicle types (conditional GET via ETag)"""
+    table = VehicleType.__tablename__
+    etag = make_etag(table, versions.version(table))
+    if etag_matches(request, etag):
+        return not_modified(etag, reference_cache_control())
+    set_cache_headers(response, etag, reference_cache_control())
     return vehicle_type_repository.get_all()
 
 
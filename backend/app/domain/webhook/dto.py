@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+
+
+class WebhookEndpointCreate(BaseModel):
+    url: HttpUrl = Field(..., description="Empfänger-URL (POST, JSON)")
+
+
+class WebhookEndpointUpdate(BaseModel):
+    active: bool
+
+
+class WebhookEndpointResponse(BaseModel):
+    id: int
+    url: str
+    active: bool
+    failures: int
+    paused_until: Optional[datetime] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WebhookEndpointCreated(WebhookEndpointResponse):
+    """Enthält das Signatur-Secret, das nur bei der Anlage ausgegeben wird"""
+
+    secret: str
+
+
+class WebhookStats(BaseModel):
+    outbox: int = Field(description="Noch nicht verteilte Änderungen")
+    pending: int
+    delivered: int
+    failed: int
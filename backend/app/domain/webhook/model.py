@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.postgresql.db import Base
+
+PENDING = "pending"
+DELIVERED = "delivered"
+FAILED = "failed"
+
+
+class WebhookEndpoint(Base):
+    """Empfänger-URL eines Partnersystems"""
+
+    __tablename__ = "webhook_endpoint"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    url: Mapped[str] = mapped_column(String(500), nullable=False)
+    secret: Mapped[str] = mapped_column(String(64), nullable=False)
+    active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    created_by_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("user.id", ondelete="SET NULL"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    # Backoff pro Endpoint: aufeinanderfolgende Fehlschläge, Pause bis
+    failures: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    paused_until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Ein Worker hält den Endpoint bis lease_until (ein Batch gleichzeitig),
+    # danach Zeitpunkt der letzten Belieferung
+    lease_until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class WebhookOutbox(Base):
+    """Event-Änderungen, in derselben Transaktion wie die Änderung geschrieben"""
+
+    __tablename__ = "webhook_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
+class WebhookDelivery(Base):
+    """Zustellung einer Änderung an einen Endpoint"""
+
+    __tablename__ = "webhook_delivery"
+    __table_args__ = (
+        # Offene Zustellungen eines Endpoints in Reihenfolge
+        Index(
+            "ix_webhook_delivery_pending",
+            "endpoint_id",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    endpoint_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("webhook_endpoint.id", ondelete="CASCADE"), nullable=False
+    )
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default=PENDING, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), index=True
+    )
+    delivered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
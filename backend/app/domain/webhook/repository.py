@@ -0,0 +1,272 @@
+import secrets
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import (
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from domain.webhook.model import (
+    DELIVERED,
+    FAILED,
+    PENDING,
+    WebhookDelivery,
+    WebhookEndpoint,
+    WebhookOutbox,
+)
+
+
+@dataclass(frozen=True)
+class ClaimedEndpoint:
+    id: int
+    url: str
+    secret: str
+    failures: int
+
+
+class WebhookRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # Verwaltung
+
+    def create_endpoint(self, url: str, created_by_id: int) -> WebhookEndpoint:
+        endpoint = WebhookEndpoint(
+            url=url, secret=secrets.token_urlsafe(32), created_by_id=created_by_id
+        )
+        self.db.add(endpoint)
+        self.db.commit()
+        self.db.refresh(endpoint, ["created_at"])
+        return endpoint
+
+    def get_endpoints(self) -> List[WebhookEndpoint]:
+        query = select(WebhookEndpoint).order_by(WebhookEndpoint.id)
+        return self.db.execute(query).scalars().all()
+
+    def set_active(self, endpoint_id: int, active: bool) -> Optional[WebhookEndpoint]:
+        stmt = (
+            update(WebhookEndpoint)
+            .where(WebhookEndpoint.id == endpoint_id)
+            .values(active=active, failures=0, paused_until=None)
+            .returning(WebhookEndpoint)
+        )
+        endpoint = self.db.execute(stmt).scalar_one_or_none()
+        self.db.commit()
+        return endpoint
+
+    def delete_endpoint(self, endpoint_id: int) -> bool:
+        stmt = (
+            delete(WebhookEndpoint)
+            .where(WebhookEndpoint.id == endpoint_id)
+            .returning(WebhookEndpoint.id)
+            .execution_options(synchronize_session=False)
+        )
+        if self.db.execute(stmt).scalar_one_or_none() is None:
+            return False
+        self.db.commit()
+        return True
+
+    def delivery_stats(self) -> Dict[str, int]:
+        query = select(WebhookDelivery.status, func.count()).group_by(
+            WebhookDelivery.status
+        )
+        stats = {PENDING: 0, DELIVERED: 0, FAILED: 0}
+        stats.update(dict(self.db.execute(query).all()))
+        stats["outbox"] = self.db.execute(
+            select(func.count()).select_from(WebhookOutbox)
+        ).scalar_one()
+        return stats
+
+    # Outbox (in der Transaktion der Event-Änderung)
+
+    def record(self, payloads: List[dict]) -> None:
+        """Schreibt Änderungen in die Outbox, ohne zu committen"""
+        if payloads:
+            self.db.execute(
+                insert(WebhookOutbox), [{"payload": payload} for payload in payloads]
+            )
+
+    # Worker
+
+    def fan_out(self, limit: int) -> int:
+        """
+        Verteilt bis zu limit Outbox-Einträge auf alle aktiven Endpoints
+
+        SKIP LOCKED: mehrere Worker teilen sich die Outbox ohne zu warten.
+        Returns:
+            Anzahl der verarbeiteten Outbox-Einträge
+        """
+        ids = (
+            self.db.execute(
+                select(WebhookOutbox.id)
+                .order_by(WebhookOutbox.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            .scalars()
+            .all()
+        )
+        if not ids:
+            self.db.rollback()
+            return 0
+        rows = (
+            select(
+                WebhookEndpoint.id,
+                WebhookOutbox.payload,
+                literal(PENDING),
+                literal(0),
+                WebhookOutbox.created_at,
+            )
+            .join(WebhookOutbox, WebhookOutbox.id.in_(ids))
+            .where(WebhookEndpoint.active.is_(True))
+            .order_by(WebhookOutbox.id)
+        )
+        self.db.execute(
+            insert(WebhookDelivery).from_select(
+                ["endpoint_id", "payload", "status", "attempts", "created_at"], rows
+            )
+        )
+        self.db.execute(delete(WebhookOutbox).where(WebhookOutbox.id.in_(ids)))
+        self.db.commit()
+        return len(ids)
+
+    def claim_endpoints(self, limit: int, lease: timedelta) -> List[ClaimedEndpoint]:
+        """
+        Reserviert bis zu limit Endpoints mit fälligen Zustellungen
+
+        Ein Endpoint wird nur von einem Worker gleichzeitig beliefert; stirbt der
+        Worker, wird er nach Ablauf von lease wieder frei.
+        """
+        now = func.localtimestamp()
+        candidates = (
+            select(WebhookEndpoint.id)
+            .where(WebhookEndpoint.active.is_(True))
+            .where(
+                or_(
+                    WebhookEndpoint.paused_until.is_(None),
+                    WebhookEndpoint.paused_until <= now,
+                )
+            )
+            .where(
+                or_(
+                    WebhookEndpoint.lease_until.is_(None),
+                    WebhookEndpoint.lease_until <= now,
+                )
+            )
+            .where(
+                exists().where(
+                    WebhookDelivery.endpoint_id == WebhookEndpoint.id,
+                    WebhookDelivery.status == PENDING,
+                )
+            )
+            # Am längsten nicht belieferte Endpoints zuerst
+            .order_by(WebhookEndpoint.lease_until.nulls_first(), WebhookEndpoint.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = self.db.execute(
+            update(WebhookEndpoint)
+            .where(WebhookEndpoint.id.in_(candidates.scalar_subquery()))
+            .values(lease_until=now + lease)
+            .returning(
+                WebhookEndpoint.id,
+                WebhookEndpoint.url,
+                WebhookEndpoint.secret,
+                WebhookEndpoint.failures,
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+        self.db.commit()
+        return [ClaimedEndpoint(*row) for row in claimed]
+
+    def pending_batch(self, endpoint_id: int, limit: int) -> List[Row]:
+        """Älteste offene Zustellungen (id, payload, created_at) eines Endpoints"""
+        query = (
+            select(
+                WebhookDelivery.id, WebhookDelivery.payload, WebhookDelivery.created_at
+            )
+            .where(WebhookDelivery.endpoint_id == endpoint_id)
+            .where(WebhookDelivery.status == PENDING)
+            .order_by(WebhookDelivery.id)
+            .limit(limit)
+        )
+        return self.db.execute(query).all()
+
+    def finish_batch(
+        self,
+        endpoint: ClaimedEndpoint,
+        delivery_ids: List[int],
+        error: Optional[str],
+        max_attempts: int,
+        backoff: timedelta,
+    ) -> None:
+        """
+        Hält das Ergebnis eines Batches fest und gibt den Endpoint frei
+
+        Bei einem Fehler pausiert der Endpoint für backoff; Zustellungen mit
+        max_attempts Versuchen werden als failed abgelegt.
+        """
+        if error is None:
+            self.db.execute(
+                update(WebhookDelivery)
+                .where(WebhookDelivery.id.in_(delivery_ids))
+                .values(
+                    status=DELIVERED,
+                    attempts=WebhookDelivery.attempts + 1,
+                    delivered_at=func.localtimestamp(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            endpoint_values = {"failures": 0, "paused_until": None}
+        else:
+            self.db.execute(
+                update(WebhookDelivery)
+                .where(WebhookDelivery.id.in_(delivery_ids))
+                .values(
+                    attempts=WebhookDelivery.attempts + 1,
+                    last_error=error[:500],
+                    status=case(
+                        (WebhookDelivery.attempts + 1 >= max_attempts, FAILED),
+                        else_=PENDING,
+                    ),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            endpoint_values = {
+                "failures": WebhookEndpoint.failures + 1,
+                "paused_until": func.localtimestamp() + backoff,
+            }
+        self.db.execute(
+            update(WebhookEndpoint)
+            .where(WebhookEndpoint.id == endpoint.id)
+            # lease_until bleibt als Zeitpunkt der letzten Belieferung stehen
+            .values(lease_until=func.localtimestamp(), **endpoint_values)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+
+    def purge_deliveries(self, created_before: datetime, batch_size: int) -> int:
+        """Löscht bis zu batch_size abgeschlossene Zustellungen vor created_before"""
+        ids = (
+            select(WebhookDelivery.id)
+            .where(WebhookDelivery.status != PENDING)
+            .where(WebhookDelivery.created_at < created_before)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            delete(WebhookDelivery).where(WebhookDelivery.id.in_(ids))
+        )
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,88 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from dependencies.repository_dependencies import get_webhook_repository
+from domain.user.dependency import CurrentUser, is_admin
+from domain.webhook.dto import (
+    WebhookEndpointCreate,
+    WebhookEndpointCreated,
+    WebhookEndpointResponse,
+    WebhookEndpointUpdate,
+    WebhookStats,
+)
+from domain.webhook.repository import WebhookRepository
+
+webhook_router = APIRouter(prefix="/webhook")
+
+
+def _require_admin(current_user) -> None:
+    if not is_admin(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can manage webhooks",
+        )
+
+
+@webhook_router.post(
+    "", response_model=WebhookEndpointCreated, status_code=status.HTTP_201_CREATED
+)
+def create_webhook(
+    data: WebhookEndpointCreate,
+    current_user: CurrentUser,
+    repository: WebhookRepository = Depends(get_webhook_repository),
+):
+    """Register a partner endpoint; the signing secret is only returned here"""
+    _require_admin(current_user)
+    return repository.create_endpoint(str(data.url), current_user.id)
+
+
+@webhook_router.get("", response_model=List[WebhookEndpointResponse])
+def get_webhooks(
+    current_user: CurrentUser,
+    repository: WebhookRepository = Depends(get_webhook_repository),
+):
+    _require_admin(current_user)
+    return repository.get_endpoints()
+
+
+@webhook_router.get("/stats", response_model=WebhookStats)
+def get_webhook_stats(
+    current_user: CurrentUser,
+    repository: WebhookRepository = Depends(get_webhook_repository),
+):
+    _require_admin(current_user)
+    return repository.delivery_stats()
+
+
+@webhook_router.patch("/{endpoint_id}", response_model=WebhookEndpointResponse)
+def update_webhook(
+    endpoint_id: int,
+    data: WebhookEndpointUpdate,
+    current_user: CurrentUser,
+    repository: WebhookRepository = Depends(get_webhook_repository),
+):
+    """Pause or resume an endpoint (resets its backoff)"""
+    _require_admin(current_user)
+    endpoint = repository.set_active(endpoint_id, data.active)
+    if endpoint is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Webhook with ID {endpoint_id} not found",
+        )
+    return endpoint
+
+
+@webhook_router.delete("/{endpoint_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_webhook(
+    endpoint_id: int,
+    current_user: CurrentUser,
+    repository: WebhookRepository = Depends(get_webhook_repository),
+):
+    _require_admin(current_user)
+    if not repository.delete_endpoint(endpoint_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Webhook with ID {endpoint_id} not found",
+        )
+    return None
@@ -9,6 +9,8 @@ from typing import Optional, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from infrastructure.metrics.prometheus import GEOCODE_CACHE_LOOKUPS
+
 
 @dataclass
 class GeocodeResult:
@@ -56,7 +58,9 @@ class NominatimService:
             cached_result, timestamp = self._cache[cache_key]
             if datetime.now() - timestamp < self._cache_timeout:
                 loguru.logger.debug(f"Geocoding Cache Hit für: {city_name}")
+                GEOCODE_CACHE_LOOKUPS.labels("hit").inc()
                 return cached_result
+        GEOCODE_CACHE_LOOKUPS.labels("miss").inc()
         
         try:
             params = {
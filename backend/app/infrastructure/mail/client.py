@@ -1,13 +1,15 @@
 from fastapi_mail import ConnectionConfig, FastMail, MessageSchema
+from config.config_provider import get_config
 
+config = get_config()
 
 __mail_config = ConnectionConfig(
     MAIL_USERNAME="user",
     MAIL_PASSWORD="test",
-    MAIL_FROM="mail@mail.com",
-    MAIL_PORT=1025,
-    MAIL_SERVER="mailserver",
-    MAIL_FROM_NAME="Fire Map",
+    MAIL_FROM=config.mail_from,
+    MAIL_PORT=config.mail_port,
+    MAIL_SERVER=config.mail_server,
+    MAIL_FROM_NAME=config.mail_from_name,
     MAIL_STARTTLS=False,
     MAIL_SSL_TLS=False,
     USE_CREDENTIALS=False,
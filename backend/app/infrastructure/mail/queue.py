@@ -0,0 +1,92 @@
+"""
+Redis-basierte Outbox für ausgehende Mails
+
+Die API legt Mails nur in die Queue, der Versand erfolgt asynchron durch
+den Mail-Worker (workers/mail_worker.py). Redis läuft mit AOF-Persistenz,
+sodass eingereihte Mails einen Neustart überstehen.
+"""
+
+import json
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from infrastructure.redis.redis_client import client
+from infrastructure.redis.worker_heartbeat import WorkerHeartbeats
+
+# Redis-Keys der Queue
+PENDING_KEY = "mail_queue:pending"  # LIST, LPUSH beim Einreihen, Worker liest rechts
+PROCESSING_PREFIX = "mail_queue:processing:"  # LIST pro Worker, in Bearbeitung
+RETRY_KEY = "mail_queue:retry"  # ZSET, Score = Zeitpunkt des nächsten Versuchs
+DEAD_KEY = "mail_queue:dead"  # LIST, endgültig fehlgeschlagene Mails
+
+
+class MailQueue:
+    """Outbox für ausgehende Mails"""
+
+    def __init__(self, redis_client: redis.Redis = client):
+        self.redis = redis_client
+
+    def enqueue(
+        self,
+        subject: str,
+        recipients: List[str],
+        body: str,
+        subtype: str = "html",
+    ) -> str:
+        """
+        Reiht eine Mail zum Versand ein
+
+        Args:
+            subject: Betreff
+            recipients: Empfängeradressen
+            body: Inhalt der Mail
+            subtype: "html" oder "plain"
+
+        Returns:
+            Die ID des Mail-Jobs
+        """
+        job = {
+            "id": uuid.uuid4().hex,
+            "subject": subject,
+            "recipients": recipients,
+            "body": body,
+            "subtype": subtype,
+            "attempts": 0,
+            "created_at": time.time(),
+        }
+        self.redis.lpush(PENDING_KEY, encode_job(job))
+        WorkerHeartbeats(self.redis).warn_if_missing("mail")
+        return job["id"]
+
+    def stats(self) -> Dict[str, int]:
+        """Anzahl der Mails je Zustand"""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.llen(PENDING_KEY)
+        pipe.zcard(RETRY_KEY)
+        pipe.llen(DEAD_KEY)
+        pending, retrying, dead = pipe.execute()
+        return {"pending": pending, "retrying": retrying, "dead": dead}
+
+
+def encode_job(job: Dict[str, Any]) -> str:
+    return json.dumps(job, separators=(",", ":"))
+
+
+def decode_job(raw: str) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+
+
+mail_queue = MailQueue()
+
+
+def get_mail_queue() -> MailQueue:
+    """
+    Dependency to inject the mail queue
+    """
+    return mail_queue
@@ -0,0 +1,71 @@
+"""
+Registry für die Mail-Templates
+
+Alle Templates aus mail_template_dir werden beim Start der Anwendung einmal
+kompiliert (mit Bytecode-Cache auf der Platte) und danach aus dem Speicher
+der gemeinsamen Jinja-Environment gerendert.
+"""
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
+from loguru import logger
+from markupsafe import escape
+
+from config.config_provider import get_config
+
+config = get_config()
+
+TEMPLATE_EXTENSION = "jinja"
+
+# Platzhalter im alten Format {name}, die in extern gepflegten Kopien dieser
+# Templates noch vorkommen können (früher per str.replace ersetzt)
+LEGACY_PLACEHOLDERS = {"invite.html.jinja": ("invite_link",)}
+
+_environment = Environment(
+    loader=FileSystemLoader(config.mail_template_dir),
+    bytecode_cache=FileSystemBytecodeCache(config.mail_template_cache_dir),
+    autoescape=select_autoescape(enabled_extensions=("html.jinja",)),
+    # Templates ändern sich nur mit einem Deployment, kein stat() pro Render
+    auto_reload=False,
+)
+
+
+def load_mail_templates() -> int:
+    """
+    Kompiliert alle Mail-Templates vorab
+
+    Returns:
+        Anzahl der geladenen Templates
+    """
+    names = _environment.list_templates(extensions=[TEMPLATE_EXTENSION])
+    for name in names:
+        _environment.get_template(name)
+    logger.info(f"{len(names)} Mail-Templates geladen aus {config.mail_template_dir}")
+    return len(names)
+
+
+def render_mail_template(name: str, **context) -> str:
+    """
+    Rendert ein Mail-Template
+
+    Für die Templates aus LEGACY_PLACEHOLDERS werden auch Platzhalter im alten
+    Format {name} ersetzt, mit escapten Werten wie bei {{ name }}.
+
+    Args:
+        name: Dateiname des Templates, z.B. "invite.html.jinja"
+        **context: Variablen für das Template
+
+    Returns:
+        Der gerenderte Inhalt
+    """
+    content = _environment.get_template(name).render(**context)
+    for key in LEGACY_PLACEHOLDERS.get(name, ()):
+        placeholder = f"{{{key}}}"
+        if placeholder in content:
+            logger.warning(f"Mail-Template {name} nutzt noch {placeholder}")
+            content = content.replace(placeholder, str(escape(context[key])))
+    return content
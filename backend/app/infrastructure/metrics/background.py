@@ -0,0 +1,34 @@
+"""
+Zustand der Hintergrund-Worker für /metrics
+
+Wird bei jedem Scrape aus Redis gelesen. Alarmregeln, z.B.:
+background_worker_up == 0 oder background_queue_depth{queue="mail_pending"}
+über längere Zeit > 0.
+"""
+
+import loguru
+import redis
+
+from infrastructure.mail.queue import MailQueue
+from infrastructure.metrics.prometheus import (
+    BACKGROUND_QUEUE_DEPTH,
+    BACKGROUND_WORKER_UP,
+)
+from infrastructure.redis.redis_client import client
+from infrastructure.redis.rollup_dirty_days import DIRTY_DAYS_KEY
+from infrastructure.redis.worker_heartbeat import WorkerHeartbeats
+
+
+def update_background_metrics(redis_client: redis.Redis = client) -> None:
+    try:
+        running = WorkerHeartbeats(redis_client).running()
+        mails = MailQueue(redis_client).stats()
+        dirty_days = redis_client.scard(DIRTY_DAYS_KEY)
+    except redis.RedisError as e:
+        loguru.logger.warning(f"Zustand der Worker nicht gelesen: {e}")
+        return
+    for worker, up in running.items():
+        BACKGROUND_WORKER_UP.labels(worker).set(int(up))
+    for state, count in mails.items():
+        BACKGROUND_QUEUE_DEPTH.labels(f"mail_{state}").set(count)
+    BACKGROUND_QUEUE_DEPTH.labels("statistics_dirty_days").set(dirty_days)
@@ -0,0 +1,67 @@
+"""
+ASGI-Middleware für Latenz- und SQL-Metriken pro Route
+
+Als reine ASGI-Middleware (ohne BaseHTTPMiddleware) entsteht kein zusätzlicher
+Task und kein Request-Objekt pro Anfrage.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config.config_provider import get_config
+from infrastructure.metrics.prometheus import (
+    DB_QUERIES_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+    UNMATCHED_ROUTE,
+    RequestStats,
+    request_stats,
+)
+from infrastructure.postgresql.profiling import log_request_profile
+
+config = get_config()
+
+
+class PrometheusMiddleware:
+    def __init__(self, app: ASGIApp, excluded_paths: tuple = ()):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec()
+            request_stats.reset(token)
+            # Der Router trägt die gematchte Route in denselben Scope ein
+            route = scope.get("route")
+            route_label = getattr(route, "path_format", None) or UNMATCHED_ROUTE
+            REQUEST_LATENCY.labels(
+                scope["method"], route_label, str(status_code)
+            ).observe(elapsed)
+            DB_QUERIES_PER_REQUEST.labels(route_label).observe(stats.query_count)
+            DB_TIME_PER_REQUEST.labels(route_label).observe(stats.query_seconds)
+            if (
+                stats.statements
+                and stats.query_seconds * 1000 >= config.slow_request_sql_ms
+            ):
+                log_request_profile(route_label, stats)
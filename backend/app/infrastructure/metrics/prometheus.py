@@ -0,0 +1,181 @@
+"""
+Prometheus-Metriken der API
+
+Läuft die API unter gunicorn mit mehreren Workern, muss PROMETHEUS_MULTIPROC_DIR
+vor dem Start auf ein leeres Verzeichnis zeigen. prometheus_client schreibt die
+Werte dann pro Prozess in mmap-Dateien und /metrics aggregiert über alle Worker
+(siehe gunicorn.conf.py für das Aufräumen beendeter Worker).
+"""
+
+import hmac
+import os
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Route-Label für Anfragen ohne passende Route (404, 401 aus der Middleware),
+# damit rohe Pfade die Kardinalität nicht sprengen
+UNMATCHED_ROUTE = "__unmatched__"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Dauer der HTTP-Anfragen",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Gerade bearbeitete HTTP-Anfragen",
+    multiprocess_mode="livesum",
+)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Dauer einzelner SQL-Statements",
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Anzahl der SQL-Statements pro HTTP-Anfrage",
+    ["route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Summierte SQL-Dauer pro HTTP-Anfrage",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Offene Verbindungen im SQLAlchemy-Pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Aus dem SQLAlchemy-Pool ausgeliehene Verbindungen",
+    multiprocess_mode="livesum",
+)
+
+SESSION_LOOKUP_LATENCY = Histogram(
+    "redis_session_lookup_duration_seconds",
+    "Dauer des Session-Lookups in Redis",
+    ["result"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+# Trefferquote: rate(..{result="hit"}) / rate(..) in PromQL
+GEOCODE_CACHE_LOOKUPS = Counter(
+    "geocode_cache_lookups_total",
+    "Lookups im Nominatim-Cache",
+    ["result"],
+)
+
+HEATMAP_TILE_CACHE_LOOKUPS = Counter(
+    "heatmap_tile_cache_lookups_total",
+    "Lookups im Redis-Cache der Heatmap-Kacheln",
+    ["result"],
+)
+
+QUERY_CACHE_LOOKUPS = Counter(
+    "query_cache_lookups_total",
+    "Lookups im Redis-Cache der Aggregat-Abfragen",
+    ["query", "result"],
+)
+
+RATE_LIMITED_REQUESTS = Counter(
+    "rate_limited_requests_total",
+    "Mit 429 abgewiesene Anfragen",
+    ["route"],
+)
+
+EVENT_STREAM_CONNECTIONS = Gauge(
+    "event_stream_connections",
+    "Offene SSE-Verbindungen des Event-Streams",
+    multiprocess_mode="livesum",
+)
+EVENT_STREAM_RESYNCS = Counter(
+    "event_stream_resyncs_total",
+    "Wegen voller Queue verworfene Streams (Client muss neu laden)",
+)
+
+# Beim Scrape von /metrics aus Redis gesetzt (infrastructure/metrics/background.py)
+BACKGROUND_WORKER_UP = Gauge(
+    "background_worker_up",
+    "1, wenn der Worker ein aktuelles Lebenszeichen in Redis hat",
+    ["worker"],
+    multiprocess_mode="mostrecent",
+)
+BACKGROUND_QUEUE_DEPTH = Gauge(
+    "background_queue_depth",
+    "Wartende Aufträge der Hintergrund-Worker",
+    ["queue"],
+    multiprocess_mode="mostrecent",
+)
+
+
+@dataclass
+class RequestStats:
+    """SQL-Statistik der laufenden Anfrage"""
+
+    query_count: int = 0
+    query_seconds: float = 0.0
+    # Normalisiertes SQL -> [Anzahl, Sekunden], nur bei aktivem SQL-Profiling
+    statements: Optional[Dict[str, list]] = None
+
+
+# Wird von der Middleware pro Anfrage gesetzt. Sync-Routen laufen im Threadpool
+# mit einer Kopie des Kontexts, teilen sich aber dasselbe RequestStats-Objekt.
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def record_query(duration: float, normalized_sql: Optional[str] = None) -> None:
+    """Erfasst ein ausgeführtes SQL-Statement"""
+    DB_QUERY_DURATION.observe(duration)
+    stats = request_stats.get()
+    if stats is not None:
+        stats.query_count += 1
+        stats.query_seconds += duration
+        if normalized_sql is not None:
+            if stats.statements is None:
+                stats.statements = {}
+            entry = stats.statements.setdefault(normalized_sql, [0, 0.0])
+            entry[0] += 1
+            entry[1] += duration
+
+
+def metrics_token_valid(authorization: Optional[str], token: str) -> bool:
+    """Prüft den Header "Authorization: Bearer <token>" (zeitkonstant)"""
+    scheme, _, value = (authorization or "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(
+        value.encode(), token.encode()
+    )
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Serialisiert alle Metriken im Prometheus-Textformat
+
+    Returns:
+        Inhalt und Content-Type
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
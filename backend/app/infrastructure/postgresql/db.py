@@ -1,7 +1,16 @@
-from sqlalchemy import URL, create_engine
+import time
+
+from sqlalchemy import URL, create_engine, event
 from config.config_provider import get_config
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+from infrastructure.metrics.prometheus import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CONNECTIONS,
+    record_query,
+)
+from infrastructure.postgresql.profiling import log_slow_query, normalize_sql
+
 settings = get_config()
 
 url = URL.create(
@@ -14,11 +23,71 @@ url = URL.create(
 )
 
 engine = create_engine(url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: Objekte aus UPDATE ... RETURNING bleiben nach dem
+# Commit gültig und werden beim Serialisieren nicht erneut geladen
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 Base = declarative_base()
 
 
+# Zeitmessung pro Statement; der Startzeitpunkt liegt als Stack in conn.info,
+# da Statements auf derselben Verbindung nicht überlappen
+@event.listens_for(engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    record_query(
+        duration, normalize_sql(statement) if settings.sql_profile_requests else None
+    )
+    if duration * 1000 >= settings.slow_query_threshold_ms:
+        log_slow_query(
+            conn.connection.dbapi_connection,
+            statement,
+            parameters,
+            executemany,
+            duration,
+        )
+
+
+@event.listens_for(engine, "handle_error")
+def _handle_error(exception_context):
+    # Fehlgeschlagene Statements erreichen after_cursor_execute nicht
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+@event.listens_for(engine.pool, "connect")
+def _pool_connect(dbapi_connection, connection_record):
+    DB_POOL_CONNECTIONS.inc()
+
+
+@event.listens_for(engine.pool, "close")
+def _pool_close(dbapi_connection, connection_record):
+    DB_POOL_CONNECTIONS.dec()
+
+
+@event.listens_for(engine.pool, "detach")
+def _pool_detach(dbapi_connection, connection_record):
+    DB_POOL_CONNECTIONS.dec()
+
+
+@event.listens_for(engine.pool, "checkout")
+def _pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_CHECKED_OUT.inc()
+
+
+@event.listens_for(engine.pool, "checkin")
+def _pool_checkin(dbapi_connection, connection_record):
+    DB_POOL_CHECKED_OUT.dec()
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -0,0 +1,117 @@
+"""
+Slow-Query-Log und SQL-Profiling
+
+Wird von den Cursor-Hooks in db.py aufgerufen. Die Messung dort ist die einzige
+Zeitquelle, sie speist sowohl die Prometheus-Metriken als auch dieses Log.
+"""
+
+import random
+import re
+from typing import Any, Dict, Optional
+
+import loguru
+from psycopg import ClientCursor
+
+from config.config_provider import get_config
+
+config = get_config()
+
+_WHITESPACE = re.compile(r"\s+")
+# Von SQLAlchemy expandierte IN-Listen: (%(id_1_1)s, %(id_1_2)s, ...)
+_EXPANDED_IN = re.compile(r"\(\s*%\((\w+?)_\d+\)s(?:\s*,\s*%\(\1_\d+\)s)*\s*\)")
+_EXPANDED_PARAM = re.compile(r"^(\w+_\d+)_\d+$")
+MAX_SQL_LENGTH = 2000
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Vereinheitlicht ein Statement für Log und Profil: Whitespace wird
+    zusammengefasst, expandierte IN-Listen werden unabhängig von ihrer Länge
+    zu (...)
+    """
+    statement = _EXPANDED_IN.sub(r"(%(\1_*)s)", statement)
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return statement[:MAX_SQL_LENGTH]
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Beschreibt die gebundenen Parameter nur über Namen und Typen, damit keine
+    Nutzerdaten (E-Mails, Hashes) im Log landen
+
+    Returns:
+        z.B. {"id_1_*": "int[37]", "name_1": "str"}
+    """
+    if executemany:
+        if not parameters:
+            return "0 x {}"
+        return f"{len(parameters)} x {parameter_shape(parameters[0])}"
+    if not isinstance(parameters, dict):
+        return [type(value).__name__ for value in parameters or ()]
+
+    shape: Dict[str, list] = {}
+    for name, value in parameters.items():
+        match = _EXPANDED_PARAM.match(name)
+        key = f"{match.group(1)}_*" if match else name
+        entry = shape.setdefault(key, [type(value).__name__, 0, bool(match)])
+        entry[1] += 1
+    return {
+        key: f"{type_name}[{count}]" if expanded else type_name
+        for key, (type_name, count, expanded) in shape.items()
+    }
+
+
+def log_slow_query(
+    dbapi_connection,
+    statement: str,
+    parameters: Any,
+    executemany: bool,
+    duration: float,
+) -> None:
+    """Loggt ein Statement über dem Schwellwert, ggf. mit Ausführungsplan"""
+    plan: Optional[str] = None
+    if (
+        not executemany
+        and config.slow_query_explain_sample_rate > 0
+        and statement.lstrip()[:6].upper() == "SELECT"
+        and random.random() < config.slow_query_explain_sample_rate
+    ):
+        plan = explain(dbapi_connection, statement, parameters)
+
+    loguru.logger.warning(
+        f"Slow query ({duration * 1000:.1f} ms): {normalize_sql(statement)} "
+        f"params={parameter_shape(parameters, executemany)}"
+        + (f"\n{plan}" if plan else "")
+    )
+
+
+def explain(dbapi_connection, statement: str, parameters: Any) -> Optional[str]:
+    """
+    Führt EXPLAIN (ANALYZE, BUFFERS) für ein SELECT erneut aus
+
+    Läuft auf einem eigenen Cursor in einem Savepoint, der immer zurückgerollt
+    wird; ein Fehler bricht so nicht die Transaktion der Anfrage ab. Die
+    Parameter werden clientseitig eingesetzt, da EXPLAIN als Utility-Statement
+    keine serverseitig gebundenen Parameter annimmt.
+    """
+    try:
+        with dbapi_connection.transaction(force_rollback=True):
+            with ClientCursor(dbapi_connection) as cursor:
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                return "\n".join(row[0] for row in cursor.fetchall())
+    except Exception as e:
+        loguru.logger.debug(f"EXPLAIN für Slow Query fehlgeschlagen: {e}")
+        return None
+
+
+def log_request_profile(route: str, stats) -> None:
+    """Loggt die teuersten Statements einer langsamen Anfrage"""
+    top = sorted(stats.statements.items(), key=lambda item: item[1][1], reverse=True)
+    lines = [
+        f"  {count}x {seconds * 1000:.1f} ms  {sql}"
+        for sql, (count, seconds) in top[:10]
+    ]
+    loguru.logger.warning(
+        f"SQL-Profil {route}: {stats.query_count} Statements, "
+        f"{stats.query_seconds * 1000:.1f} ms\n" + "\n".join(lines)
+    )
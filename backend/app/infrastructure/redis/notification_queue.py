@@ -0,0 +1,58 @@
+"""
+Benachrichtigungen pro Benutzer (Redis-Listen)
+
+Neue Events in abonnierten Gebieten werden in die Liste des Benutzers
+eingereiht und beim Abruf über /subscription/notifications entnommen. Jede
+Liste ist auf notification_queue_max_length Einträge begrenzt und läuft nach
+notification_queue_ttl_seconds ohne neue Einträge ab.
+"""
+
+import json
+from typing import Dict, Iterable, List
+
+import redis
+
+from config.config_provider import get_config
+from infrastructure.redis.redis_client import client
+
+config = get_config()
+
+USER_PREFIX = "notifications:user:"
+
+
+class NotificationQueue:
+    def __init__(self, redis_client: redis.Redis = client):
+        self.redis = redis_client
+
+    def push(self, notifications: Iterable[Dict]) -> int:
+        """Reiht Benachrichtigungen ({"user_id": ..., ...}) in einem Roundtrip ein"""
+        pipe = self.redis.pipeline(transaction=False)
+        count = 0
+        for notification in notifications:
+            key = f"{USER_PREFIX}{notification['user_id']}"
+            pipe.lpush(key, json.dumps(notification, separators=(",", ":")))
+            pipe.ltrim(key, 0, config.notification_queue_max_length - 1)
+            pipe.expire(key, config.notification_queue_ttl_seconds)
+            count += 1
+        if count:
+            pipe.execute()
+        return count
+
+    def pop_all(self, user_id: int) -> List[Dict]:
+        """Entnimmt alle Benachrichtigungen eines Benutzers, älteste zuerst"""
+        key = f"{USER_PREFIX}{user_id}"
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.lrange(key, 0, -1)
+        pipe.delete(key)
+        raw, _ = pipe.execute()
+        return [json.loads(item) for item in reversed(raw)]
+
+
+notification_queue = NotificationQueue()
+
+
+def get_notification_queue() -> NotificationQueue:
+    """
+    Dependency to inject the notification queue
+    """
+    return notification_queue
@@ -0,0 +1,71 @@
+"""
+Cache für Aggregat-Abfragen (JSON in Redis)
+
+Schlüssel enthalten die aktuelle Version der abgefragten Tabelle
+(table_versions): Nach einer Änderung wird der alte Eintrag nicht mehr
+gelesen und läuft per TTL ab, ein explizites Löschen ist nicht nötig.
+
+Ist Redis nicht erreichbar, liefert der Cache keine Treffer und speichert
+nichts; die Abfrage läuft dann direkt gegen die Datenbank.
+"""
+
+import json
+from typing import Any, Optional
+
+import loguru
+import redis
+
+from infrastructure.metrics.prometheus import QUERY_CACHE_LOOKUPS
+from infrastructure.redis.redis_client import client
+from infrastructure.redis.table_versions import TableVersions, table_versions
+
+CACHE_PREFIX = "query_cache:"
+
+
+class QueryCache:
+    def __init__(
+        self,
+        redis_client: redis.Redis = client,
+        versions: TableVersions = table_versions,
+    ):
+        self.redis = redis_client
+        self.versions = versions
+
+    def key(self, name: str, table: str, params: str) -> Optional[str]:
+        """Schlüssel für die aktuelle Version von table oder None ohne Redis"""
+        try:
+            version = self.versions.version(table)
+        except redis.RedisError as e:
+            loguru.logger.warning(f"Query-Cache nicht verfügbar: {e}")
+            return None
+        return f"{CACHE_PREFIX}{name}:{version}:{params}"
+
+    def get(self, name: str, key: Optional[str]) -> Optional[Any]:
+        if key is None:
+            return None
+        try:
+            raw = self.redis.get(key)
+        except redis.RedisError as e:
+            loguru.logger.warning(f"Query-Cache nicht gelesen: {e}")
+            return None
+        QUERY_CACHE_LOOKUPS.labels(name, "hit" if raw else "miss").inc()
+        return json.loads(raw) if raw else None
+
+    def set(self, key: Optional[str], value: Any, ttl_seconds: int) -> None:
+        if key is None:
+            return
+        try:
+            raw = json.dumps(value, separators=(",", ":"))
+            self.redis.set(key, raw, ex=ttl_seconds)
+        except redis.RedisError as e:
+            loguru.logger.warning(f"Query-Cache nicht gespeichert: {e}")
+
+
+query_cache = QueryCache()
+
+
+def get_query_cache() -> QueryCache:
+    """
+    Dependency to inject the query cache
+    """
+    return query_cache
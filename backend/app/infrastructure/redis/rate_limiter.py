@@ -0,0 +1,106 @@
+"""
+Verteiltes Rate Limiting mit Token Buckets in Redis
+
+Jeder Bucket ist ein Hash mit Füllstand und Zeitpunkt der letzten Entnahme.
+Alle Buckets einer Anfrage (z.B. pro IP und pro Konto) werden in einem
+Skriptaufruf geprüft: Nur wenn jeder Bucket einen Token hat, wird aus allen
+entnommen. Die Zeit kommt von Redis, damit die Worker nicht von ihren
+Systemuhren abhängen.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import loguru
+import redis
+
+from infrastructure.redis.redis_client import client
+
+KEY_PREFIX = "rate_limit:"
+
+# KEYS: Buckets
+# ARGV: je Bucket Kapazität und Nachfüllrate (Tokens pro ms)
+# Rückgabe: 0 wenn erlaubt, sonst Wartezeit in ms bis zum nächsten Token
+_TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local levels = {}
+local retry = 0
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local level = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    level = math.min(capacity, level + math.max(0, now - ts) * rate)
+    levels[i] = level
+    if level < 1 then
+        retry = math.max(retry, math.ceil((1 - level) / rate))
+    end
+end
+if retry > 0 then
+    return retry
+end
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    redis.call('HSET', KEYS[i], 'tokens', levels[i] - 1, 'ts', now)
+    redis.call('PEXPIRE', KEYS[i], math.ceil(capacity / rate))
+end
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Höchstens `requests` Anfragen pro `seconds`, Bursts bis `requests`"""
+
+    requests: int
+    seconds: float
+
+    @property
+    def tokens_per_ms(self) -> float:
+        return self.requests / (self.seconds * 1000)
+
+
+class RateLimiter:
+    def __init__(self, redis_client: redis.Redis = client):
+        self.redis = redis_client
+        self._script = self.redis.register_script(_TOKEN_BUCKET_SCRIPT)
+
+    def hit(self, buckets: Sequence[Tuple[str, RateLimit]]) -> Optional[float]:
+        """
+        Entnimmt einen Token aus allen Buckets
+
+        Args:
+            buckets: Paare aus Schlüssel (ohne Prefix) und Limit
+
+        Returns:
+            None wenn erlaubt, sonst Sekunden bis zum nächsten Versuch
+        """
+        if not buckets:
+            return None
+        keys = [f"{KEY_PREFIX}{key}" for key, _ in buckets]
+        args = []
+        for _, limit in buckets:
+            args.extend((limit.requests, repr(limit.tokens_per_ms)))
+        try:
+            retry_ms = self._script(keys=keys, args=args, client=self.redis)
+        except redis.RedisError as e:
+            # Ohne Redis lieber durchlassen als Login komplett zu sperren
+            loguru.logger.warning(f"Rate Limiting nicht verfügbar: {e}")
+            return None
+        return retry_ms / 1000 if retry_ms else None
+
+    def reset(self, key: str) -> None:
+        self.redis.delete(f"{KEY_PREFIX}{key}")
+
+
+rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Dependency to inject the rate limiter
+    """
+    return rate_limiter
@@ -1,10 +1,17 @@
-import loguru
 import redis
-import json
+import hashlib
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, List
 from config.config_provider import get_config
+from infrastructure.metrics.prometheus import SESSION_LOOKUP_LATENCY
+from infrastructure.redis.session_codec import (
+    decode_legacy_session,
+    decode_session,
+    encode_fields,
+    encode_session,
+)
 
 config = get_config()
 
@@ -16,6 +23,69 @@ client = redis.Redis(
     decode_responses=True,
 )
 
+# Für Binärdaten (z.B. PNG-Kacheln), teilt sich keine Verbindungen mit client
+binary_client = redis.Redis(
+    host=config.redis_host,
+    port=config.redis_port,
+    db=config.redis_db,
+)
+
+
+# Löscht alle Sessions und 2FA-Sessions eines Benutzers atomar, damit keine
+# parallel angelegte Session die Sperrung überlebt. Die Session-Keys werden im
+# Skript aus dem Index gebildet (nur ohne Redis Cluster zulässig).
+# Sessions aus Versionen vor dem ZSET-Index stehen nur im alten SET und
+# werden ebenfalls gelöscht, bis dieses per TTL ausgelaufen ist.
+# KEYS: Session-Index (ZSET), Index der 2FA-Sessions (SET), alter Index (SET)
+# ARGV: Session-Prefix, 2FA-Session-Prefix, auszunehmende Session-ID
+_REVOKE_SESSIONS_SCRIPT = """
+local removed = 0
+for _, id in ipairs(redis.call('ZRANGE', KEYS[1], 0, -1)) do
+    if id ~= ARGV[3] then
+        removed = removed + redis.call('DEL', ARGV[1] .. id)
+        redis.call('ZREM', KEYS[1], id)
+    end
+end
+for _, id in ipairs(redis.call('SMEMBERS', KEYS[3])) do
+    if id ~= ARGV[3] then
+        removed = removed + redis.call('DEL', ARGV[1] .. id)
+        redis.call('SREM', KEYS[3], id)
+    end
+end
+for _, id in ipairs(redis.call('SMEMBERS', KEYS[2])) do
+    redis.call('DEL', ARGV[2] .. id)
+end
+redis.call('DEL', KEYS[2])
+return removed
+"""
+
+# Liest eine Session und setzt die übergebenen Felder in einem Roundtrip.
+# Nur existierende Hashes werden geschrieben, damit keine Session ohne TTL
+# entsteht. Alte JSON-Sessions werden mit TTL zur Migration zurückgegeben.
+# KEYS: Session-Key
+# ARGV: Feld, Wert, Feld, Wert, ...
+_READ_SESSION_SCRIPT = """
+local kind = redis.call('TYPE', KEYS[1])['ok']
+if kind == 'hash' then
+    if #ARGV > 0 then
+        redis.call('HSET', KEYS[1], unpack(ARGV))
+    end
+    return {'hash', redis.call('HGETALL', KEYS[1])}
+elseif kind == 'string' then
+    return {'json', redis.call('GET', KEYS[1]), redis.call('TTL', KEYS[1])}
+end
+return false
+"""
+
+
+def session_reference(session_id: str) -> str:
+    """Nicht geheime Kennung einer Session für Admin-Ansichten"""
+    return hashlib.sha256(session_id.encode()).hexdigest()[:16]
+
+
+def _pairs(values: List[str]) -> Dict[str, str]:
+    return dict(zip(values[::2], values[1::2]))
+
 
 class RedisSessionManager:
     """Redis Session Manager für die Verwaltung von Benutzersitzungen"""
@@ -24,76 +94,115 @@ class RedisSessionManager:
         self.redis = redis_client
         self.session_prefix = "session:"
         self.temp_session_prefix = "temp_session:"
-        self.user_session_prefix = "user_sessions:"
+        # ZSET Session-ID -> Ablaufzeitpunkt (Unix-Sekunden)
+        self.user_session_prefix = "user_session_index:"
+        # SET der Session-IDs aus älteren Versionen, nur noch beim Widerrufen
+        self.legacy_user_session_prefix = "user_sessions:"
         self.user_temp_session_prefix = "user_temp_sessions:"
+        self.principal_version_prefix = "principal_version:"
         self.default_expire_time = config.session_expire_seconds
+        self._revoke_sessions = self.redis.register_script(_REVOKE_SESSIONS_SCRIPT)
+        self._read_session = self.redis.register_script(_READ_SESSION_SCRIPT)
+
+    def _new_session(self, user_id: int, state: str) -> Dict[str, Any]:
+        now = int(time.time())
+        return {
+            "user_id": user_id,
+            "created_at": now,
+            "last_accessed": now,
+            "state": state,
+        }
 
     def create_temp_session(self, user_id: int) -> str:
         session_id = secrets.token_urlsafe(32)
         session_key = f"{self.temp_session_prefix}{session_id}"
+        expire = config.temp_session_expire_seconds
 
-        data = {
-            "user_id": user_id,
-            "created_at": datetime.now().isoformat(),
-            "last_accessed": datetime.now().isoformat(),
-            "state": "2fa_pending",
-        }
-        self.redis.setex(
-            session_key, config.temp_session_expire_seconds, json.dumps(data)
-        )
-
+        data = self._new_session(user_id, "2fa_pending")
         user_temp_sessions_key = f"{self.user_temp_session_prefix}{user_id}"
-        self.redis.sadd(user_temp_sessions_key, session_id)
-        self.redis.expire(user_temp_sessions_key, config.temp_session_expire_seconds)
+        pipe = self.redis.pipeline()
+        pipe.hset(session_key, mapping=encode_session(data))
+        pipe.expire(session_key, expire)
+        pipe.sadd(user_temp_sessions_key, session_id)
+        pipe.expire(user_temp_sessions_key, expire)
+        pipe.execute()
         return session_id
 
     def create_session(
-        self, user_id: int, session_data: Optional[Dict[str, Any]] = None
+        self,
+        user_id: int,
+        session_data: Optional[Dict[str, Any]] = None,
+        principal: Optional[Dict[str, Any]] = None,
     ) -> str:
+        """
+        Erstellt eine Session
+
+        Args:
+            user_id: Die Benutzer-ID
+            session_data: Zusätzliche Session-Daten
+            principal: Kompakte Benutzerdaten für die Autorisierung (Rolle,
+                deaktiviert, OTP-Status). Wird mit der aktuellen
+                Principal-Version gespeichert.
+
+        Returns:
+            Die Session-ID
+        """
         session_id = secrets.token_urlsafe(32)
         session_key = f"{self.session_prefix}{session_id}"
 
-        data = {
-            "user_id": user_id,
-            "created_at": datetime.now().isoformat(),
-            "last_accessed": datetime.now().isoformat(),
-            "state": "active",
-        }
-
+        data = self._new_session(user_id, "active")
         if session_data:
             data.update(session_data)
+        if principal is not None:
+            data["principal"] = dict(
+                principal, version=self.principal_version(user_id)
+            )
 
         expire = self.default_expire_time
-        self.redis.setex(session_key, expire, json.dumps(data))
-
-        # Session zur Benutzerliste hinzufügen
+        now = data["created_at"]
         user_sessions_key = f"{self.user_session_prefix}{user_id}"
-        self.redis.sadd(user_sessions_key, session_id)
-        self.redis.expire(user_sessions_key, expire)
+        pipe = self.redis.pipeline()
+        pipe.hset(session_key, mapping=encode_session(data))
+        pipe.expire(session_key, expire)
+        # Session mit Ablaufzeit in den Index, abgelaufene Einträge entfernen.
+        # Die neue Session läuft als letzte ab und bestimmt die TTL des Index.
+        pipe.zadd(user_sessions_key, {session_id: now + expire})
+        pipe.zremrangebyscore(user_sessions_key, "-inf", now)
+        pipe.expire(user_sessions_key, expire)
+        pipe.execute()
 
         return session_id
 
-    def get_temp_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        session_key = f"{self.temp_session_prefix}{session_id}"
-        session_data = self.redis.get(session_key)
-        loguru.logger.debug(f"Session-Daten: {session_data}")
-        if not session_data:
-            return None
-
-        try:
-            data = json.loads(session_data)
-
-            # Letzten Zugriff aktualisieren
-            data["last_accessed"] = datetime.now().isoformat()
+    def _read(self, session_key: str, **fields) -> Optional[Dict[str, Any]]:
+        """
+        Liest eine Session und setzt dabei die übergebenen Felder
 
-            # TTL der Session beibehalten
-            ttl = self.redis.ttl(session_key)
-            if ttl > 0:
-                self.redis.setex(session_key, ttl, json.dumps(data))
+        JSON-Sessions aus älteren Versionen werden dabei als Hash neu
+        geschrieben.
+        """
+        args = [item for pair in encode_fields(fields).items() for item in pair]
+        result = self._read_session(keys=[session_key], args=args, client=self.redis)
+        if not result:
+            return None
+        if result[0] == "hash":
+            return decode_session(_pairs(result[1]))
 
-            return data
-        except json.JSONDecodeError:
+        data = decode_legacy_session(result[1])
+        if data is None:
             return None
+        data.update(fields)
+        ttl = result[2]
+        pipe = self.redis.pipeline()
+        pipe.delete(session_key)
+        pipe.hset(session_key, mapping=encode_session(data))
+        if ttl > 0:
+            pipe.expire(session_key, ttl)
+        pipe.execute()
+        return data
+
+    def get_temp_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        session_key = f"{self.temp_session_prefix}{session_id}"
+        return self._read(session_key, last_accessed=int(time.time()))
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -105,42 +214,52 @@ class RedisSessionManager:
         Returns:
             Session-Daten oder None wenn nicht gefunden/abgelaufen
         """
+        start = time.perf_counter()
+        data = self._load_session(session_id)
+        SESSION_LOOKUP_LATENCY.labels("hit" if data else "miss").observe(
+            time.perf_counter() - start
+        )
+        return data
+
+    def _load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         session_key = f"{self.session_prefix}{session_id}"
-        session_data = self.redis.get(session_key)
+        return self._read(session_key, last_accessed=int(time.time()))
 
-        if not session_data:
-            return None
+    def principal_version(self, user_id: int) -> int:
+        """Aktuelle Version der Benutzerdaten (0, solange nie invalidiert)"""
+        version = self.redis.get(f"{self.principal_version_prefix}{user_id}")
+        return int(version) if version else 0
 
-        try:
-            data = json.loads(session_data)
+    def invalidate_principal(self, user_id: int) -> None:
+        """
+        Markiert die in den Sessions gespeicherten Benutzerdaten als veraltet
 
-            # Letzten Zugriff aktualisieren
-            data["last_accessed"] = datetime.now().isoformat()
+        Die Sessions bleiben gültig, der Principal wird beim nächsten Zugriff
+        aus der Datenbank neu geladen.
+        """
+        self.redis.incr(f"{self.principal_version_prefix}{user_id}")
 
-            # TTL der Session beibehalten
-            ttl = self.redis.ttl(session_key)
-            if ttl > 0:
-                self.redis.setex(session_key, ttl, json.dumps(data))
+    def update_principal(self, session_id: str, principal: Dict[str, Any]) -> None:
+        """Ersetzt den Principal einer Session unter Beibehaltung der TTL"""
+        self._read(f"{self.session_prefix}{session_id}", principal=principal)
 
-            return data
-        except json.JSONDecodeError:
-            return None
+    def _user_id(self, session_key: str) -> Optional[str]:
+        try:
+            return self.redis.hget(session_key, "user_id")
+        except redis.ResponseError:
+            # JSON-Session aus einer älteren Version
+            data = decode_legacy_session(self.redis.get(session_key) or "")
+            return data["user_id"] if data else None
 
     def delete_temp_session(self, session_id: str):
         session_key = f"{self.temp_session_prefix}{session_id}"
-        session_data = self.redis.get(session_key)
-        if session_data:
-            try:
-                data = json.loads(session_data)
-                user_id = data.get("user_id")
-                result = self.redis.delete(session_key)
-                if user_id:
-                    user_temp_sessions_key = f"{self.user_temp_session_prefix}{user_id}"
-                    self.redis.srem(user_temp_sessions_key, session_id)
-                    return result > 0
-            except json.JSONDecodeError:
-                pass
-        return False
+        user_id = self._user_id(session_key)
+        if not user_id:
+            return False
+        result = self.redis.delete(session_key)
+        user_temp_sessions_key = f"{self.user_temp_session_prefix}{user_id}"
+        self.redis.srem(user_temp_sessions_key, session_id)
+        return result > 0
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -153,26 +272,96 @@ class RedisSessionManager:
             True wenn erfolgreich gelöscht
         """
         session_key = f"{self.session_prefix}{session_id}"
-        session_data = self.redis.get(session_key)
-
-        if session_data:
-            try:
-                data = json.loads(session_data)
-                user_id = data.get("user_id")
+        user_id = self._user_id(session_key)
+        if not user_id:
+            return False
 
-                # Session löschen
-                result = self.redis.delete(session_key)
+        # Session löschen und aus dem Index entfernen
+        result = self.redis.delete(session_key)
+        user_sessions_key = f"{self.user_session_prefix}{user_id}"
+        self.redis.zrem(user_sessions_key, session_id)
+        return result > 0
+
+    def _timestamps(self, session_keys: List[str]) -> List[Optional[tuple]]:
+        pipe = self.redis.pipeline(transaction=False)
+        for key in session_keys:
+            pipe.hmget(key, "created_at", "last_accessed")
+        results = pipe.execute(raise_on_error=False)
+        timestamps = []
+        for key, result in zip(session_keys, results):
+            if isinstance(result, redis.ResponseError):
+                data = decode_legacy_session(self.redis.get(key) or "")
+                result = (
+                    [data["created_at"], data["last_accessed"]] if data else [None]
+                )
+            if not result or result[0] is None:
+                timestamps.append(None)
+            else:
+                timestamps.append(tuple(int(value) for value in result))
+        return timestamps
+
+    def list_sessions(self, user_id: int) -> List[Dict[str, Any]]:
+        """
+        Aktive Sessions eines Benutzers (ohne Session-IDs)
 
-                # Session aus Benutzerliste entfernen
-                if user_id:
-                    user_sessions_key = f"{self.user_session_prefix}{user_id}"
-                    self.redis.srem(user_sessions_key, session_id)
+        Abgelaufene oder vorzeitig gelöschte Einträge werden dabei aus dem
+        Index entfernt.
+        """
+        user_sessions_key = f"{self.user_session_prefix}{user_id}"
+        now = int(time.time())
+        self.redis.zremrangebyscore(user_sessions_key, "-inf", now)
+        entries = self.redis.zrange(user_sessions_key, 0, -1, withscores=True)
+        if not entries:
+            return []
+
+        timestamps = self._timestamps(
+            [f"{self.session_prefix}{session_id}" for session_id, _ in entries]
+        )
+        sessions, dead = [], []
+        for (session_id, expires_at), times in zip(entries, timestamps):
+            if times is None:
+                dead.append(session_id)
+                continue
+            created_at, last_accessed = times
+            sessions.append(
+                {
+                    "session_ref": session_reference(session_id),
+                    "created_at": datetime.fromtimestamp(created_at),
+                    "last_accessed": datetime.fromtimestamp(last_accessed),
+                    "expires_at": datetime.fromtimestamp(expires_at),
+                }
+            )
+        if dead:
+            self.redis.zrem(user_sessions_key, *dead)
+        return sessions
+
+    def revoke_sessions(
+        self, user_id: int, except_session_id: Optional[str] = None
+    ) -> int:
+        """
+        Löscht alle Sessions eines Benutzers in einem Skriptaufruf
 
-                return result > 0
-            except json.JSONDecodeError:
-                pass
+        Args:
+            user_id: Die Benutzer-ID
+            except_session_id: Session, die erhalten bleibt (z.B. die eigene
+                beim Passwortwechsel)
 
-        return False
+        Returns:
+            Anzahl der gelöschten Sessions
+        """
+        return self._revoke_sessions(
+            keys=[
+                f"{self.user_session_prefix}{user_id}",
+                f"{self.user_temp_session_prefix}{user_id}",
+                f"{self.legacy_user_session_prefix}{user_id}",
+            ],
+            args=[
+                self.session_prefix,
+                self.temp_session_prefix,
+                except_session_id or "",
+            ],
+            client=self.redis,
+        )
 
 
 session_manager = RedisSessionManager()
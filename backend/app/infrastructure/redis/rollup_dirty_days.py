@@ -0,0 +1,42 @@
+"""
+Tage, deren Statistik-Rollup (event_rollup) neu berechnet werden muss
+
+EventRepository markiert nach jedem Commit den Tag (created_at) der
+geänderten Events, beim Löschen eines Tags oder Fahrzeugs auch die Tage der
+damit verknüpften Events. workers/statistics_worker.py entnimmt die Tage und
+berechnet sie neu. Schlägt die Neuberechnung fehl, werden die Tage wieder
+eingetragen.
+"""
+
+from datetime import date
+from typing import Iterable, List
+
+import loguru
+import redis
+
+from infrastructure.redis.redis_client import client
+
+DIRTY_DAYS_KEY = "statistics:dirty_days"
+
+
+class RollupDirtyDays:
+    def __init__(self, redis_client: redis.Redis = client):
+        self.redis = redis_client
+
+    def mark(self, days: Iterable[date]) -> None:
+        values = {day.isoformat() for day in days}
+        if not values:
+            return
+        try:
+            self.redis.sadd(DIRTY_DAYS_KEY, *values)
+        except redis.RedisError as e:
+            # Die Statistik bleibt bis zum nächsten Rebuild veraltet
+            loguru.logger.warning(f"Statistik-Tage nicht markiert: {e}")
+
+    def pop(self, count: int) -> List[date]:
+        """Entnimmt bis zu count markierte Tage"""
+        values = self.redis.spop(DIRTY_DAYS_KEY, count) or []
+        return sorted(date.fromisoformat(value) for value in values)
+
+
+rollup_dirty_days = RollupDirtyDays()
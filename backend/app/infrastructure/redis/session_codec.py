@@ -0,0 +1,127 @@
+"""
+Kodierung der Sessions als Redis-Hash
+
+Zeitpunkte werden als Unix-Sekunden gespeichert, der Principal als einzelne
+Felder mit Prefix "p_". So kann ein Zugriff einzelne Felder per HSET
+aktualisieren, statt das ganze Dokument neu zu schreiben.
+
+Sessions aus älteren Versionen liegen als JSON-String mit ISO-Zeitstempeln vor
+und werden beim ersten Zugriff mit decode_legacy_session gelesen und als Hash
+neu geschrieben.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, Union
+
+PRINCIPAL_PREFIX = "p_"
+EXTRA_FIELD = "data"
+
+# Feldtypen des Principals (siehe domain.user.principal.Principal)
+_PRINCIPAL_TYPES = {
+    "id": int,
+    "role": str,
+    "deactivated": bool,
+    "otp_configured": bool,
+    "version": int,
+}
+_BASE_FIELDS = ("user_id", "created_at", "last_accessed", "state")
+
+
+def _encode_value(value: Any) -> Union[str, int]:
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def _decode_value(kind: type, raw: str) -> Any:
+    if kind is bool:
+        return raw == "1"
+    return kind(raw)
+
+
+def encode_session(data: Mapping[str, Any]) -> Dict[str, Union[str, int]]:
+    """
+    Session-Daten als Hash-Felder
+
+    Erwartet user_id, created_at, last_accessed (Unix-Sekunden) und state,
+    optional principal und weitere Schlüssel (als JSON in einem Feld).
+    """
+    fields: Dict[str, Union[str, int]] = {
+        "user_id": int(data["user_id"]),
+        "created_at": int(data["created_at"]),
+        "last_accessed": int(data["last_accessed"]),
+        "state": data["state"],
+    }
+    principal = data.get("principal")
+    if principal:
+        fields.update(encode_principal(principal))
+    extra = {
+        key: value
+        for key, value in data.items()
+        if key not in _BASE_FIELDS and key != "principal"
+    }
+    if extra:
+        fields[EXTRA_FIELD] = json.dumps(extra)
+    return fields
+
+
+def encode_principal(principal: Mapping[str, Any]) -> Dict[str, Union[str, int]]:
+    return {
+        f"{PRINCIPAL_PREFIX}{key}": _encode_value(value)
+        for key, value in principal.items()
+        if key in _PRINCIPAL_TYPES
+    }
+
+
+def encode_fields(fields: Mapping[str, Any]) -> Dict[str, Union[str, int]]:
+    """Einzelne Felder für ein HSET auf eine bestehende Session"""
+    encoded: Dict[str, Union[str, int]] = {}
+    for key, value in fields.items():
+        if key == "principal":
+            encoded.update(encode_principal(value))
+        else:
+            encoded[key] = _encode_value(value)
+    return encoded
+
+
+def decode_session(fields: Mapping[str, str]) -> Optional[Dict[str, Any]]:
+    """Hash-Felder (HGETALL) als Session-Daten, None für leere/defekte Hashes"""
+    try:
+        data: Dict[str, Any] = {
+            "user_id": int(fields["user_id"]),
+            "created_at": int(fields["created_at"]),
+            "last_accessed": int(fields["last_accessed"]),
+            "state": fields["state"],
+        }
+        principal = {
+            key: _decode_value(kind, fields[f"{PRINCIPAL_PREFIX}{key}"])
+            for key, kind in _PRINCIPAL_TYPES.items()
+            if f"{PRINCIPAL_PREFIX}{key}" in fields
+        }
+        if EXTRA_FIELD in fields:
+            data.update(json.loads(fields[EXTRA_FIELD]))
+    except (KeyError, ValueError):
+        return None
+    if principal:
+        data["principal"] = principal
+    return data
+
+
+def _epoch(value: Any) -> int:
+    if isinstance(value, str):
+        return int(datetime.fromisoformat(value).timestamp())
+    return int(value)
+
+
+def decode_legacy_session(raw: str) -> Optional[Dict[str, Any]]:
+    """JSON-Session mit ISO-Zeitstempeln im Format von decode_session"""
+    try:
+        data = json.loads(raw)
+        data["user_id"] = int(data["user_id"])
+        data["created_at"] = _epoch(data["created_at"])
+        data["last_accessed"] = _epoch(data["last_accessed"])
+        data.setdefault("state", "active")
+    except (KeyError, TypeError, ValueError):
+        return None
+    return data
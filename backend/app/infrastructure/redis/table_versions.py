@@ -0,0 +1,60 @@
+"""
+Versionszähler pro Tabelle für ETags
+
+Repositories erhöhen die Version nach jedem Commit, der die Tabelle ändert.
+Routen bilden daraus ETags, ohne die Datenbank abzufragen.
+"""
+
+import time
+from typing import Dict
+
+import redis
+
+from infrastructure.redis.redis_client import client
+
+VERSION_PREFIX = "table_version:"
+
+
+class TableVersions:
+    def __init__(self, redis_client: redis.Redis = client):
+        self.redis = redis_client
+
+    def get(self, *tables: str) -> Dict[str, int]:
+        """
+        Aktuelle Versionen der Tabellen
+
+        Fehlt ein Zähler (z.B. nach einem Redis-Flush), wird er mit der
+        aktuellen Zeit in ms initialisiert, damit keine alten ETags wieder
+        gültig werden.
+        """
+        keys = [f"{VERSION_PREFIX}{table}" for table in tables]
+        values = self.redis.mget(keys)
+        missing = [key for key, value in zip(keys, values) if value is None]
+        if missing:
+            initial = time.time_ns() // 1_000_000
+            pipe = self.redis.pipeline(transaction=False)
+            for key in missing:
+                pipe.set(key, initial, nx=True)
+            pipe.execute()
+            values = self.redis.mget(keys)
+        return {table: int(value) for table, value in zip(tables, values)}
+
+    def version(self, table: str) -> int:
+        return self.get(table)[table]
+
+    def bump(self, *tables: str) -> None:
+        """Erhöht die Versionen nach einer Änderung"""
+        pipe = self.redis.pipeline(transaction=False)
+        for table in tables:
+            pipe.incr(f"{VERSION_PREFIX}{table}")
+        pipe.execute()
+
+
+table_versions = TableVersions()
+
+
+def get_table_versions() -> TableVersions:
+    """
+    Dependency to inject the table versions
+    """
+    return table_versions
@@ -0,0 +1,72 @@
+"""
+Lebenszeichen der Hintergrund-Worker (workers/*)
+
+Jeder Worker schreibt pro Durchlauf seinen Schlüssel mit einer TTL von drei
+Intervallen (mindestens HEARTBEAT_MIN_TTL_SECONDS). Fehlt der Schlüssel, läuft
+der Worker nicht: /metrics meldet background_worker_up 0, und die API warnt
+beim Einreihen von Mails, die sonst unbemerkt in der Queue liegen bleiben.
+"""
+
+import time
+from typing import Dict
+
+import loguru
+import redis
+
+from infrastructure.redis.redis_client import client
+
+HEARTBEAT_PREFIX = "worker_heartbeat:"
+HEARTBEAT_MIN_TTL_SECONDS = 60
+
+# Name -> Startbefehl im app-Verzeichnis
+WORKERS = {
+    "mail": "python -m workers.mail_worker",
+    "webhook": "python -m workers.webhook_worker",
+    "statistics": "python -m workers.statistics_worker",
+    "hotspot": "python -m workers.hotspot_worker",
+    "purge": "python -m workers.purge_worker",
+}
+
+
+def heartbeat_key(worker: str) -> str:
+    return f"{HEARTBEAT_PREFIX}{worker}"
+
+
+def heartbeat_ttl(interval_seconds: float) -> int:
+    return max(HEARTBEAT_MIN_TTL_SECONDS, int(3 * interval_seconds))
+
+
+class WorkerHeartbeats:
+    def __init__(self, redis_client: redis.Redis = client):
+        self.redis = redis_client
+
+    def beat(self, worker: str, interval_seconds: float) -> None:
+        """Lebenszeichen eines Workers, der alle interval_seconds läuft"""
+        try:
+            self.redis.set(
+                heartbeat_key(worker),
+                int(time.time()),
+                ex=heartbeat_ttl(interval_seconds),
+            )
+        except redis.RedisError as e:
+            loguru.logger.warning(f"Heartbeat von {worker} nicht gespeichert: {e}")
+
+    def running(self) -> Dict[str, bool]:
+        """Worker-Name -> hat ein aktuelles Lebenszeichen"""
+        values = self.redis.mget([heartbeat_key(worker) for worker in WORKERS])
+        return {worker: value is not None for worker, value in zip(WORKERS, values)}
+
+    def warn_if_missing(self, worker: str) -> None:
+        """Warnt, wenn der Worker kein aktuelles Lebenszeichen hat"""
+        try:
+            if self.redis.exists(heartbeat_key(worker)):
+                return
+        except redis.RedisError:
+            return
+        loguru.logger.warning(
+            f"{worker}-Worker läuft nicht, Aufträge bleiben liegen "
+            f"(Start im app-Verzeichnis: {WORKERS[worker]})"
+        )
+
+
+worker_heartbeats = WorkerHeartbeats()
@@ -12,10 +12,21 @@ from domain.vehicletype.routes import vehicle_router
 from domain.issue.routes import issue_router
 from domain.auth.routes import auth_router
 from domain.invite.routes import invite_router
+from domain.subscription.routes import subscription_router
+from domain.webhook.routes import webhook_router
+from domain.statistics.routes import statistics_router
+from domain.hotspot.routes import hotspot_router
 from config.config_provider import get_config
 from infrastructure.redis.redis_client import session_manager
+from infrastructure.mail.templates import load_mail_templates
+from infrastructure.postgresql.db import SessionLocal
+from domain.common.reference_cache import reference_cache
+from domain.event.stream import event_stream
+from infrastructure.metrics.middleware import PrometheusMiddleware
+from infrastructure.metrics.prometheus import metrics_token_valid, render_metrics
+from infrastructure.metrics.background import update_background_metrics
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.requests import Request
 from starlette.types import ASGIApp
 
@@ -78,17 +89,32 @@ config = get_config()
 #         db.close()
 
 
-# @asynccontextmanager
-# async def lifespan(app: FastAPI):
-#     # Startup
-#     loguru.logger.info("Starting application...")
-#     await setup_initial_admin()
-#     yield
-#     # Shutdown
-#     loguru.logger.info("Shutting down application...")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup
+    loguru.logger.info("Starting application...")
+    load_mail_templates()
+    _load_reference_cache()
+    reference_cache.start_listener()
+    yield
+    # Shutdown
+    loguru.logger.info("Shutting down application...")
+    reference_cache.stop_listener()
+    event_stream.stop_listener()
 
 
-app = FastAPI()
+def _load_reference_cache():
+    db = SessionLocal()
+    try:
+        reference_cache.load_all(db)
+    except Exception as e:
+        # Der Cache lädt sich sonst beim ersten Zugriff selbst
+        loguru.logger.error(f"Stammdaten-Cache konnte nicht geladen werden: {e}")
+    finally:
+        db.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 PUBLIC_ROUTES = [
     "/api/v1/auth/login",
@@ -98,6 +124,10 @@ PUBLIC_ROUTES = [
     "/api/v1/user/confirm_forgot_password",
 ]
 PUBLIC_ROUTES_DEV = ["/docs", "/openapi.json"]
+METRICS_PATH = "/metrics"
+if config.metrics_enabled and config.metrics_token:
+    # Prometheus meldet sich mit metrics_token an, nicht mit einer Session
+    PUBLIC_ROUTES.append(METRICS_PATH)
 
 ##Initial setup
 
@@ -160,6 +190,9 @@ class SessionMiddleware(BaseHTTPMiddleware):
             return self._unauthorized("Invalid session")
         user_id = session.get(self.config.session_user_id_key)
         setattr(request.state, self.config.session_user_id_key, user_id)
+        # Für CurrentUser: Principal ohne erneuten Redis-Zugriff lesen
+        request.state.session = session
+        request.state.session_id = session_id
         return await call_next(request)
 
     def _unauthorized(self, detail: str):
@@ -192,6 +225,26 @@ app.add_middleware(
     public_routes=PUBLIC_ROUTES,
     public_routes_dev=PUBLIC_ROUTES_DEV,
 )
+if config.metrics_enabled:
+    # Als äußerste Middleware registriert, misst damit auch 401 aus der Session-
+    # Prüfung; Scrapes von /metrics selbst werden nicht gezählt
+    # Langlebige SSE-Verbindungen würden die Latenz-Histogramme verzerren
+    app.add_middleware(
+        PrometheusMiddleware,
+        excluded_paths=(METRICS_PATH, f"{config.api_prefix}/event/stream"),
+    )
+
+    @app.get(METRICS_PATH, include_in_schema=False)
+    def metrics(request: Request):
+        if config.metrics_token and not metrics_token_valid(
+            request.headers.get("Authorization"), config.metrics_token
+        ):
+            return JSONResponse(
+                status_code=401, content={"detail": "Invalid metrics token"}
+            )
+        update_background_metrics()
+        content, content_type = render_metrics()
+        return Response(content=content, media_type=content_type)
 
 
 # @app.middleware("http")
@@ -237,3 +290,7 @@ app.include_router(tag_router, prefix=config.api_prefix)
 app.include_router(vehicle_router, prefix=config.api_prefix)
 app.include_router(issue_router, prefix=config.api_prefix)
 app.include_router(invite_router, prefix=config.api_prefix)
+app.include_router(subscription_router, prefix=config.api_prefix)
+app.include_router(webhook_router, prefix=config.api_prefix)
+app.include_router(statistics_router, prefix=config.api_prefix)
+app.include_router(hotspot_router, prefix=config.api_prefix)
@@ -0,0 +1,56 @@
+"""
+Hilfsfunktionen für ETags und bedingte GET-Anfragen (If-None-Match -> 304)
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Request, Response
+from starlette import status
+
+from config.config_provider import get_config
+
+config = get_config()
+
+
+def reference_cache_control() -> str:
+    """Cache-Control für selten geänderte Stammdaten (Tags, Fahrzeuge, Rollen)"""
+    if config.reference_data_max_age > 0:
+        return f"private, max-age={config.reference_data_max_age}"
+    return "private, no-cache"
+
+
+# Einzelne Events/Issues ändern sich häufiger: immer revalidieren
+RESOURCE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Starker ETag aus den übergebenen Bestandteilen"""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def timestamp_part(value: Optional[datetime]) -> str:
+    return str(int(value.timestamp() * 1_000_000)) if value else "0"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Prüft If-None-Match (Liste, "*" und schwache Vergleiche nach RFC 9110)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
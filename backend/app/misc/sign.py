@@ -4,13 +4,22 @@ import base64
 import secrets
 
 
-def sign_invitation_id(invite_uuid: str, secret: str) -> str:
-    message = str(invite_uuid).encode("utf-8")
-    secret_bytes = secret.encode("utf-8")
-    sig = hmac.new(secret_bytes, message, hashlib.sha256).digest()
+def sign_message(message: str | bytes, secret: str) -> str:
+    """HMAC-SHA256 über message, base64url ohne Padding"""
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    sig = hmac.new(secret.encode("utf-8"), message, hashlib.sha256).digest()
     return base64.urlsafe_b64encode(sig).decode().rstrip("=")
 
 
+def verify_message_signature(message: str | bytes, sig: str, secret: str) -> bool:
+    return hmac.compare_digest(sign_message(message, secret), sig)
+
+
+def sign_invitation_id(invite_uuid: str, secret: str) -> str:
+    return sign_message(str(invite_uuid), secret)
+
+
 def verify_invitation_signature(invitation_id: str, sig: str, secret: str) -> bool:
     expected_sig = sign_invitation_id(invitation_id, secret)
     return hmac.compare_digest(expected_sig, sig)
@@ -0,0 +1,3 @@
+"""
+Background workers running outside the API process
+"""
@@ -0,0 +1,67 @@
+"""
+Hotspot-Worker: berechnet die Hotspots der Events und Issues
+
+Läuft alle hotspot_interval_seconds, lädt pro Quelle die Koordinaten der
+letzten hotspot_window_hours Stunden, berechnet Kerndichte und Getis-Ord Gi*
+auf einem Raster (domain/hotspot/analysis.py) und ersetzt die gespeicherten
+Hotspot-Polygone. Die Karten lesen nur das Ergebnis; die Berechnung läuft
+einmal pro Intervall statt pro Aufruf.
+
+Start im app-Verzeichnis:
+    python -m workers.hotspot_worker
+"""
+
+import signal
+import threading
+import time
+
+from loguru import logger
+
+import main  # noqa: F401 - registriert alle Modelle
+from config.config_provider import get_config
+from domain.hotspot.analysis import find_hotspots
+from domain.hotspot.repository import SOURCES, HotspotRepository
+from infrastructure.postgresql.db import SessionLocal
+from infrastructure.redis.worker_heartbeat import worker_heartbeats
+
+config = get_config()
+
+
+def compute(db, source: str) -> int:
+    """Berechnet die Hotspots einer Quelle neu; liefert ihre Anzahl"""
+    repository = HotspotRepository(db)
+    started = time.perf_counter()
+    lon, lat, age = repository.recent_points(source)
+    hotspots = find_hotspots(lon, lat, age)
+    repository.replace(source, hotspots)
+    logger.info(
+        f"{len(hotspots)} Hotspots für {source} aus {len(lon)} Punkten "
+        f"({time.perf_counter() - started:.2f}s)"
+    )
+    return len(hotspots)
+
+
+def run(stopped: threading.Event) -> None:
+    interval = config.hotspot_interval_seconds
+    logger.info(f"Hotspot-Worker gestartet (alle {interval}s)")
+    while not stopped.is_set():
+        worker_heartbeats.beat("hotspot", interval)
+        for source in SOURCES:
+            try:
+                with SessionLocal() as db:
+                    compute(db, source)
+            except Exception as e:
+                logger.exception(f"Hotspots für {source} fehlgeschlagen: {e}")
+        stopped.wait(interval)
+    logger.info("Hotspot-Worker beendet")
+
+
+def run_forever() -> None:
+    stopped = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stopped.set())
+    run(stopped)
+
+
+if __name__ == "__main__":
+    run_forever()
@@ -0,0 +1,254 @@
+"""
+Mail-Worker: versendet Mails aus der Redis-Outbox (infrastructure/mail/queue.py)
+
+Die SMTP-Verbindung wird zwischen Mails wiederverwendet und erst nach einer
+Leerlaufzeit geschlossen. Fehlgeschlagene Mails werden mit exponentiellem
+Backoff erneut versucht und nach mail_queue_max_attempts Versuchen in die
+Dead-Letter-Liste verschoben.
+
+Start im app-Verzeichnis:
+    python -m workers.mail_worker
+"""
+
+import asyncio
+import random
+import signal
+import time
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import Any, Dict, List, Optional
+
+import aiosmtplib
+import redis.asyncio as aioredis
+from loguru import logger
+
+from config.config_provider import get_config
+from infrastructure.mail.queue import (
+    PENDING_KEY,
+    PROCESSING_PREFIX,
+    RETRY_KEY,
+    DEAD_KEY,
+    encode_job,
+    decode_job,
+)
+from infrastructure.redis.worker_heartbeat import heartbeat_key, heartbeat_ttl
+
+config = get_config()
+
+# Fällige Retries atomar zurück in die Pending-Liste verschieben
+PROMOTE_DUE_RETRIES = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, job in ipairs(due) do
+    redis.call('ZREM', KEYS[1], job)
+    redis.call('RPUSH', KEYS[2], job)
+end
+return #due
+"""
+
+# Bis zu ARGV[1] weitere Mails ohne Blockieren in die Processing-Liste holen
+TAKE_BATCH = """
+local jobs = {}
+for i = 1, tonumber(ARGV[1]) do
+    local job = redis.call('LMOVE', KEYS[1], KEYS[2], 'RIGHT', 'LEFT')
+    if not job then break end
+    jobs[#jobs + 1] = job
+end
+return jobs
+"""
+
+# Abstand der Lebenszeichen in Redis (infrastructure/redis/worker_heartbeat.py)
+HEARTBEAT_INTERVAL_SECONDS = 10
+
+# Verbindungsfehler, nach denen die SMTP-Verbindung neu aufgebaut wird
+CONNECTION_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    aiosmtplib.SMTPTimeoutError,
+    OSError,
+)
+
+
+class MailWorker:
+    """Versendet Mails aus der Queue über eine wiederverwendete SMTP-Verbindung"""
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        worker_name: str = config.mail_worker_name,
+        idle_disconnect_seconds: float = 30.0,
+    ):
+        self.redis = redis_client
+        self.processing_key = f"{PROCESSING_PREFIX}{worker_name}"
+        self.idle_disconnect_seconds = idle_disconnect_seconds
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._last_send = 0.0
+        self._last_heartbeat = 0.0
+        self._stopped = asyncio.Event()
+        self._promote_due_retries = self.redis.register_script(PROMOTE_DUE_RETRIES)
+        self._take_batch = self.redis.register_script(TAKE_BATCH)
+
+    def stop(self):
+        self._stopped.set()
+
+    async def run(self):
+        await self._requeue_unfinished()
+        logger.info(f"Mail-Worker gestartet ({self.processing_key})")
+
+        while not self._stopped.is_set():
+            await self._heartbeat()
+            await self._promote_due_retries(
+                keys=[RETRY_KEY, PENDING_KEY], args=[time.time(), 100]
+            )
+            batch = await self._next_batch()
+            if not batch:
+                await self._disconnect_if_idle()
+                continue
+            for raw in batch:
+                await self._process(raw)
+
+        await self._disconnect()
+        logger.info("Mail-Worker beendet")
+
+    async def _heartbeat(self):
+        now = time.monotonic()
+        if now - self._last_heartbeat < HEARTBEAT_INTERVAL_SECONDS:
+            return
+        self._last_heartbeat = now
+        await self.redis.set(
+            heartbeat_key("mail"),
+            int(time.time()),
+            ex=heartbeat_ttl(HEARTBEAT_INTERVAL_SECONDS),
+        )
+
+    async def _requeue_unfinished(self):
+        """Mails, die bei einem Absturz in Bearbeitung waren, erneut einreihen"""
+        count = 0
+        while await self.redis.lmove(
+            self.processing_key, PENDING_KEY, "RIGHT", "RIGHT"
+        ):
+            count += 1
+        if count:
+            logger.warning(f"{count} unterbrochene Mails erneut eingereiht")
+
+    async def _next_batch(self) -> List[str]:
+        first = await self.redis.blmove(
+            PENDING_KEY, self.processing_key, timeout=1, src="RIGHT", dest="LEFT"
+        )
+        if first is None:
+            return []
+        rest = await self._take_batch(
+            keys=[PENDING_KEY, self.processing_key],
+            args=[config.mail_queue_batch_size - 1],
+        )
+        return [first, *rest]
+
+    async def _process(self, raw: str):
+        job = decode_job(raw)
+        if job is None:
+            logger.error("Ungültiger Mail-Job, verschiebe in Dead-Letter-Liste")
+            await self._finish(raw, dead_letter=raw)
+            return
+
+        try:
+            await self._send(job)
+        except Exception as e:
+            if isinstance(e, CONNECTION_ERRORS):
+                await self._disconnect()
+            await self._fail(raw, job, e)
+            return
+
+        await self._finish(raw)
+        logger.debug(f"Mail {job['id']} versendet an {job['recipients']}")
+
+    async def _send(self, job: Dict[str, Any]):
+        message = EmailMessage()
+        message["From"] = formataddr((config.mail_from_name, config.mail_from))
+        message["To"] = ", ".join(job["recipients"])
+        message["Subject"] = job["subject"]
+        message.set_content(job["body"], subtype=job.get("subtype", "html"))
+
+        smtp = await self._connection()
+        await smtp.send_message(message)
+        self._last_send = time.monotonic()
+
+    async def _fail(self, raw: str, job: Dict[str, Any], error: Exception):
+        job["attempts"] = job.get("attempts", 0) + 1
+        job["last_error"] = str(error)
+
+        if job["attempts"] >= config.mail_queue_max_attempts:
+            logger.error(
+                f"Mail {job['id']} nach {job['attempts']} Versuchen verworfen: {error}"
+            )
+            await self._finish(raw, dead_letter=encode_job(job))
+            return
+
+        # Exponentielles Backoff mit Jitter
+        delay = config.mail_queue_retry_base_seconds * 2 ** (job["attempts"] - 1)
+        delay *= random.uniform(0.8, 1.2)
+        logger.warning(
+            f"Mail {job['id']} fehlgeschlagen (Versuch {job['attempts']}), "
+            f"neuer Versuch in {delay:.0f}s: {error}"
+        )
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(RETRY_KEY, {encode_job(job): time.time() + delay})
+            pipe.lrem(self.processing_key, 1, raw)
+            await pipe.execute()
+
+    async def _finish(self, raw: str, dead_letter: Optional[str] = None):
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if dead_letter is not None:
+                pipe.lpush(DEAD_KEY, dead_letter)
+            pipe.lrem(self.processing_key, 1, raw)
+            await pipe.execute()
+
+    async def _connection(self) -> aiosmtplib.SMTP:
+        if self._smtp is None or not self._smtp.is_connected:
+            self._smtp = aiosmtplib.SMTP(
+                hostname=config.mail_server,
+                port=config.mail_port,
+                use_tls=False,
+                start_tls=False,
+                timeout=10,
+            )
+            await self._smtp.connect()
+        return self._smtp
+
+    async def _disconnect_if_idle(self):
+        if (
+            self._smtp is not None
+            and time.monotonic() - self._last_send > self.idle_disconnect_seconds
+        ):
+            await self._disconnect()
+
+    async def _disconnect(self):
+        if self._smtp is None:
+            return
+        smtp, self._smtp = self._smtp, None
+        try:
+            if smtp.is_connected:
+                await smtp.quit()
+        except Exception:
+            smtp.close()
+
+
+async def main():
+    redis_client = aioredis.Redis(
+        host=config.redis_host,
+        port=config.redis_port,
+        db=config.redis_db,
+        decode_responses=True,
+    )
+    worker = MailWorker(redis_client)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await redis_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Purge-Worker: löscht abgelaufene Passwort-Resets, Einladungen, Tombstones und
+abgeschlossene Webhook-Zustellungen
+
+Läuft alle purge_interval_seconds und entfernt Einträge, die seit mehr als
+purge_retention_days abgelaufen bzw. abgeschlossen sind. Tombstones des
+Änderungs-Feeds werden nach sync_tombstone_retention_days gelöscht. Gelöscht
+wird in Batches von purge_batch_size Zeilen pro Transaktion, damit keine langen
+Sperren entstehen.
+
+Start im app-Verzeichnis:
+    python -m workers.purge_worker
+"""
+
+import signal
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+from loguru import logger
+
+import main  # noqa: F401 - registriert alle Modelle
+from config.config_provider import get_config
+from domain.invite.repository import InviteRepository
+from domain.sync.repository import SyncRepository
+from domain.user.repository import UserRepository
+from domain.webhook.repository import WebhookRepository
+from infrastructure.postgresql.db import SessionLocal
+from infrastructure.redis.worker_heartbeat import worker_heartbeats
+
+config = get_config()
+
+
+def _purge_in_batches(purge: Callable[[datetime, int], int], before: datetime) -> int:
+    total = 0
+    while True:
+        deleted = purge(before, config.purge_batch_size)
+        total += deleted
+        if deleted < config.purge_batch_size:
+            return total
+
+
+def purge_expired(db, now: datetime = None) -> Dict[str, int]:
+    """Ein Durchlauf; liefert die Anzahl gelöschter Zeilen je Tabelle"""
+    now = now or datetime.now()
+    before = now - timedelta(days=config.purge_retention_days)
+    tombstones_before = now - timedelta(days=config.sync_tombstone_retention_days)
+    return {
+        "pw_reset": _purge_in_batches(UserRepository(db).purge_pw_resets, before),
+        "invite": _purge_in_batches(InviteRepository(db).purge_expired, before),
+        "tombstone": _purge_in_batches(
+            SyncRepository(db).purge_tombstones, tombstones_before
+        ),
+        "webhook_delivery": _purge_in_batches(
+            WebhookRepository(db).purge_deliveries, before
+        ),
+    }
+
+
+def run(stopped: threading.Event) -> None:
+    logger.info(
+        f"Purge-Worker gestartet (alle {config.purge_interval_seconds}s, "
+        f"Aufbewahrung {config.purge_retention_days} Tage)"
+    )
+    while not stopped.is_set():
+        worker_heartbeats.beat("purge", config.purge_interval_seconds)
+        try:
+            with SessionLocal() as db:
+                deleted = purge_expired(db)
+            if any(deleted.values()):
+                logger.info(f"Abgelaufene Einträge gelöscht: {deleted}")
+        except Exception as e:
+            logger.exception(f"Purge fehlgeschlagen: {e}")
+        stopped.wait(config.purge_interval_seconds)
+    logger.info("Purge-Worker beendet")
+
+
+def run_forever() -> None:
+    stopped = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stopped.set())
+    run(stopped)
+
+
+if __name__ == "__main__":
+    run_forever()
@@ -0,0 +1,82 @@
+"""
+Statistik-Worker: hält den Rollup der Events (event_rollup) aktuell
+
+Läuft alle statistics_refresh_interval_seconds, entnimmt die von Event-
+Änderungen markierten Tage aus Redis und berechnet sie neu (bis zu
+statistics_refresh_batch_days Tage pro Transaktion). Tage einer
+fehlgeschlagenen Neuberechnung werden wieder markiert.
+
+Mit --rebuild wird der ganze Rollup einmalig neu berechnet, z.B. nach der
+Migration, einem Redis-Ausfall oder einer Änderung von
+statistics_grid_degrees.
+
+Start im app-Verzeichnis:
+    python -m workers.statistics_worker [--rebuild]
+"""
+
+import signal
+import sys
+import threading
+
+from loguru import logger
+
+import main  # noqa: F401 - registriert alle Modelle
+from config.config_provider import get_config
+from domain.statistics.repository import StatisticsRepository
+from infrastructure.postgresql.db import SessionLocal
+from infrastructure.redis.rollup_dirty_days import RollupDirtyDays, rollup_dirty_days
+from infrastructure.redis.worker_heartbeat import worker_heartbeats
+
+config = get_config()
+
+
+def refresh_dirty_days(db, dirty_days: RollupDirtyDays = rollup_dirty_days) -> int:
+    """Berechnet alle markierten Tage neu; liefert die Anzahl der Tage"""
+    total = 0
+    while True:
+        days = dirty_days.pop(config.statistics_refresh_batch_days)
+        if not days:
+            return total
+        try:
+            StatisticsRepository(db).refresh(days)
+        except Exception:
+            db.rollback()
+            dirty_days.mark(days)
+            raise
+        total += len(days)
+
+
+def run(stopped: threading.Event) -> None:
+    interval = config.statistics_refresh_interval_seconds
+    logger.info(f"Statistik-Worker gestartet (alle {interval}s)")
+    while not stopped.is_set():
+        worker_heartbeats.beat("statistics", interval)
+        try:
+            with SessionLocal() as db:
+                refreshed = refresh_dirty_days(db)
+            if refreshed:
+                logger.info(f"Statistik für {refreshed} Tage neu berechnet")
+        except Exception as e:
+            logger.exception(f"Statistik-Aktualisierung fehlgeschlagen: {e}")
+        stopped.wait(config.statistics_refresh_interval_seconds)
+    logger.info("Statistik-Worker beendet")
+
+
+def rebuild() -> None:
+    with SessionLocal() as db:
+        rows = StatisticsRepository(db).refresh()
+    logger.info(f"Statistik-Rollup neu aufgebaut ({rows} Zeilen)")
+
+
+def run_forever() -> None:
+    stopped = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stopped.set())
+    run(stopped)
+
+
+if __name__ == "__main__":
+    if "--rebuild" in sys.argv[1:]:
+        rebuild()
+    else:
+        run_forever()
@@ -0,0 +1,178 @@
+"""
+Webhook-Worker: stellt Event-Änderungen aus der Outbox an Partnersysteme zu
+
+Ein Durchlauf verteilt neue Outbox-Einträge auf die aktiven Endpoints und
+beliefert danach bis zu webhook_max_concurrency Endpoints parallel, jeden mit
+einem Batch von höchstens webhook_batch_size Änderungen in einer Anfrage.
+Schlägt ein Batch fehl, pausiert der Endpoint mit exponentiellem Backoff;
+Änderungen mit webhook_max_attempts Versuchen werden als failed abgelegt.
+
+Mehrere Worker können parallel laufen (FOR UPDATE SKIP LOCKED, Leases).
+
+Jede Anfrage ist signiert:
+    X-Webhook-Timestamp: Unix-Zeit in Sekunden
+    X-Webhook-Signature: sign_message(f"{timestamp}.{body}", secret)
+
+Start im app-Verzeichnis:
+    python -m workers.webhook_worker
+"""
+
+import asyncio
+import json
+import random
+import signal
+import time
+from datetime import timedelta
+from typing import Callable, TypeVar
+
+import httpx
+from loguru import logger
+
+import main  # noqa: F401 - registriert alle Modelle
+from config.config_provider import get_config
+from domain.webhook.repository import ClaimedEndpoint, WebhookRepository
+from infrastructure.postgresql.db import SessionLocal
+from infrastructure.redis.worker_heartbeat import worker_heartbeats
+from misc.sign import sign_message
+
+config = get_config()
+
+T = TypeVar("T")
+
+# Maximale Pause eines dauerhaft fehlschlagenden Endpoints
+MAX_BACKOFF_SECONDS = 3600
+
+
+def backoff(failures: int) -> timedelta:
+    """Pause nach dem failures-ten Fehlschlag in Folge, mit Jitter"""
+    delay = min(
+        config.webhook_retry_base_seconds * 2 ** (failures - 1), MAX_BACKOFF_SECONDS
+    )
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def signature_headers(body: bytes, secret: str, timestamp: int) -> dict:
+    return {
+        "Content-Type": "application/json",
+        "X-Webhook-Timestamp": str(timestamp),
+        "X-Webhook-Signature": sign_message(f"{timestamp}.".encode() + body, secret),
+    }
+
+
+def _with_repository(work: Callable[[WebhookRepository], T]) -> T:
+    with SessionLocal() as db:
+        return work(WebhookRepository(db))
+
+
+class WebhookWorker:
+    def __init__(self, http: httpx.AsyncClient):
+        self.http = http
+        self._stopped = asyncio.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    async def run(self):
+        logger.info(
+            f"Webhook-Worker gestartet (max. {config.webhook_max_concurrency} "
+            f"Endpoints parallel, Batches bis {config.webhook_batch_size})"
+        )
+        while not self._stopped.is_set():
+            await asyncio.to_thread(
+                worker_heartbeats.beat, "webhook", config.webhook_poll_interval_seconds
+            )
+            try:
+                busy = await self.run_once()
+            except Exception as e:
+                logger.exception(f"Webhook-Durchlauf fehlgeschlagen: {e}")
+                busy = False
+            if not busy:
+                try:
+                    await asyncio.wait_for(
+                        self._stopped.wait(), config.webhook_poll_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        logger.info("Webhook-Worker beendet")
+
+    async def run_once(self) -> bool:
+        """Ein Durchlauf; True, wenn es etwas zu tun gab"""
+        fanned_out = await asyncio.to_thread(
+            _with_repository, lambda repo: repo.fan_out(config.webhook_fan_out_batch)
+        )
+        lease = timedelta(seconds=config.webhook_timeout_seconds * 3)
+        endpoints = await asyncio.to_thread(
+            _with_repository,
+            lambda repo: repo.claim_endpoints(config.webhook_max_concurrency, lease),
+        )
+        if endpoints:
+            await asyncio.gather(*(self.deliver(endpoint) for endpoint in endpoints))
+        return bool(fanned_out or endpoints)
+
+    async def deliver(self, endpoint: ClaimedEndpoint) -> None:
+        deliveries = await asyncio.to_thread(
+            _with_repository,
+            lambda repo: repo.pending_batch(endpoint.id, config.webhook_batch_size),
+        )
+        delivery_ids = [d.id for d in deliveries]
+        body = json.dumps(
+            {
+                "deliveries": [
+                    {
+                        "id": d.id,
+                        "occurred_at": d.created_at.isoformat(),
+                        "change": d.payload,
+                    }
+                    for d in deliveries
+                ]
+            },
+            separators=(",", ":"),
+        ).encode()
+
+        error = None
+        if deliveries:
+            try:
+                response = await self.http.post(
+                    endpoint.url,
+                    content=body,
+                    headers=signature_headers(body, endpoint.secret, int(time.time())),
+                )
+                if not response.is_success:
+                    error = f"HTTP {response.status_code}"
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__}: {e}"
+
+        if error is None:
+            logger.debug(f"{len(deliveries)} Änderungen an {endpoint.url} zugestellt")
+        else:
+            logger.warning(
+                f"Webhook {endpoint.url} fehlgeschlagen "
+                f"({endpoint.failures + 1}. Fehler in Folge): {error}"
+            )
+        await asyncio.to_thread(
+            _with_repository,
+            lambda repo: repo.finish_batch(
+                endpoint,
+                delivery_ids,
+                error,
+                config.webhook_max_attempts,
+                backoff(endpoint.failures + 1),
+            ),
+        )
+
+
+async def main_async():
+    async with httpx.AsyncClient(
+        timeout=config.webhook_timeout_seconds,
+        limits=httpx.Limits(max_connections=config.webhook_max_concurrency),
+        headers={"User-Agent": "fire-map-webhooks"},
+    ) as http:
+        worker = WebhookWorker(http)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async())
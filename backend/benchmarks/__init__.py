@@ -0,0 +1,3 @@
+"""
+Lasttests und Benchmarks für die API (nicht Teil des Deployments)
+"""
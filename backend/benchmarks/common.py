@@ -0,0 +1,8 @@
+"""Gemeinsame Konstanten von Seed und Lasttest"""
+
+BENCH_EMAIL_DOMAIN = "bench.fire-map.test"
+BENCH_PASSWORD = "bench-password"
+
+
+def bench_email(index: int) -> str:
+    return f"user{index}@{BENCH_EMAIL_DOMAIN}"
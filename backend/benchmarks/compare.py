@@ -0,0 +1,88 @@
+"""
+Vergleicht zwei Ergebnisdateien von benchmarks.loadtest
+
+Gibt pro Szenario die Änderung von p50/p95/p99 und Durchsatz aus und endet mit
+Exit-Code 1, wenn ein p95 um mehr als --threshold Prozent schlechter wird.
+
+    uv run python -m benchmarks.compare benchmarks/results/{baseline,candidate}.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "throughput_rps")
+
+
+def _change(before: float, after: float) -> Optional[float]:
+    if not before:
+        return None
+    return (after - before) / before * 100
+
+
+def compare(
+    baseline: dict, candidate: dict, threshold: float
+) -> Tuple[List[str], List[str]]:
+    """
+    Returns:
+        Tabellenzeilen und die Namen der Szenarien mit Regression
+    """
+    rows = [
+        f"{'scenario':<20}"
+        + "".join(f"{metric:>24}" for metric in METRICS)
+        + f"{'errors':>12}"
+    ]
+    regressions = []
+    scenarios = dict(candidate["scenarios"], total=candidate["total"])
+    base_scenarios = dict(baseline["scenarios"], total=baseline["total"])
+    for name, after in scenarios.items():
+        before = base_scenarios.get(name)
+        if before is None:
+            rows.append(f"{name:<20}  (neu, keine Baseline)")
+            continue
+        cells = []
+        for metric in METRICS:
+            change = _change(before[metric], after[metric])
+            delta = f"{change:+.1f}%" if change is not None else "n/a"
+            cells.append(f"{before[metric]:>8} -> {after[metric]:<8}{delta:>7}")
+        rows.append(
+            f"{name:<20}"
+            + "".join(f"{cell:>24}" for cell in cells)
+            + f"{before['errors']:>5} -> {after['errors']:<4}"
+        )
+        p95_change = _change(before["p95_ms"], after["p95_ms"])
+        if p95_change is not None and p95_change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Erlaubte Verschlechterung des p95 in Prozent",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    rows, regressions = compare(baseline, candidate, args.threshold)
+    print(
+        f"Baseline {baseline['meta'].get('git_commit')} -> "
+        f"Kandidat {candidate['meta'].get('git_commit')}"
+    )
+    print("\n".join(rows))
+    if regressions:
+        print(f"\np95-Regression > {args.threshold}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+"""
+Lasttest für die Hot Paths der API
+
+Treibt eine laufende API (gegen eine mit benchmarks.seed befüllte Datenbank)
+mit einer gewichteten Mischung von Szenarien und schreibt p50/p95/p99 und
+Durchsatz je Szenario als JSON. Zwei Ergebnisdateien lassen sich mit
+benchmarks.compare vergleichen.
+
+    cd backend && uv run python -m benchmarks.loadtest \\
+        --base-url http://localhost:8000 --duration 60 --concurrency 20 \\
+        --output benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import BENCH_PASSWORD, bench_email  # noqa: E402
+
+SESSION_COOKIE = "sid"
+
+# Gewichtete Standardmischung, per --mix überschreibbar
+DEFAULT_MIX = {
+    "events_default": 25,
+    "events_tags": 15,
+    "events_vehicles": 10,
+    "events_date_range": 10,
+    "events_text": 5,
+    "events_deep_page": 5,
+    "session_tags": 15,
+    "issue_crud": 10,
+    "login": 5,
+}
+
+
+@dataclass
+class ScenarioStats:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, seconds: float, status_code: int, ok: bool) -> None:
+        self.latencies.append(seconds)
+        key = str(status_code)
+        self.status_codes[key] = self.status_codes.get(key, 0) + 1
+        if not ok:
+            self.errors += 1
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Perzentil mit linearer Interpolation auf bereits sortierten Werten"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = rank - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarize(stats: ScenarioStats, elapsed: float) -> dict:
+    values = sorted(stats.latencies)
+    count = len(values)
+    return {
+        "count": count,
+        "errors": stats.errors,
+        "status_codes": stats.status_codes,
+        "throughput_rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(values) / count * 1000, 2) if count else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2) if count else 0.0,
+    }
+
+
+class VirtualUser:
+    """Ein angemeldeter Client mit eigener Session"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        api: str,
+        email: str,
+        rng: random.Random,
+        tag_ids: List[int],
+        vehicle_ids: List[int],
+    ):
+        self.client = client
+        self.api = api
+        self.email = email
+        self.rng = rng
+        self.tag_ids = tag_ids
+        self.vehicle_ids = vehicle_ids
+        self.sid: Optional[str] = None
+
+    async def login(self) -> httpx.Response:
+        response = await self.client.post(
+            f"{self.api}/auth/login",
+            json={"email": self.email, "password": BENCH_PASSWORD},
+        )
+        # Das Cookie ist "secure" und würde über http nicht zurückgeschickt
+        sid = response.cookies.get(SESSION_COOKIE)
+        if sid:
+            self.sid = sid
+        return response
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Cookie": f"{SESSION_COOKIE}={self.sid}"}
+
+    async def get(self, path: str, params=None) -> httpx.Response:
+        return await self.client.get(
+            f"{self.api}{path}", params=params, headers=self.headers
+        )
+
+    def _sample(self, ids: List[int], k: int) -> List[int]:
+        return self.rng.sample(ids, min(k, len(ids)))
+
+
+async def _events(user: VirtualUser, params) -> httpx.Response:
+    return await user.get("/event", params=params)
+
+
+async def events_default(user: VirtualUser) -> httpx.Response:
+    return await _events(user, {"page": 1, "limit": 10})
+
+
+async def events_tags(user: VirtualUser) -> httpx.Response:
+    tags = user._sample(user.tag_ids, user.rng.randint(1, 2))
+    return await _events(user, {"tag_ids": tags, "limit": 20})
+
+
+async def events_vehicles(user: VirtualUser) -> httpx.Response:
+    vehicles = user._sample(user.vehicle_ids, 1)
+    return await _events(user, {"vehicle_ids": vehicles, "limit": 20})
+
+
+async def events_date_range(user: VirtualUser) -> httpx.Response:
+    end = datetime.now(timezone.utc) - timedelta(days=user.rng.randint(0, 300))
+    start = end - timedelta(days=user.rng.choice((1, 7, 30)))
+    return await _events(
+        user,
+        {"start_date": start.isoformat(), "end_date": end.isoformat(), "limit": 50},
+    )
+
+
+async def events_text(user: VirtualUser) -> httpx.Response:
+    return await _events(user, {"name": user.rng.choice(("brand", "wald", "feld"))})
+
+
+async def events_deep_page(user: VirtualUser) -> httpx.Response:
+    return await _events(user, {"page": user.rng.randint(20, 100), "limit": 20})
+
+
+async def events_city(user: VirtualUser) -> httpx.Response:
+    # Geht beim ersten Aufruf pro Stadt an Nominatim, daher nicht in DEFAULT_MIX
+    city = user.rng.choice(("Berlin", "München", "Wien", "Zürich", "Hamburg"))
+    return await _events(user, {"city_name": city, "distance_km": 50})
+
+
+async def session_tags(user: VirtualUser) -> httpx.Response:
+    # Kleinste geschützte Route: misst Session-Lookup plus Middleware-Overhead
+    return await user.get("/tag")
+
+
+async def login(user: VirtualUser) -> httpx.Response:
+    return await user.login()
+
+
+async def issue_crud(user: VirtualUser) -> httpx.Response:
+    """Create, Update und Delete eines Issues als eine Messung"""
+    created = await user.client.post(
+        f"{user.api}/issue",
+        json={
+            "name": "Bench Issue",
+            "description": "Lasttest",
+            "tag_ids": user._sample(user.tag_ids, 1),
+            "location": [10.0 + user.rng.random(), 50.0 + user.rng.random()],
+        },
+        headers=user.headers,
+    )
+    if created.status_code != 201:
+        return created
+    issue_id = created.json()["id"]
+    updated = await user.client.put(
+        f"{user.api}/issue/{issue_id}",
+        json={"description": "Lasttest (geändert)"},
+        headers=user.headers,
+    )
+    if updated.status_code != 200:
+        return updated
+    return await user.client.delete(
+        f"{user.api}/issue/{issue_id}", headers=user.headers
+    )
+
+
+SCENARIOS: Dict[str, Callable[[VirtualUser], Awaitable[httpx.Response]]] = {
+    "events_default": events_default,
+    "events_tags": events_tags,
+    "events_vehicles": events_vehicles,
+    "events_date_range": events_date_range,
+    "events_text": events_text,
+    "events_deep_page": events_deep_page,
+    "events_city": events_city,
+    "session_tags": session_tags,
+    "login": login,
+    "issue_crud": issue_crud,
+}
+
+
+def parse_mix(value: Optional[str]) -> Dict[str, int]:
+    if not value:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Unbekanntes Szenario: {name}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+async def _fetch_ids(user: VirtualUser, path: str) -> List[int]:
+    response = await user.get(path)
+    response.raise_for_status()
+    return [item["id"] for item in response.json()]
+
+
+async def _worker(
+    user: VirtualUser,
+    mix: Dict[str, int],
+    stats: Dict[str, ScenarioStats],
+    deadline: float,
+    remaining: List[int],
+    measure: bool,
+) -> None:
+    names = list(mix)
+    weights = list(mix.values())
+    while time.perf_counter() < deadline:
+        if remaining[0] <= 0:
+            return
+        remaining[0] -= 1
+        name = user.rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            response = await SCENARIOS[name](user)
+            status_code, ok = response.status_code, response.status_code < 400
+        except httpx.HTTPError:
+            status_code, ok = 0, False
+        if measure:
+            stats[name].record(time.perf_counter() - start, status_code, ok)
+
+
+async def run(args) -> dict:
+    mix = parse_mix(args.mix)
+    api = args.base_url.rstrip("/") + args.api_prefix
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        users = []
+        for i in range(args.concurrency):
+            user = VirtualUser(
+                client,
+                api,
+                bench_email(i % args.users),
+                random.Random(args.seed + i),
+                [],
+                [],
+            )
+            response = await user.login()
+            if not user.sid:
+                raise SystemExit(
+                    f"Login für {user.email} fehlgeschlagen ({response.status_code}),"
+                    " Datenbank mit benchmarks.seed befüllt?"
+                )
+            users.append(user)
+
+        tag_ids = await _fetch_ids(users[0], "/tag")
+        vehicle_ids = await _fetch_ids(users[0], "/vehicle")
+        for user in users:
+            user.tag_ids, user.vehicle_ids = tag_ids, vehicle_ids
+
+        stats = {name: ScenarioStats() for name in mix}
+        if args.warmup:
+            deadline = time.perf_counter() + args.warmup
+            budget = [sys.maxsize]
+            await asyncio.gather(
+                *(_worker(u, mix, stats, deadline, budget, False) for u in users)
+            )
+
+        budget = [args.requests or sys.maxsize]
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(
+            *(_worker(u, mix, stats, deadline, budget, True) for u in users)
+        )
+        elapsed = time.perf_counter() - start
+
+    total = ScenarioStats()
+    for scenario in stats.values():
+        total.latencies.extend(scenario.latencies)
+        total.errors += scenario.errors
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration_s": round(elapsed, 2),
+            "warmup_s": args.warmup,
+            "seed": args.seed,
+            "mix": mix,
+        },
+        "scenarios": {name: summarize(s, elapsed) for name, s in stats.items()},
+        "total": summarize(total, elapsed),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--api-prefix", default="/api/v1")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30, help="Sekunden")
+    parser.add_argument("--warmup", type=float, default=5, help="Sekunden")
+    parser.add_argument(
+        "--requests", type=int, default=0, help="Maximale Anzahl (0 = unbegrenzt)"
+    )
+    parser.add_argument(
+        "--users", type=int, default=50, help="Anzahl der geseedeten Benutzer"
+    )
+    parser.add_argument(
+        "--mix",
+        help="Gewichtung, z.B. events_default=5,login=1 (Standard: DEFAULT_MIX)",
+    )
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="JSON-Datei (Standard: stdout)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    result = asyncio.run(run(args))
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(output)
+    else:
+        print(output)
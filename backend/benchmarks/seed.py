@@ -0,0 +1,225 @@
+"""
+Befüllt eine PostGIS-Datenbank mit einem synthetischen Datensatz für Lasttests
+
+Verwendet dieselbe Konfiguration wie die API (DB_HOST, DB_NAME, ...). Der
+Datensatz ist über --seed reproduzierbar. Mit --truncate werden Events, Issues,
+Tags, Fahrzeugtypen und die Benchmark-Benutzer vorher gelöscht, daher nur gegen
+eine eigene Benchmark-Datenbank verwenden.
+
+    cd backend && uv run python -m benchmarks.seed --events 50000 --truncate
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(BACKEND_DIR), str(BACKEND_DIR / "app")]
+
+from sqlalchemy import delete, insert, select, text  # noqa: E402
+
+import main  # noqa: E402,F401  (registriert alle Modelle)
+from benchmarks.common import (  # noqa: E402
+    BENCH_EMAIL_DOMAIN,
+    BENCH_PASSWORD,
+    bench_email,
+)
+from domain.auth.service import hash_password  # noqa: E402
+from domain.event.model import Event, event_tags, event_vehicles  # noqa: E402
+from domain.issue.model import Issue, issue_tags  # noqa: E402
+from domain.role.model import Role  # noqa: E402
+from domain.tag.model import Tag  # noqa: E402
+from domain.user.model import User  # noqa: E402
+from domain.vehicletype.model import VehicleType  # noqa: E402
+from infrastructure.postgresql.db import engine  # noqa: E402
+
+CHUNK_SIZE = 5000
+
+# Grob der DACH-Raum, damit Distanzfilter realistische Treffermengen liefern
+MIN_LON, MAX_LON = 5.9, 17.2
+MIN_LAT, MAX_LAT = 45.8, 55.1
+
+WORDS = [
+    "Brand", "Waldbrand", "Flächenbrand", "Rauch", "Glutnest", "Einsatz",
+    "Wiese", "Forst", "Feld", "Scheune", "Böschung", "Unterholz",
+]  # fmt: skip
+
+
+def _chunks(rows, size=CHUNK_SIZE):
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _point(rng: random.Random) -> str:
+    lon = rng.uniform(MIN_LON, MAX_LON)
+    lat = rng.uniform(MIN_LAT, MAX_LAT)
+    return f"SRID=4326;POINT({lon:.6f} {lat:.6f})"
+
+
+def _created_at(rng: random.Random, now: datetime, days: int) -> datetime:
+    return now - timedelta(seconds=rng.randint(0, days * 86400))
+
+
+def truncate(conn) -> None:
+    conn.execute(
+        text(
+            "TRUNCATE event_tags, event_vehicles, issue_tags, event, issue, "
+            "tag, vehicletype RESTART IDENTITY CASCADE"
+        )
+    )
+    conn.execute(delete(User).where(User.email.like(f"%@{BENCH_EMAIL_DOMAIN}")))
+
+
+def _role_id(conn, name: str) -> int:
+    role_id = conn.scalar(select(Role.id).where(Role.name == name))
+    if role_id is None:
+        role_id = conn.scalar(insert(Role).values(name=name).returning(Role.id))
+    return role_id
+
+
+def _insert_returning_ids(conn, model, rows) -> list:
+    ids = []
+    for chunk in _chunks(rows):
+        ids.extend(
+            conn.scalars(
+                insert(model).returning(model.id, sort_by_parameter_order=True),
+                chunk,
+            )
+        )
+    return ids
+
+
+def _insert_associations(conn, table, rows) -> None:
+    for chunk in _chunks(rows):
+        conn.execute(insert(table), chunk)
+
+
+def seed(args) -> dict:
+    rng = random.Random(args.seed)
+    now = datetime.now()
+    with engine.begin() as conn:
+        if args.truncate:
+            truncate(conn)
+
+        user_role = _role_id(conn, "user")
+        _role_id(conn, "admin")
+
+        # Ein Hash für alle Benutzer, bcrypt wäre sonst der teuerste Teil
+        password = hash_password(BENCH_PASSWORD)
+        user_ids = _insert_returning_ids(
+            conn,
+            User,
+            [
+                {
+                    "email": bench_email(i),
+                    "first_name": "Bench",
+                    "last_name": f"User {i}",
+                    "password": password,
+                    "role_id": user_role,
+                }
+                for i in range(args.users)
+            ],
+        )
+        tag_ids = _insert_returning_ids(
+            conn, Tag, [{"name": f"Tag {i}"} for i in range(args.tags)]
+        )
+        vehicle_ids = _insert_returning_ids(
+            conn, VehicleType, [{"name": f"Fahrzeug {i}"} for i in range(args.vehicles)]
+        )
+
+        event_ids = _insert_returning_ids(
+            conn,
+            Event,
+            [
+                {
+                    "name": _text(rng, 2),
+                    "description": _text(rng, 8),
+                    "location": _point(rng),
+                    "created_by": rng.choice(user_ids),
+                    "created_at": _created_at(rng, now, args.days),
+                }
+                for _ in range(args.events)
+            ],
+        )
+        _insert_associations(
+            conn,
+            event_tags,
+            [
+                {"event_id": event_id, "tag_id": tag_id}
+                for event_id in event_ids
+                for tag_id in rng.sample(tag_ids, rng.randint(1, min(3, len(tag_ids))))
+            ],
+        )
+        _insert_associations(
+            conn,
+            event_vehicles,
+            [
+                {"event_id": event_id, "vehicle_id": vehicle_id}
+                for event_id in event_ids
+                for vehicle_id in rng.sample(
+                    vehicle_ids, rng.randint(1, min(2, len(vehicle_ids)))
+                )
+            ],
+        )
+
+        issue_ids = _insert_returning_ids(
+            conn,
+            Issue,
+            [
+                {
+                    "name": _text(rng, 2),
+                    "description": _text(rng, 8),
+                    "location": _point(rng),
+                    "created_by_user_id": rng.choice(user_ids),
+                    "created_at": _created_at(rng, now, args.days),
+                }
+                for _ in range(args.issues)
+            ],
+        )
+        _insert_associations(
+            conn,
+            issue_tags,
+            [
+                {"issue_id": issue_id, "tag_id": tag_id}
+                for issue_id in issue_ids
+                for tag_id in rng.sample(tag_ids, rng.randint(1, min(2, len(tag_ids))))
+            ],
+        )
+        conn.execute(text("ANALYZE event, issue, event_tags, event_vehicles"))
+
+    return {
+        "users": len(user_ids),
+        "tags": len(tag_ids),
+        "vehicles": len(vehicle_ids),
+        "events": len(event_ids),
+        "issues": len(issue_ids),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--issues", type=int, default=5000)
+    parser.add_argument("--tags", type=int, default=30)
+    parser.add_argument("--vehicles", type=int, default=15)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument(
+        "--days", type=int, default=365, help="Zeitraum der created_at-Werte"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--truncate", action="store_true")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    start = time.perf_counter()
+    counts = seed(args)
+    print(f"Seeded {counts} in {time.perf_counter() - start:.1f}s")
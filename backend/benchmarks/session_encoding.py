@@ -0,0 +1,154 @@
+"""
+Vergleicht die Session-Kodierungen (JSON-String vs. Redis-Hash)
+
+Misst Kodieren/Dekodieren im Prozess und den Speicherbedarf pro Session in
+einer laufenden Redis-Instanz. Die Sessions werden unter einem eigenen Prefix
+angelegt und danach wieder gelöscht.
+
+    cd backend && uv run python -m benchmarks.session_encoding \\
+        --redis-url redis://localhost:6379/15 --sessions 100000
+"""
+
+import argparse
+import json
+import secrets
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import redis
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from infrastructure.redis.session_codec import (  # noqa: E402
+    decode_legacy_session,
+    decode_session,
+    encode_session,
+)
+
+PREFIX = "bench_session:"
+BATCH = 1000
+
+
+def _hash_session(user_id: int) -> dict:
+    now = int(time.time())
+    return {
+        "user_id": user_id,
+        "created_at": now,
+        "last_accessed": now,
+        "state": "active",
+        "principal": {
+            "id": user_id,
+            "role": "user",
+            "deactivated": False,
+            "otp_configured": True,
+            "version": 0,
+        },
+    }
+
+
+def _legacy_session(user_id: int) -> str:
+    # Format vor der Umstellung (ohne Principal)
+    return json.dumps(
+        {
+            "user_id": user_id,
+            "created_at": datetime.now().isoformat(),
+            "last_accessed": datetime.now().isoformat(),
+            "state": "active",
+        }
+    )
+
+
+def _timed(label: str, func: Callable, items: List) -> Dict[str, float]:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    elapsed = time.perf_counter() - start
+    return {f"{label}_us": round(elapsed / len(items) * 1_000_000, 3)}
+
+
+def measure_codec(count: int) -> dict:
+    sessions = [_hash_session(i) for i in range(count)]
+    legacy = [_legacy_session(i) for i in range(count)]
+    fields = [
+        {key: str(value) for key, value in encode_session(s).items()}
+        for s in sessions
+    ]
+    result = {}
+    result.update(_timed("hash_encode", encode_session, sessions))
+    result.update(_timed("hash_decode", decode_session, fields))
+    result.update(_timed("legacy_decode", decode_legacy_session, legacy))
+    result.update(_timed("legacy_encode", json.dumps, [json.loads(v) for v in legacy]))
+    return result
+
+
+def _write(client: redis.Redis, keys: List[str], write: Callable) -> int:
+    """Schreibt die Sessions und liefert den Zuwachs von used_memory"""
+    before = client.info("memory")["used_memory"]
+    for offset in range(0, len(keys), BATCH):
+        pipe = client.pipeline(transaction=False)
+        for i, key in enumerate(keys[offset : offset + BATCH], start=offset):
+            write(pipe, key, i)
+        pipe.execute()
+    return client.info("memory")["used_memory"] - before
+
+
+def _delete(client: redis.Redis, keys: List[str]) -> None:
+    for offset in range(0, len(keys), BATCH):
+        client.delete(*keys[offset : offset + BATCH])
+
+
+def measure_memory(client: redis.Redis, count: int, ttl: int) -> dict:
+    result = {}
+    encodings = {
+        "legacy_json": lambda pipe, key, i: pipe.setex(key, ttl, _legacy_session(i)),
+        "hash": lambda pipe, key, i: (
+            pipe.hset(key, mapping=encode_session(_hash_session(i))),
+            pipe.expire(key, ttl),
+        ),
+    }
+    for name, write in encodings.items():
+        keys = [f"{PREFIX}{name}:{secrets.token_urlsafe(32)}" for _ in range(count)]
+        try:
+            used = _write(client, keys, write)
+            sample = keys[:: max(1, count // 100)]
+            usage = [client.memory_usage(key) or 0 for key in sample]
+            result[name] = {
+                "used_memory_bytes_per_session": round(used / count, 1),
+                "memory_usage_bytes_per_key": round(sum(usage) / len(usage), 1),
+                "encoding": client.object("encoding", keys[0]),
+            }
+        finally:
+            _delete(client, keys)
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--ttl", type=int, default=3600)
+    parser.add_argument(
+        "--codec-only", action="store_true", help="Ohne Redis, nur Kodierung messen"
+    )
+    parser.add_argument("--output", help="JSON-Datei (Standard: stdout)")
+    args = parser.parse_args(argv)
+
+    result = {"sessions": args.sessions, "codec": measure_codec(args.sessions)}
+    if not args.codec_only:
+        client = redis.Redis.from_url(args.redis_url, decode_responses=True)
+        result["memory"] = measure_memory(client, args.sessions, args.ttl)
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(output)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Lokaler Stub-Empfänger für Webhooks (Entwicklung und Lasttests)
+
+Prüft Zeitstempel und Signatur jeder Anfrage, zählt die empfangenen
+Änderungen und gibt regelmäßig den Durchsatz aus. Mit --fail-rate antwortet
+er zufällig mit 503, um Backoff und Wiederholungen des Workers zu testen.
+
+    cd backend && uv run python -m benchmarks.webhook_receiver \\
+        --port 9000 --secret <secret aus POST /api/v1/webhook>
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from misc.sign import verify_message_signature  # noqa: E402
+
+# Maximale Abweichung des Zeitstempels (Schutz vor Replays)
+TOLERANCE_SECONDS = 300
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.changes = 0
+        self.rejected = 0
+        self.failed = 0
+        self.seen_ids = set()
+        self.duplicates = 0
+
+
+def make_handler(args, stats: Stats):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            timestamp = self.headers.get("X-Webhook-Timestamp", "")
+            signature = self.headers.get("X-Webhook-Signature", "")
+
+            if not self._valid(body, timestamp, signature):
+                with stats.lock:
+                    stats.rejected += 1
+                self._respond(401)
+                return
+            if random.random() < args.fail_rate:
+                with stats.lock:
+                    stats.failed += 1
+                self._respond(503)
+                return
+
+            deliveries = json.loads(body)["deliveries"]
+            with stats.lock:
+                stats.requests += 1
+                stats.changes += len(deliveries)
+                for delivery in deliveries:
+                    if delivery["id"] in stats.seen_ids:
+                        stats.duplicates += 1
+                    stats.seen_ids.add(delivery["id"])
+            if args.verbose:
+                for delivery in deliveries:
+                    print(json.dumps(delivery, ensure_ascii=False))
+            self._respond(204)
+
+        def _valid(self, body: bytes, timestamp: str, signature: str) -> bool:
+            try:
+                if abs(time.time() - int(timestamp)) > TOLERANCE_SECONDS:
+                    return False
+            except ValueError:
+                return False
+            message = f"{timestamp}.".encode() + body
+            return verify_message_signature(message, signature, args.secret)
+
+        def _respond(self, status: int):
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *log_args):
+            pass
+
+    return Handler
+
+
+def report(stats: Stats, interval: float, stopped: threading.Event):
+    last_changes, last_time = 0, time.monotonic()
+    while not stopped.wait(interval):
+        now = time.monotonic()
+        with stats.lock:
+            changes = stats.changes
+            line = (
+                f"Anfragen={stats.requests} Änderungen={changes} "
+                f"Duplikate={stats.duplicates} abgewiesen={stats.rejected} "
+                f"503={stats.failed}"
+            )
+        rate = (changes - last_changes) / (now - last_time)
+        print(f"{line} ({rate:.0f} Änderungen/s)", flush=True)
+        last_changes, last_time = changes, now
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--secret", required=True, help="Secret des Endpoints")
+    parser.add_argument(
+        "--fail-rate", type=float, default=0.0, help="Anteil der Anfragen mit 503"
+    )
+    parser.add_argument("--interval", type=float, default=5, help="Sekunden")
+    parser.add_argument("--verbose", action="store_true", help="Änderungen ausgeben")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    stats = Stats()
+    stopped = threading.Event()
+    threading.Thread(
+        target=report, args=(stats, args.interval, stopped), daemon=True
+    ).start()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args, stats))
+    print(f"Webhook-Empfänger auf http://{args.host}:{args.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stopped.set()
+        server.server_close()
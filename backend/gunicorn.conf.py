@@ -0,0 +1,19 @@
+"""
+gunicorn-Konfiguration für den Betrieb mit mehreren Workern
+
+Start: PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus gunicorn -c gunicorn.conf.py main:app
+(aus dem Verzeichnis app/). Das Verzeichnis muss vor jedem Start leer sein.
+"""
+
+import os
+
+from prometheus_client import multiprocess
+
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+bind = f"0.0.0.0:{os.environ.get('API_PORT', '8000')}"
+
+
+def child_exit(server, worker):
+    # Live-Gauges (in-flight, Pool) des beendeten Workers nicht mehr mitzählen
+    multiprocess.mark_process_dead(worker.pid)
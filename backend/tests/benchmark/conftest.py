@@ -0,0 +1,76 @@
+import fakeredis
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+class CountingRedis(fakeredis.FakeRedis):
+    """FakeRedis-Client, der die ausgeführten Befehle mitschreibt"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commands: list[str] = []
+
+    def execute_command(self, *args, **options):
+        self.commands.append(str(args[0]).upper())
+        return super().execute_command(*args, **options)
+
+
+@pytest.fixture
+def counting_redis():
+    """FakeRedis-Client mit Liste der ausgeführten Befehle (client.commands)"""
+    return CountingRedis(decode_responses=True)
+
+
+@pytest.fixture
+def listing_seed(db_session):
+    """60 Events und Issues mit je mehreren Tags (und Fahrzeugen)"""
+    from geoalchemy2.shape import from_shape
+    from shapely.geometry import Point
+
+    from domain.event.model import Event
+    from domain.issue.model import Issue
+    from domain.role.model import Role
+    from domain.tag.model import Tag
+    from domain.user.model import User
+    from domain.vehicletype.model import VehicleType
+
+    role = Role(name="user", description="Standard user role")
+    db_session.add(role)
+    db_session.flush()
+    user = User(
+        email="benchmark@fire-map.com",
+        first_name="Bench",
+        last_name="Mark",
+        password="not-a-real-hash",
+        role_id=role.id,
+    )
+    tags = [Tag(name=f"bench-tag-{i}") for i in range(5)]
+    vehicles = [VehicleType(name=f"bench-vehicle-{i}") for i in range(3)]
+    db_session.add_all([user, *tags, *vehicles])
+    db_session.flush()
+
+    for i in range(60):
+        location = from_shape(Point(8 + i / 100, 50 + i / 100), srid=4326)
+        db_session.add(
+            Event(
+                name=f"Brand {i}",
+                description="Benchmark",
+                location=location,
+                created_by=user.id,
+                tags=[tags[i % 5], tags[(i + 1) % 5]],
+                vehicles=[vehicles[i % 3]],
+            )
+        )
+        db_session.add(
+            Issue(
+                name=f"Issue {i}",
+                description="Benchmark",
+                location=location,
+                created_by_user_id=user.id,
+                tags=[tags[i % 5]],
+            )
+        )
+    db_session.commit()
+    db_session.expunge_all()
+    return {"tags": tags, "vehicles": vehicles}
@@ -0,0 +1,42 @@
+import asyncio
+
+from domain.event.dto import EventFilter, EventResponse
+from domain.event.repository import EventRepository
+from domain.issue.dto import IssueFilter, IssueResponse
+from domain.issue.repository import IssueRepository
+
+
+def test_get_filtered_events(benchmark, db_session, listing_seed, count_queries):
+    repository = EventRepository(db_session)
+    filters = EventFilter(tag_ids=[listing_seed["tags"][0].id], limit=50)
+
+    def list_events():
+        events, total = asyncio.run(repository.get_filtered_events(filters))
+        # Serialisierung gehört dazu, dort entstanden früher die Lazy Loads
+        return [EventResponse.model_validate(e) for e in events], total
+
+    with count_queries() as counter:
+        events, total = list_events()
+    # count, Seite, Tags und Fahrzeuge der Seite
+    assert counter.count == 4, counter.statements
+    assert total == len(events) == 24
+
+    benchmark(list_events)
+
+
+def test_get_filtered_issues(benchmark, db_session, listing_seed, count_queries):
+    repository = IssueRepository(db_session)
+    filters = IssueFilter(limit=50)
+
+    def list_issues():
+        issues, total = repository.get_filtered_issues(filters)
+        return [IssueResponse.model_validate(i) for i in issues], total
+
+    with count_queries() as counter:
+        issues, total = list_issues()
+    # Seite, Tags der Seite, count
+    assert counter.count == 3, counter.statements
+    assert len(issues) == 50
+    assert total == 60
+
+    benchmark(list_issues)
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import pytest
+from geoalchemy2.shape import from_shape
+from shapely.geometry import Point
+
+import main  # noqa: F401 - registriert alle Modelle
+from domain.event.dto import EventResponse, PaginatedEventResponse
+from domain.event.model import Event
+from domain.issue.dto import IssueResponse, PaginatedIssueResponse
+from domain.issue.model import Issue
+from domain.tag.model import Tag
+from domain.vehicletype.model import VehicleType
+
+PAGE_SIZE = 100
+
+
+@pytest.fixture(scope="module")
+def tags():
+    return [Tag(id=i, name=f"tag-{i}") for i in range(5)]
+
+
+@pytest.fixture(scope="module")
+def events(tags):
+    vehicles = [VehicleType(id=i, name=f"vehicle-{i}") for i in range(3)]
+    return [
+        Event(
+            id=i,
+            name=f"Brand {i}",
+            description="Benchmark",
+            location=from_shape(Point(8 + i / 1000, 50), srid=4326),
+            created_by=1,
+            created_at=datetime(2025, 1, 1),
+            tags=tags[:2],
+            vehicles=vehicles[:1],
+        )
+        for i in range(PAGE_SIZE)
+    ]
+
+
+@pytest.fixture(scope="module")
+def issues(tags):
+    return [
+        Issue(
+            id=i,
+            name=f"Issue {i}",
+            description="Benchmark",
+            location=from_shape(Point(8 + i / 1000, 50), srid=4326),
+            created_by_user_id=1,
+            created_at=datetime(2025, 1, 1),
+            tags=tags[:1],
+        )
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def test_event_page_serialization(benchmark, events):
+    def serialize():
+        page = PaginatedEventResponse(
+            events=[EventResponse.model_validate(e) for e in events],
+            total_count=PAGE_SIZE,
+            page=1,
+            limit=PAGE_SIZE,
+            total_pages=1,
+        )
+        return page.model_dump_json()
+
+    body = benchmark(serialize)
+    assert body.count('"location":[8.0') >= 1
+
+
+def test_issue_page_serialization(benchmark, issues):
+    def serialize():
+        page = PaginatedIssueResponse(
+            issues=[IssueResponse.model_validate(i) for i in issues],
+            total_count=PAGE_SIZE,
+            page=1,
+            limit=PAGE_SIZE,
+            total_pages=1,
+        )
+        return page.model_dump_json()
+
+    body = benchmark(serialize)
+    assert '"tags":[{"id":0' in body
@@ -0,0 +1,73 @@
+import json
+import time
+from datetime import datetime
+
+from infrastructure.redis.redis_client import RedisSessionManager
+from infrastructure.redis.session_codec import (
+    decode_legacy_session,
+    decode_session,
+    encode_session,
+)
+
+SESSION = {
+    "user_id": 42,
+    "created_at": 1_760_000_000,
+    "last_accessed": 1_760_000_300,
+    "state": "active",
+    "principal": {
+        "id": 42,
+        "role": "admin",
+        "deactivated": False,
+        "otp_configured": True,
+        "version": 3,
+    },
+}
+
+
+def test_get_session(benchmark, counting_redis):
+    manager = RedisSessionManager(counting_redis)
+    session_id = manager.create_session(42)
+    # Erster Aufruf lädt das Lua-Skript (SCRIPT LOAD)
+    manager.get_session(session_id)
+
+    counting_redis.commands.clear()
+    assert manager.get_session(session_id)["user_id"] == 42
+    # Lesen und last_accessed setzen in einem Skriptaufruf
+    assert counting_redis.commands == ["EVALSHA"]
+
+    benchmark(manager.get_session, session_id)
+
+
+def test_get_missing_session(benchmark, counting_redis):
+    manager = RedisSessionManager(counting_redis)
+    manager.get_session("does-not-exist")
+
+    counting_redis.commands.clear()
+    assert manager.get_session("does-not-exist") is None
+    assert counting_redis.commands == ["EVALSHA"]
+
+    benchmark(manager.get_session, "does-not-exist")
+
+
+def test_encode_session(benchmark):
+    fields = benchmark(encode_session, SESSION)
+    assert decode_session({key: str(value) for key, value in fields.items()}) == (
+        SESSION
+    )
+
+
+def test_decode_session(benchmark):
+    fields = {key: str(value) for key, value in encode_session(SESSION).items()}
+    assert benchmark(decode_session, fields) == SESSION
+
+
+def test_decode_legacy_session(benchmark):
+    raw = json.dumps(
+        {
+            "user_id": 42,
+            "created_at": datetime.now().isoformat(),
+            "last_accessed": datetime.now().isoformat(),
+            "state": "active",
+        }
+    )
+    assert benchmark(decode_legacy_session, raw)["created_at"] <= time.time()
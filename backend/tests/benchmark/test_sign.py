@@ -0,0 +1,19 @@
+import uuid
+
+from misc.sign import create_signed_token, verify_signed_signed_token
+
+SECRET = "benchmark-secret"
+
+
+def test_verify_signed_token(benchmark):
+    invite_uuid = str(uuid.uuid4())
+    token = create_signed_token(invite_uuid, SECRET)
+
+    assert benchmark(verify_signed_signed_token, token, SECRET) == (True, invite_uuid)
+
+
+def test_reject_tampered_token(benchmark):
+    token = create_signed_token(str(uuid.uuid4()), SECRET)
+    tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+    assert benchmark(verify_signed_signed_token, tampered, SECRET) == (False, None)
@@ -0,0 +1,87 @@
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# Die App importiert ihre Module relativ zu backend/app (z.B. "domain.event")
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+# Savepoints stammen aus dem Test-Setup und werden nicht mitgezählt
+_TRANSACTION_CONTROL = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryCounter:
+    """Zählt die SQL-Statements, die über eine Connection ausgeführt werden"""
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_TRANSACTION_CONTROL):
+            self.statements.append(statement)
+
+
+@pytest.fixture(scope="session")
+def db_connection():
+    """
+    Verbindung zur konfigurierten PostGIS-Datenbank (DB_* Umgebungsvariablen).
+
+    Alle Änderungen laufen in einer äußeren Transaktion, die am Ende
+    zurückgerollt wird. Ohne erreichbare Datenbank werden die Tests übersprungen.
+    """
+    from sqlalchemy.exc import OperationalError
+
+    import main  # noqa: F401 - registriert alle Modelle und Router
+    from infrastructure.postgresql.db import engine, Base
+
+    try:
+        connection = engine.connect()
+    except OperationalError:
+        pytest.skip("PostgreSQL/PostGIS ist nicht erreichbar")
+
+    transaction = connection.begin()
+    Base.metadata.create_all(connection)
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(db_connection):
+    """ORM-Session, deren Commits nur Savepoints innerhalb des Tests freigeben"""
+    from sqlalchemy.orm import Session
+
+    nested = db_connection.begin_nested()
+    session = Session(
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    yield session
+    session.close()
+    nested.rollback()
+
+
+@pytest.fixture
+def count_queries(db_connection):
+    """Context-Manager, der die ausgeführten SQL-Statements zählt"""
+    from sqlalchemy import event
+
+    @contextmanager
+    def _count_queries():
+        counter = QueryCounter()
+        event.listen(db_connection, "before_cursor_execute", counter)
+        try:
+            yield counter
+        finally:
+            event.remove(db_connection, "before_cursor_execute", counter)
+
+    return _count_queries
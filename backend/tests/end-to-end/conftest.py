@@ -0,0 +1,114 @@
+import pytest
+from geoalchemy2.shape import from_shape
+from shapely.geometry import Point
+
+
+@pytest.fixture
+def seed(db_session):
+    """Legt Rollen, einen Benutzer, Tags, Fahrzeuge und ein Event an"""
+    from domain.role.model import Role
+    from domain.user.model import User
+    from domain.tag.model import Tag
+    from domain.vehicletype.model import VehicleType
+    from domain.event.model import Event
+
+    user_role = Role(name="user", description="Standard user role")
+    db_session.add(user_role)
+    db_session.flush()
+
+    user = User(
+        email="query-count@fire-map.com",
+        first_name="Query",
+        last_name="Count",
+        password="not-a-real-hash",
+        role_id=user_role.id,
+    )
+    tags = [Tag(name=f"tag-{i}") for i in range(3)]
+    vehicles = [VehicleType(name=f"vehicle-{i}") for i in range(2)]
+    db_session.add_all([user, *tags, *vehicles])
+    db_session.flush()
+
+    event = Event(
+        name="Waldbrand",
+        description="Test",
+        location=from_shape(Point(8.68, 50.11), srid=4326),
+        created_by=user.id,
+        tags=tags[:1],
+        vehicles=vehicles[:1],
+    )
+    db_session.add(event)
+    db_session.commit()
+    db_session.expunge_all()
+    return {"user": user, "tags": tags, "vehicles": vehicles, "event": event}
+
+
+@pytest.fixture
+def client(db_session, seed, monkeypatch):
+    """TestClient mit Test-Session und einer Redis-Session für den Seed-Benutzer"""
+    import fakeredis
+    from fastapi.testclient import TestClient
+
+    from main import app
+    from config.config_provider import get_config
+    from infrastructure.postgresql.db import get_db
+    from infrastructure.redis.redis_client import session_manager
+    from infrastructure.redis.rate_limiter import rate_limiter
+    from infrastructure.redis.table_versions import table_versions
+    from domain.common.reference_cache import reference_cache
+    from domain.event.changes import event_changes
+    from infrastructure.redis.notification_queue import notification_queue
+    from domain.event.heatmap import heatmap_tiles
+    from infrastructure.redis.query_cache import query_cache
+    from infrastructure.redis.rollup_dirty_days import rollup_dirty_days
+    from domain.user.principal import Principal
+
+    server = fakeredis.FakeServer()
+    fake_redis = fakeredis.FakeRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(session_manager, "redis", fake_redis)
+    monkeypatch.setattr(table_versions, "redis", fake_redis)
+    monkeypatch.setattr(reference_cache, "redis", fake_redis)
+    monkeypatch.setattr(rate_limiter, "redis", fake_redis)
+    monkeypatch.setattr(event_changes, "redis", fake_redis)
+    monkeypatch.setattr(notification_queue, "redis", fake_redis)
+    monkeypatch.setattr(query_cache, "redis", fake_redis)
+    monkeypatch.setattr(rollup_dirty_days, "redis", fake_redis)
+    # Kacheln sind binär, daher ohne decode_responses (gleicher Fake-Server)
+    monkeypatch.setattr(heatmap_tiles, "redis", fakeredis.FakeRedis(server=server))
+    # Stammdaten jedes Tests liegen in einem eigenen, zurückgerollten Savepoint
+    reference_cache.invalidate()
+    app.dependency_overrides[get_db] = lambda: db_session
+    test_client = TestClient(app)
+    test_client.cookies.set(
+        get_config().session_cookie_id,
+        session_manager.create_session(
+            seed["user"].id,
+            principal=Principal(seed["user"].id, "user", False, False).to_session(),
+        ),
+    )
+    yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def create_event(client):
+    """
+    Legt ein Event über die API an und liefert die Antwort.
+
+    Nicht angegebene Pflichtfelder bekommen Standardwerte (Frankfurt am Main,
+    ohne Tags und Fahrzeuge); location=[] legt ein Event ohne Standort an.
+    """
+
+    def _create_event(name: str = "Brand", **fields) -> dict:
+        payload = {
+            "name": name,
+            "description": "Test",
+            "location": [8.68, 50.11],
+            "tag_ids": [],
+            "vehicle_ids": [],
+            **fields,
+        }
+        response = client.post("/api/v1/event", json=payload)
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return _create_event
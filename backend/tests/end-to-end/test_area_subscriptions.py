@@ -0,0 +1,64 @@
+from domain.subscription.dto import AreaSubscriptionCreate
+from domain.subscription.repository import AreaSubscriptionRepository
+from domain.user.model import User
+from infrastructure.redis.notification_queue import notification_queue
+
+
+def _other_user(db_session, seed):
+    other = User(
+        email="station@fire-map.com",
+        first_name="Wache",
+        last_name="Nord",
+        password="not-a-real-hash",
+        role_id=seed["user"].role_id,
+    )
+    db_session.add(other)
+    db_session.commit()
+    return other
+
+
+def test_new_event_notifies_matching_subscriptions(db_session, seed, create_event):
+    other = _other_user(db_session, seed)
+    repo = AreaSubscriptionRepository(db_session)
+    # Umkreis um Frankfurt und ein Polygon um Hamburg
+    frankfurt = repo.create(
+        AreaSubscriptionCreate(name="FFM", center=[8.68, 50.11], radius_m=5000),
+        other.id,
+    )
+    repo.create(
+        AreaSubscriptionCreate(
+            name="HH", polygon=[[9.8, 53.4], [10.2, 53.4], [10.2, 53.7], [9.8, 53.7]]
+        ),
+        other.id,
+    )
+    # Eigene Abonnements lösen keine Benachrichtigung aus
+    repo.create(
+        AreaSubscriptionCreate(name="own", center=[8.68, 50.11], radius_m=5000),
+        seed["user"].id,
+    )
+
+    event = create_event("Brand", location=[8.70, 50.12])
+
+    notifications = notification_queue.pop_all(other.id)
+    assert [(n["subscription_id"], n["event_id"]) for n in notifications] == [
+        (frankfurt.id, event["id"])
+    ]
+    assert notification_queue.pop_all(seed["user"].id) == []
+
+
+def test_subscription_routes(client):
+    response = client.post(
+        "/api/v1/subscription",
+        json={"name": "Wache", "center": [8.68, 50.11], "radius_m": 1000},
+    )
+    assert response.status_code == 201
+    subscription = response.json()
+    assert subscription["area"][0] == subscription["area"][-1]
+
+    assert [s["id"] for s in client.get("/api/v1/subscription").json()] == [
+        subscription["id"]
+    ]
+    assert client.get("/api/v1/subscription/notifications").json() == []
+    url = f"/api/v1/subscription/{subscription['id']}"
+    assert client.delete(url).status_code == 204
+    assert client.get("/api/v1/subscription").json() == []
@@ -0,0 +1,43 @@
+def test_event_batch_rejects_ids_listed_more_than_once(client, seed, create_event):
+    event_id = seed["event"].id
+    other_id = create_event("Brand")["id"]
+    tag_id = seed["tags"][1].id
+
+    response = client.post(
+        "/api/v1/event/batch",
+        json={
+            "update": [
+                {"id": event_id, "tag_ids": [tag_id]},
+                {"id": event_id, "tag_ids": [tag_id]},
+                {"id": other_id, "name": "Neu"},
+            ],
+            "delete": [other_id],
+        },
+    )
+
+    assert response.status_code == 200
+    statuses = {
+        (r["operation"], r["index"]): r["status"] for r in response.json()["results"]
+    }
+    assert statuses == {
+        ("update", 0): 409,
+        ("update", 1): 409,
+        ("update", 2): 409,
+        ("delete", 0): 409,
+    }
+    # Nichts geändert oder gelöscht
+    event = client.get(f"/api/v1/event/{event_id}").json()
+    assert [tag["id"] for tag in event["tags"]] == [seed["tags"][0].id]
+    assert client.get(f"/api/v1/event/{other_id}").json()["name"] == "Brand"
+
+
+def test_issue_batch_rejects_ids_listed_more_than_once(client):
+    issue_id = client.post("/api/v1/issue", json={"name": "Issue"}).json()["id"]
+
+    response = client.post(
+        "/api/v1/issue/batch",
+        json={"update": [{"id": issue_id, "name": "Neu"}], "delete": [issue_id]},
+    )
+
+    assert [r["status"] for r in response.json()["results"]] == [409, 409]
+    assert client.get(f"/api/v1/issue/{issue_id}").json()["name"] == "Issue"
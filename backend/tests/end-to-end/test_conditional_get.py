@@ -0,0 +1,44 @@
+def test_tag_list_not_modified_without_query(client, count_queries):
+    first = client.get("/api/v1/tag")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"].startswith("private")
+
+    with count_queries() as counter:
+        second = client.get("/api/v1/tag", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert counter.count == 0, counter.statements
+
+
+def test_tag_list_etag_changes_after_update(client, seed):
+    etag = client.get("/api/v1/tag").headers["ETag"]
+    client.put(f"/api/v1/tag/{seed['tags'][0].id}", json={"name": "neu"})
+
+    response = client.get("/api/v1/tag", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_event_not_modified_reads_only_updated_at(client, seed, count_queries):
+    url = f"/api/v1/event/{seed['event'].id}"
+    etag = client.get(url).headers["ETag"]
+
+    with count_queries() as counter:
+        response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert counter.count == 1, counter.statements
+
+
+def test_event_etag_changes_when_tag_is_renamed(client, seed):
+    url = f"/api/v1/event/{seed['event'].id}"
+    etag = client.get(url).headers["ETag"]
+    client.put(f"/api/v1/tag/{seed['tags'][0].id}", json={"name": "umbenannt"})
+
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["tags"][0]["name"] == "umbenannt"
@@ -0,0 +1,51 @@
+import pytest
+
+from config.config_provider import get_config
+
+
+@pytest.fixture(autouse=True)
+def no_settle_window(monkeypatch):
+    # Alle Zeilen eines Tests tragen denselben Transaktions-Zeitstempel
+    monkeypatch.setattr(get_config(), "sync_settle_seconds", 0)
+
+
+def test_changes_feed_reports_updates_and_deletes(client, seed, create_event):
+    first = client.get("/api/v1/event/changes").json()
+    assert [e["id"] for e in first["events"]] == [seed["event"].id]
+    assert first["deleted_ids"] == [] and not first["has_more"]
+
+    created = create_event("Flächenbrand", location=[9.99, 53.55])
+    client.delete(f"/api/v1/event/{seed['event'].id}")
+
+    second = client.get(
+        "/api/v1/event/changes", params={"cursor": first["next_cursor"]}
+    ).json()
+    assert [e["id"] for e in second["events"]] == [created["id"]]
+    assert second["deleted_ids"] == [seed["event"].id]
+
+    third = client.get(
+        "/api/v1/event/changes", params={"cursor": second["next_cursor"]}
+    ).json()
+    assert third["events"] == [] and third["deleted_ids"] == []
+
+
+def test_changes_feed_pages_with_keyset_cursor(client, seed):
+    ids = [
+        client.post("/api/v1/issue", json={"name": f"Issue {i}"}).json()["id"]
+        for i in range(3)
+    ]
+    client.post("/api/v1/issue/batch", json={"delete": [ids[0]]})
+
+    page = client.get("/api/v1/issue/changes", params={"limit": 1}).json()
+    assert [i["id"] for i in page["issues"]] == [ids[1]]
+    assert page["deleted_ids"] == [ids[0]] and page["has_more"]
+    rest = client.get(
+        "/api/v1/issue/changes", params={"limit": 1, "cursor": page["next_cursor"]}
+    ).json()
+    assert [i["id"] for i in rest["issues"]] == [ids[2]]
+    assert rest["deleted_ids"] == [] and not rest["has_more"]
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get("/api/v1/event/changes", params={"cursor": "kaputt"})
+    assert response.status_code == 400
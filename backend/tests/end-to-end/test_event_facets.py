@@ -0,0 +1,51 @@
+def _counts(entries):
+    return {entry["id"]: entry["count"] for entry in entries}
+
+
+def test_facets_count_matches_per_tag_and_vehicle(client, seed, create_event):
+    tags = [tag.id for tag in seed["tags"]]
+    vehicles = [vehicle.id for vehicle in seed["vehicles"]]
+    # Seed-Event: tags[0], vehicles[0]
+    create_event("A", tag_ids=tags[:2], vehicle_ids=[vehicles[1]])
+    create_event("B", tag_ids=[tags[1]])
+
+    facets = client.get("/api/v1/event/facets").json()
+    assert facets["total"] == 3
+    assert _counts(facets["tags"]) == {tags[0]: 2, tags[1]: 2}
+    assert _counts(facets["vehicles"]) == {vehicles[0]: 1, vehicles[1]: 1}
+
+    # Tag-Zahlen ignorieren den eigenen Filter, Fahrzeuge berücksichtigen ihn
+    facets = client.get("/api/v1/event/facets", params={"tag_ids": [tags[1]]}).json()
+    assert facets["total"] == 2
+    assert _counts(facets["tags"]) == {tags[0]: 2, tags[1]: 2}
+    assert _counts(facets["vehicles"]) == {vehicles[1]: 1}
+
+    facets = client.get(
+        "/api/v1/event/facets",
+        params={"tag_ids": [tags[1]], "vehicle_ids": [vehicles[1]], "name": "A"},
+    ).json()
+    assert facets["total"] == 1
+    assert _counts(facets["tags"]) == {tags[0]: 1, tags[1]: 1}
+    assert _counts(facets["vehicles"]) == {vehicles[1]: 1}
+
+
+def test_facet_cache_is_invalidated_by_tag_and_vehicle_deletes(
+    client, seed, create_event
+):
+    tags = [tag.id for tag in seed["tags"]]
+    vehicles = [vehicle.id for vehicle in seed["vehicles"]]
+    create_event("A", tag_ids=[tags[1]], vehicle_ids=[vehicles[1]])
+    facets = client.get("/api/v1/event/facets").json()
+    assert _counts(facets["tags"]) == {tags[0]: 1, tags[1]: 1}
+    timeline = client.get("/api/v1/event/timeline", params={"tag_ids": [tags[1]]})
+    assert timeline.json()["total"] == 1
+
+    # Die Links entfallen per ON DELETE CASCADE, kein Event wird geändert
+    assert client.delete(f"/api/v1/tag/{tags[1]}").status_code == 204
+    assert client.delete(f"/api/v1/vehicle/{vehicles[1]}").status_code == 204
+
+    facets = client.get("/api/v1/event/facets").json()
+    assert _counts(facets["tags"]) == {tags[0]: 1}
+    assert _counts(facets["vehicles"]) == {vehicles[0]: 1}
+    timeline = client.get("/api/v1/event/timeline", params={"tag_ids": [tags[1]]})
+    assert timeline.json()["total"] == 0
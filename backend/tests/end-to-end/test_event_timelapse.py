@@ -0,0 +1,37 @@
+URL = "/api/v1/event/timelapse"
+
+
+def test_timelapse_returns_filtered_events_in_time_order(client, seed, create_event):
+    tag_id = seed["tags"][1].id
+    for i in range(3):
+        create_event(f"Brand {i}", tag_ids=[tag_id], location=[8.7 + 0.01 * i, 50.1])
+    # Ohne Standort: kein Frame
+    create_event("Ohne Ort", tag_ids=[tag_id], location=[])
+
+    frames = client.get(URL).json()
+    assert frames["ids"][0] == seed["event"].id
+    assert len(frames["ids"]) == 4 and not frames["truncated"]
+    assert frames["times"][0] == 0 and min(frames["times"]) >= 0
+    assert [lon / frames["scale"] for lon in frames["lon"][1:]] == [8.7, 8.71, 8.72]
+    assert {lat / frames["scale"] for lat in frames["lat"][1:]} == {50.1}
+
+    filtered = client.get(URL, params={"tag_ids": [tag_id]}).json()
+    assert len(filtered["ids"]) == 3
+
+
+def test_timelapse_is_truncated_at_the_limit(client, seed, create_event, monkeypatch):
+    from config.config_provider import get_config
+
+    monkeypatch.setattr(get_config(), "timelapse_max_events", 1)
+    create_event("Brand", location=[8.7, 50.1])
+
+    frames = client.get(URL).json()
+    assert frames["ids"] == [seed["event"].id]
+    assert frames["truncated"]
+
+
+def test_timelapse_cache_is_invalidated_by_event_writes(client, create_event):
+    assert len(client.get(URL).json()["ids"]) == 1
+    assert len(client.get(URL).json()["ids"]) == 1
+    create_event("Brand", location=[8.7, 50.1])
+    assert len(client.get(URL).json()["ids"]) == 2
@@ -0,0 +1,25 @@
+def test_timeline_counts_filtered_events_per_bucket(client, seed, create_event):
+    tag_id = seed["tags"][1].id
+    for i in range(3):
+        create_event(f"Brand {i}", tag_ids=[tag_id] if i else [])
+
+    timeline = client.get("/api/v1/event/timeline", params={"bucket": "hour"}).json()
+    assert timeline["bucket"] == "hour" and timeline["total"] == 4
+    # Alle Events des Tests tragen den Zeitstempel derselben Transaktion
+    assert [b["count"] for b in timeline["buckets"]] == [4]
+    assert timeline["buckets"][0]["start"].endswith(":00:00")
+
+    filtered = client.get("/api/v1/event/timeline", params={"tag_ids": [tag_id]})
+    assert filtered.json()["total"] == 2
+
+
+def test_timeline_cache_is_invalidated_by_event_writes(client, create_event):
+    assert client.get("/api/v1/event/timeline").json()["total"] == 1
+    assert client.get("/api/v1/event/timeline").json()["total"] == 1
+    create_event("Brand")
+    assert client.get("/api/v1/event/timeline").json()["total"] == 2
+
+
+def test_timeline_rejects_unknown_bucket(client):
+    response = client.get("/api/v1/event/timeline", params={"bucket": "minute"})
+    assert response.status_code == 422
@@ -0,0 +1,42 @@
+import io
+
+from PIL import Image
+
+# Kachel mit dem Seed-Event (Frankfurt am Main)
+TILE = "/api/v1/event/heatmap/10/536/346.png"
+
+
+def _alpha_max(response) -> int:
+    return Image.open(io.BytesIO(response.content)).getextrema()[3][1]
+
+
+def test_heatmap_tile_renders_and_is_cached(client):
+    response = client.get(TILE)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert _alpha_max(response) > 0
+    etag = response.headers["etag"]
+
+    assert client.get(TILE, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(TILE).content == response.content
+
+
+def test_heatmap_tile_is_invalidated_by_event_writes(client, create_event):
+    etag = client.get(TILE).headers["etag"]
+    create_event("Brand", location=[8.69, 50.12])
+    response = client.get(TILE, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_heatmap_tile_honours_filters(client, seed):
+    other_tag = seed["tags"][1].id
+    assert _alpha_max(client.get(TILE, params={"tag_ids": [other_tag]})) == 0
+    seed_tag = seed["tags"][0].id
+    assert _alpha_max(client.get(TILE, params={"tag_ids": [seed_tag]})) > 0
+    # Kachel ohne Events
+    assert _alpha_max(client.get("/api/v1/event/heatmap/10/0/0.png")) == 0
+
+
+def test_heatmap_tile_outside_the_grid(client):
+    assert client.get("/api/v1/event/heatmap/2/4/0.png").status_code == 404
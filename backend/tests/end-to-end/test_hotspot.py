@@ -0,0 +1,43 @@
+import pytest
+from shapely.geometry import Point, Polygon
+
+from workers.hotspot_worker import compute
+
+URL = "/api/v1/hotspot"
+
+
+@pytest.fixture
+def events(seed, create_event):
+    """Cluster in Frankfurt (mit dem Seed-Event) und verstreute Events"""
+    for i in range(10):
+        create_event(f"C{i}", location=[8.68 + 0.001 * i, 50.11 + 0.001 * (i % 3)])
+    for i in range(10):
+        create_event(f"S{i}", location=[8.0 + 0.2 * i, 49.5 + 0.15 * (i % 5)])
+
+
+def test_worker_stores_hotspots_served_by_the_api(client, events, db_session):
+    assert client.get(URL).json() == []
+
+    assert compute(db_session, "event") == 1
+    assert compute(db_session, "issue") == 0
+
+    hotspots = client.get(URL).json()
+    assert len(hotspots) == 1
+    hotspot = hotspots[0]
+    assert Polygon(hotspot["area"]).contains(Point(8.685, 50.11))
+    assert hotspot["events"] == 11
+    assert hotspot["score"] > 2.58
+    assert client.get(URL, params={"source": "issue"}).json() == []
+
+
+def test_next_run_replaces_the_hotspots(client, events, db_session):
+    compute(db_session, "event")
+    first = client.get(URL).json()
+    compute(db_session, "event")
+    second = client.get(URL).json()
+    assert len(second) == len(first) == 1
+    assert second[0]["id"] != first[0]["id"]
+
+
+def test_unknown_source_is_rejected(client):
+    assert client.get(URL, params={"source": "user"}).status_code == 422
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+from domain.invite.model import Invite
+from domain.user.model import PasswordReset, PasswordResetType
+from domain.user.repository import UserRepository
+from workers.purge_worker import purge_expired
+
+
+def _reset(user_id, code, expire_date, is_used=False):
+    return PasswordReset(
+        reset_type=PasswordResetType.FORGOT,
+        reset_code=code,
+        expire_date=expire_date,
+        for_user_id=user_id,
+        is_used=is_used,
+    )
+
+
+def test_reset_code_is_scoped_by_email(db_session, seed):
+    from domain.user.model import User
+
+    other = User(
+        email="other@fire-map.com",
+        first_name="Other",
+        last_name="User",
+        password="not-a-real-hash",
+        role_id=seed["user"].role_id,
+    )
+    db_session.add(other)
+    db_session.flush()
+    soon = datetime.now() + timedelta(minutes=15)
+    # Derselbe Code für zwei Benutzer ist erlaubt
+    db_session.add_all(
+        [
+            _reset(seed["user"].id, "123456", soon, is_used=True),
+            _reset(seed["user"].id, "123456", soon),
+            _reset(other.id, "123456", soon),
+        ]
+    )
+    db_session.commit()
+    repo = UserRepository(db_session)
+
+    pw_reset = repo.get_open_pw_reset_by_code(seed["user"].email, "123456")
+    assert pw_reset.for_user_id == seed["user"].id
+    assert not pw_reset.is_used
+
+    repo.set_pw_reset_used(pw_reset.id)
+    assert repo.get_open_pw_reset_by_code(seed["user"].email, "123456") is None
+    assert repo.get_open_pw_reset_by_code(other.email, "123456") is not None
+
+
+def test_purge_removes_only_long_expired_rows(db_session, seed):
+    now = datetime.now()
+    user_id = seed["user"].id
+    db_session.add_all(
+        [
+            _reset(user_id, "111111", now - timedelta(days=30)),
+            _reset(user_id, "222222", now - timedelta(days=1)),
+            Invite(email="old@fire-map.com", expire_date=now - timedelta(days=30)),
+            Invite(email="new@fire-map.com", expire_date=now + timedelta(days=7)),
+        ]
+    )
+    db_session.commit()
+
+    assert purge_expired(db_session, now) == {
+        "pw_reset": 1,
+        "invite": 1,
+        "tombstone": 0,
+        "webhook_delivery": 0,
+    }
+    assert db_session.query(PasswordReset).count() == 1
+    assert [i.email for i in db_session.query(Invite)] == ["new@fire-map.com"]
@@ -0,0 +1,77 @@
+def test_update_event_fields_query_count(client, seed, count_queries):
+    event_id = seed["event"].id
+    with count_queries() as counter:
+        response = client.put(f"/api/v1/event/{event_id}", json={"name": "Neu"})
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Neu"
+    # user + role, UPDATE ... RETURNING, tags + vehicles für die Antwort
+    assert counter.count <= 5, counter.statements
+
+
+def test_update_event_tags_query_count(client, seed, count_queries):
+    event_id = seed["event"].id
+    tag_ids = [tag.id for tag in seed["tags"]]
+    with count_queries() as counter:
+        response = client.put(f"/api/v1/event/{event_id}", json={"tag_ids": tag_ids})
+
+    assert response.status_code == 200
+    assert sorted(tag["id"] for tag in response.json()["tags"]) == sorted(tag_ids)
+    # user + role, UPDATE ... RETURNING, Tags laden, Zuordnungen ersetzen, vehicles
+    assert counter.count <= 7, counter.statements
+
+
+def test_delete_event_query_count(client, seed, count_queries):
+    event_id = seed["event"].id
+    with count_queries() as counter:
+        response = client.delete(f"/api/v1/event/{event_id}")
+
+    assert response.status_code == 204
+    # DELETE ... RETURNING, Tombstone, Webhook-Outbox
+    assert counter.count <= 3, counter.statements
+
+
+def test_delete_missing_event_returns_404(client, count_queries):
+    with count_queries() as counter:
+        response = client.delete("/api/v1/event/999999")
+
+    assert response.status_code == 404
+    # user + role, DELETE ... RETURNING, Existenzprüfung nur im Fehlerfall
+    assert counter.count <= 4, counter.statements
+
+
+def test_update_tag_query_count(client, seed, count_queries):
+    tag_id = seed["tags"][0].id
+    with count_queries() as counter:
+        response = client.put(f"/api/v1/tag/{tag_id}", json={"name": "umbenannt"})
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "umbenannt"
+    assert counter.count == 1, counter.statements
+
+
+def test_delete_vehicle_query_count(client, seed, count_queries):
+    vehicle_id = seed["vehicles"][1].id
+    with count_queries() as counter:
+        response = client.delete(f"/api/v1/vehicle/{vehicle_id}")
+
+    assert response.status_code == 204
+    assert counter.count == 1, counter.statements
+
+
+def test_event_facets_query_count(client, count_queries):
+    with count_queries() as counter:
+        response = client.get("/api/v1/event/facets")
+
+    assert response.status_code == 200
+    # Alle Facetten und die Gesamtzahl in einer Abfrage (GROUPING SETS)
+    assert counter.count == 1, counter.statements
+
+
+def test_event_timelapse_query_count(client, count_queries):
+    with count_queries() as counter:
+        response = client.get("/api/v1/event/timelapse")
+
+    assert response.status_code == 200
+    # Ein sortierter Scan, unabhängig von der Anzahl der Events
+    assert counter.count == 1, counter.statements
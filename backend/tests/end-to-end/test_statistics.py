@@ -0,0 +1,82 @@
+import pytest
+
+from infrastructure.redis.rollup_dirty_days import rollup_dirty_days
+from workers.statistics_worker import refresh_dirty_days
+
+URL = "/api/v1/statistics/events"
+
+
+@pytest.fixture
+def events(seed, db_session, create_event):
+    """Seed-Event plus zwei Events; danach den markierten Tag neu berechnen"""
+    tags = [tag.id for tag in seed["tags"]]
+    vehicles = [vehicle.id for vehicle in seed["vehicles"]]
+    # Seed-Event: tags[0], vehicles[0], Frankfurt
+    create_event(
+        "A", tag_ids=tags[:2], vehicle_ids=[vehicles[1]], location=[9.99, 53.55]
+    )
+    # Ohne Standort: Zelle -1
+    create_event("B", location=[])
+    assert refresh_dirty_days(db_session, rollup_dirty_days) == 1
+    return tags, vehicles
+
+
+def _by(rows, key):
+    return {row[key]: row["events"] for row in rows}
+
+
+def test_statistics_slices_the_rollup(client, events):
+    tags, vehicles = events
+
+    total = client.get(URL).json()
+    assert [row["events"] for row in total["rows"]] == [3]
+
+    by_tag = client.get(URL, params={"group_by": "tag"}).json()["rows"]
+    assert _by(by_tag, "tag_id") == {tags[0]: 2, tags[1]: 1}
+    by_vehicle = client.get(URL, params={"group_by": "vehicle"}).json()["rows"]
+    assert _by(by_vehicle, "vehicle_id") == {vehicles[0]: 1, vehicles[1]: 1}
+
+    # Event A hat zwei Tags, zählt pro Tag aber nur einmal
+    one_tag = client.get(URL, params={"tag_ids": [tags[0]]}).json()["rows"]
+    assert [row["events"] for row in one_tag] == [2]
+
+    by_cell = client.get(URL, params={"group_by": ["month", "cell"]}).json()
+    assert len(by_cell["rows"]) == 3
+    assert sum(row["events"] for row in by_cell["rows"]) == 3
+    frankfurt = [r for r in by_cell["rows"] if r["cell_bbox"] == [8.5, 50, 9, 50.5]]
+    assert [row["events"] for row in frankfurt] == [1]
+    assert [r["events"] for r in by_cell["rows"] if r["cell"] == -1] == [1]
+
+
+def test_statistics_follow_updates_and_deletes(client, seed, db_session, events):
+    tags, _ = events
+    client.put(f"/api/v1/event/{seed['event'].id}", json={"tag_ids": [tags[2]]})
+    refresh_dirty_days(db_session, rollup_dirty_days)
+    by_tag = client.get(URL, params={"group_by": "tag"}).json()["rows"]
+    assert _by(by_tag, "tag_id") == {tags[0]: 1, tags[1]: 1, tags[2]: 1}
+
+    client.delete(f"/api/v1/event/{seed['event'].id}")
+    refresh_dirty_days(db_session, rollup_dirty_days)
+    assert client.get(URL).json()["rows"][0]["events"] == 2
+
+
+def test_statistics_follow_tag_and_vehicle_deletes(client, db_session, events):
+    tags, vehicles = events
+    # Die Links entfallen per ON DELETE CASCADE, kein Event wird geändert
+    assert client.delete(f"/api/v1/tag/{tags[1]}").status_code == 204
+    assert client.delete(f"/api/v1/vehicle/{vehicles[1]}").status_code == 204
+    assert refresh_dirty_days(db_session, rollup_dirty_days) == 1
+
+    by_tag = client.get(URL, params={"group_by": "tag"}).json()["rows"]
+    assert _by(by_tag, "tag_id") == {tags[0]: 2}
+    by_vehicle = client.get(URL, params={"group_by": "vehicle"}).json()["rows"]
+    assert _by(by_vehicle, "vehicle_id") == {vehicles[0]: 1}
+    assert [row["events"] for row in client.get(URL).json()["rows"]] == [3]
+
+
+def test_several_tags_require_grouping_by_tag(client, events):
+    tags, _ = events
+    response = client.get(URL, params={"tag_ids": tags[:2]})
+    assert response.status_code == 422
+    response = client.get(URL, params={"tag_ids": tags[:2], "group_by": "tag"})
+    assert response.status_code == 200
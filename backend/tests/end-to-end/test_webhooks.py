@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from sqlalchemy import select
+
+from domain.webhook.model import (
+    DELIVERED,
+    FAILED,
+    PENDING,
+    WebhookDelivery,
+    WebhookOutbox,
+)
+from domain.webhook.repository import WebhookRepository
+
+
+def test_event_changes_are_written_to_the_outbox(client, db_session, create_event):
+    event = create_event("Brand")
+    assert client.delete(f"/api/v1/event/{event['id']}").status_code == 204
+
+    payloads = db_session.execute(
+        select(WebhookOutbox.payload).order_by(WebhookOutbox.id)
+    ).scalars()
+    assert [(p["op"], p["id"]) for p in payloads] == [
+        ("created", event["id"]),
+        ("deleted", event["id"]),
+    ]
+
+
+def test_deliveries_are_batched_leased_and_backed_off(db_session, seed, create_event):
+    repo = WebhookRepository(db_session)
+    endpoint = repo.create_endpoint("http://localhost:9000/hook", seed["user"].id)
+    for i in range(3):
+        create_event(f"Brand {i}")
+
+    assert repo.fan_out(limit=100) == 3
+    assert repo.fan_out(limit=100) == 0
+
+    claimed = repo.claim_endpoints(limit=5, lease=timedelta(minutes=1))
+    assert [c.id for c in claimed] == [endpoint.id]
+    # Während der Lease beliefert kein anderer Worker denselben Endpoint
+    assert repo.claim_endpoints(limit=5, lease=timedelta(minutes=1)) == []
+
+    batch = repo.pending_batch(endpoint.id, limit=2)
+    assert len(batch) == 2
+    ids = [d.id for d in batch]
+    repo.finish_batch(claimed[0], ids, "HTTP 503", 2, timedelta(minutes=5))
+    # Pausiert wegen Backoff
+    assert repo.claim_endpoints(limit=5, lease=timedelta(minutes=1)) == []
+
+    repo.finish_batch(claimed[0], ids[:1], "HTTP 503", 2, timedelta(minutes=5))
+    repo.finish_batch(claimed[0], ids[1:], None, 2, timedelta(minutes=5))
+    statuses = dict(
+        db_session.execute(select(WebhookDelivery.id, WebhookDelivery.status)).all()
+    )
+    assert statuses[ids[0]] == FAILED
+    assert statuses[ids[1]] == DELIVERED
+    assert list(statuses.values()).count(PENDING) == 1
@@ -0,0 +1,36 @@
+import fakeredis
+import pytest
+from pydantic import ValidationError
+
+from domain.subscription.dto import AreaSubscriptionCreate
+from infrastructure.redis.notification_queue import NotificationQueue
+
+
+@pytest.mark.parametrize(
+    "area",
+    [
+        {},
+        {"center": [8.68, 50.11]},
+        {"polygon": [[0, 0], [1, 0], [1, 1]], "center": [0, 0], "radius_m": 10},
+        {"polygon": [[0, 0], [1, 1], [1, 0], [0, 1]]},
+        {"polygon": [[0, 0], [1, 0]]},
+        {"center": [8.68, 50.11], "radius_m": 500_000},
+    ],
+)
+def test_invalid_areas_are_rejected(area):
+    with pytest.raises(ValidationError):
+        AreaSubscriptionCreate(name="Wache", **area)
+
+
+def test_notification_queue_is_capped_and_drained_oldest_first(monkeypatch):
+    from infrastructure.redis import notification_queue as module
+
+    monkeypatch.setattr(module.config, "notification_queue_max_length", 3)
+    queue = NotificationQueue(fakeredis.FakeRedis(decode_responses=True))
+
+    queue.push({"user_id": 1, "event_id": i} for i in range(5))
+    queue.push([{"user_id": 2, "event_id": 9}])
+
+    assert [n["event_id"] for n in queue.pop_all(1)] == [2, 3, 4]
+    assert queue.pop_all(1) == []
+    assert [n["event_id"] for n in queue.pop_all(2)] == [9]
@@ -0,0 +1,7 @@
+from domain.common.dto import repeated_ids
+
+
+def test_repeated_ids_across_update_and_delete():
+    assert repeated_ids([1, 2, 2], [3, 1]) == {1, 2}
+    assert repeated_ids([1, 2], [3]) == set()
+    assert repeated_ids([], []) == set()
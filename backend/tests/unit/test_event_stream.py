@@ -0,0 +1,79 @@
+import asyncio
+import json
+
+import fakeredis
+
+from domain.event.changes import (
+    CHANGES_CHANNEL,
+    CREATED,
+    DELETED,
+    UPDATED,
+    EventChange,
+    EventChangePublisher,
+)
+from domain.event.stream import (
+    RESYNC,
+    EventStreamFilter,
+    EventStreamHub,
+    EventStreamSubscriber,
+    format_sse,
+)
+
+
+def test_filter_matches_bbox_tags_and_unknown_values():
+    stream_filter = EventStreamFilter(
+        bbox=(6.0, 47.0, 15.0, 55.0), tag_ids=frozenset({1, 2})
+    )
+
+    assert stream_filter.matches(EventChange(CREATED, 1, (9.9, 53.5), [2], []))
+    assert not stream_filter.matches(EventChange(CREATED, 2, (2.3, 48.8), [2], []))
+    assert not stream_filter.matches(EventChange(CREATED, 3, (9.9, 53.5), [3], []))
+    # Unbekannter Standort bzw. Tags: zustellen
+    assert stream_filter.matches(EventChange(DELETED, 4))
+    # Aus der Box herausbewegt: Client muss das Event entfernen können
+    assert stream_filter.matches(EventChange(UPDATED, 5, (2.3, 48.8), moved=True))
+    assert not stream_filter.matches(EventChange(UPDATED, 6, (2.3, 48.8)))
+
+
+def test_full_queue_is_replaced_by_resync():
+    async def scenario():
+        subscriber = EventStreamSubscriber(
+            EventStreamFilter(), asyncio.get_running_loop()
+        )
+        size = subscriber.queue.maxsize
+        subscriber.offer([EventChange(CREATED, i) for i in range(size + 5)])
+        return [subscriber.queue.get_nowait() for _ in range(subscriber.queue.qsize())]
+
+    assert asyncio.run(scenario()) == [RESYNC]
+
+
+def test_published_changes_reach_matching_connections():
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    hub = EventStreamHub(redis_client)
+    pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(CHANGES_CHANNEL)
+
+    EventChangePublisher(redis_client).publish(
+        [
+            EventChange(CREATED, 1, (9.9, 53.5), [1], [4]),
+            EventChange(CREATED, 2, (9.9, 53.5), [2], [4]),
+        ]
+    )
+    message = None
+    while message is None:
+        message = pubsub.get_message(timeout=1)
+    assert [m["id"] for m in json.loads(message["data"])] == [1, 2]
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        tag_one = EventStreamSubscriber(EventStreamFilter(tag_ids=frozenset({1})), loop)
+        everything = EventStreamSubscriber(EventStreamFilter(), loop)
+        hub._subscribers.update({tag_one, everything})
+        hub._on_message(message)
+        await asyncio.sleep(0)
+        sizes = (tag_one.queue.qsize(), everything.queue.qsize())
+        return sizes, tag_one.queue.get_nowait()
+
+    sizes, change = asyncio.run(scenario())
+    assert sizes == (1, 2)
+    assert format_sse(change).startswith("id: 1\nevent: created\ndata: ")
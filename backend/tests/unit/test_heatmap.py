@@ -0,0 +1,76 @@
+import io
+import math
+
+import numpy as np
+from PIL import Image
+
+from domain.event import heatmap
+from domain.event.dto import EventFilter
+
+
+def _mercator(lon: float, lat: float):
+    x = math.radians(lon) * heatmap.EARTH_RADIUS
+    y = math.log(math.tan(math.pi / 4 + math.radians(lat) / 2)) * heatmap.EARTH_RADIUS
+    return x, y
+
+
+def test_tile_bounds_cover_the_world_at_zoom_zero():
+    min_x, min_y, max_x, max_y = heatmap.tile_bounds(0, 0, 0)
+    assert min_x == min_y == -heatmap.ORIGIN_SHIFT
+    assert max_x == max_y == heatmap.ORIGIN_SHIFT
+    min_lon, _, max_lon, max_lat = heatmap.lonlat_bounds(heatmap.tile_bounds(0, 0, 0))
+    assert (min_lon, max_lon) == (-180.0, 180.0)
+    assert math.isclose(max_lat, 85.0511, abs_tol=1e-4)
+
+
+def test_density_peaks_at_the_event():
+    z, x, y = 10, 536, 346  # Frankfurt am Main
+    point = np.array([_mercator(8.68, 50.11)])
+    radius = heatmap.kernel_radius()
+    density = heatmap.density_grid(
+        point, heatmap.tile_bounds(z, x, y, radius), 256, radius
+    )
+    assert density.shape == (256, 256)
+    row, col = np.unravel_index(density.argmax(), density.shape)
+    min_x, _, _, max_y = heatmap.tile_bounds(z, x, y)
+    pixel = (heatmap.tile_bounds(z, x, y)[2] - min_x) / 256
+    assert abs(col - (point[0, 0] - min_x) / pixel) <= 1
+    assert abs(row - (max_y - point[0, 1]) / pixel) <= 1
+    assert math.isclose(density.max(), 1.0, rel_tol=0.05)
+
+
+def test_neighbouring_tiles_share_events_near_the_edge():
+    z, x, y = 12, 2000, 1300
+    _, _, max_x, max_y = heatmap.tile_bounds(z, x, y)
+    pixel = (max_x - heatmap.tile_bounds(z, x, y)[0]) / 256
+    # Zwei Pixel links der rechten Kachelkante
+    points = np.array([[max_x - 2 * pixel, max_y - 100 * pixel]])
+    radius = heatmap.kernel_radius()
+    left = heatmap.density_grid(
+        points, heatmap.tile_bounds(z, x, y, radius), 256, radius
+    )
+    right = heatmap.density_grid(
+        points, heatmap.tile_bounds(z, x + 1, y, radius), 256, radius
+    )
+    assert right[:, 0].max() > 0
+    # Der Übergang ist stetig: letzte Spalte links ~ erste Spalte rechts
+    assert np.allclose(left[:, -1], right[:, 0], rtol=0.5)
+
+
+def test_render_tile_returns_png():
+    empty = Image.open(io.BytesIO(heatmap.render_tile(np.empty((0, 2)), 0, 0, 0)))
+    assert empty.format == "PNG" and empty.size == (256, 256)
+    assert empty.getextrema()[3] == (0, 0)
+
+    z, x, y = 10, 536, 346
+    points = np.array([_mercator(8.68, 50.11)] * 5)
+    image = Image.open(io.BytesIO(heatmap.render_tile(points, z, x, y)))
+    assert image.mode == "RGBA" and image.getextrema()[3][1] > 0
+
+
+def test_filter_cache_key_ignores_paging_and_id_order():
+    a = EventFilter(tag_ids=[3, 1, 1], vehicle_ids=[], page=2, limit=50)
+    b = EventFilter(tag_ids=[1, 3])
+    assert a.cache_key() == b.cache_key()
+    assert EventFilter().cache_key() == EventFilter(name="").cache_key()
+    assert EventFilter(tag_ids=[1]).cache_key() != b.cache_key()
@@ -0,0 +1,67 @@
+import numpy as np
+import shapely
+
+from domain.hotspot.analysis import find_hotspots, getis_ord, significant, window_sum
+
+# Frankfurt am Main
+CENTER = (8.68, 50.11)
+
+
+def _points(rng, clustered: int, uniform: int):
+    lon = np.concatenate(
+        [rng.normal(CENTER[0], 0.003, clustered), rng.uniform(8.4, 8.9, uniform)]
+    )
+    lat = np.concatenate(
+        [rng.normal(CENTER[1], 0.002, clustered), rng.uniform(49.9, 50.3, uniform)]
+    )
+    return lon, lat, rng.uniform(0, 72 * 3600, len(lon))
+
+
+def test_window_sum_matches_brute_force():
+    values = np.random.default_rng(0).random((7, 9))
+    sums = window_sum(values, 2)
+    for row, col in [(0, 0), (3, 4), (6, 8), (1, 7)]:
+        expected = values[max(row - 2, 0) : row + 3, max(col - 2, 0) : col + 3].sum()
+        assert np.isclose(sums[row, col], expected)
+
+
+def test_getis_ord_peaks_at_the_cluster():
+    values = np.zeros((20, 20))
+    values[10, 10] = 10
+    scores = getis_ord(values, 1)
+    # Alle Zellen, deren 3x3-Nachbarschaft das Event enthält
+    assert np.argwhere(scores == scores.max()).tolist() == [
+        [row, col] for row in (9, 10, 11) for col in (9, 10, 11)
+    ]
+    assert scores[0, 0] < 0
+    assert not getis_ord(np.ones((5, 5)), 1).any()
+
+
+def test_significant_corrects_for_many_cells():
+    # Ein Treffer mit z = 3 ist bei einer Zelle signifikant, bei 10000 nicht
+    assert significant(np.array([3.0]), 1).all()
+    assert not significant(np.array([3.0]), 10_000).any()
+    assert significant(np.array([6.0, 3.0]), 10_000).tolist() == [True, False]
+
+
+def test_cluster_is_found_as_lonlat_polygon():
+    lon, lat, age = _points(np.random.default_rng(1), clustered=150, uniform=2000)
+    hotspots = find_hotspots(lon, lat, age)
+
+    strongest = hotspots[0]
+    assert strongest.polygon.is_valid
+    assert shapely.contains_xy(strongest.polygon, *CENTER)
+    assert strongest.events >= 150
+    assert strongest.score > 10
+    assert all(h.score <= strongest.score for h in hotspots)
+
+
+def test_uniform_noise_gives_few_false_hotspots():
+    for seed in range(3):
+        lon, lat, age = _points(np.random.default_rng(seed), clustered=0, uniform=2000)
+        assert len(find_hotspots(lon, lat, age)) <= 5
+
+
+def test_too_few_points_give_no_hotspots():
+    lon, lat, age = _points(np.random.default_rng(2), clustered=3, uniform=0)
+    assert find_hotspots(lon, lat, age) == []
@@ -0,0 +1,32 @@
+import fakeredis
+from starlette.requests import Request
+
+from infrastructure.redis.table_versions import TableVersions
+from misc.http_cache import etag_matches, make_etag
+
+
+def _request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_etag_matches_list_weak_and_wildcard():
+    etag = make_etag("tag", 7)
+
+    assert etag == '"tag-7"'
+    assert etag_matches(_request('"tag-6", W/"tag-7"'), etag)
+    assert etag_matches(_request("*"), etag)
+    assert not etag_matches(_request('"tag-6"'), etag)
+    assert not etag_matches(_request(), etag)
+
+
+def test_table_versions_initialize_once_and_bump():
+    versions = TableVersions(fakeredis.FakeRedis(decode_responses=True))
+
+    initial = versions.version("tag")
+    assert versions.version("tag") == initial
+
+    versions.bump("tag")
+    assert versions.get("tag", "role")["tag"] == initial + 1
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+from jinja2 import FileSystemLoader
+
+from infrastructure.mail import templates
+
+LINK = "https://fire-map.example/register?invitation=abc.def&lang=de"
+ESCAPED_LINK = "https://fire-map.example/register?invitation=abc.def&amp;lang=de"
+
+SHIPPED_TEMPLATES = Path(__file__).resolve().parents[2] / "mail_templates"
+
+
+@pytest.fixture
+def template_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(templates._environment, "loader", FileSystemLoader(tmp_path))
+    return tmp_path
+
+
+def test_shipped_templates_render_escaped_values(monkeypatch):
+    monkeypatch.setattr(
+        templates._environment, "loader", FileSystemLoader(SHIPPED_TEMPLATES)
+    )
+    assert templates.load_mail_templates() == 3
+
+    content = templates.render_mail_template("invite.html.jinja", invite_link=LINK)
+    assert f'href="{ESCAPED_LINK}"' in content
+    assert "{invite_link}" not in content
+
+    content = templates.render_mail_template(
+        "reset_pw.html.jinja", reset_link="https://x/?a=<b>"
+    )
+    assert "https://x/?a=&lt;b&gt;" in content
+    content = templates.render_mail_template("forgot_password.html.jinja", code="123")
+    assert "<strong>123</strong>" in content
+
+
+@pytest.mark.parametrize("placeholder", ["{{ invite_link }}", "{invite_link}"])
+def test_invite_link_is_rendered_escaped(template_dir, placeholder):
+    (template_dir / "invite.html.jinja").write_text(
+        f'<a href="{placeholder}">Registrieren</a>'
+    )
+
+    content = templates.render_mail_template("invite.html.jinja", invite_link=LINK)
+
+    assert content == f'<a href="{ESCAPED_LINK}">Registrieren</a>'
+
+
+def test_legacy_placeholders_only_apply_to_listed_templates(template_dir):
+    (template_dir / "forgot_password.html.jinja").write_text(
+        "<p>{{ code }}</p><p>{code}</p>"
+    )
+
+    content = templates.render_mail_template("forgot_password.html.jinja", code="1")
+
+    assert content == "<p>1</p><p>{code}</p>"
@@ -0,0 +1,105 @@
+import asyncio
+
+import aiosmtplib
+import fakeredis
+import pytest
+
+from infrastructure.mail.queue import (
+    MailQueue,
+    PENDING_KEY,
+    RETRY_KEY,
+    DEAD_KEY,
+    decode_job,
+)
+from workers.mail_worker import MailWorker, config
+
+
+class StubSMTP:
+    """SMTP-Ersatz, der die ersten `failures` Sendeversuche scheitern lässt"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.sent = []
+        self.is_connected = True
+
+    async def send_message(self, message):
+        if self.failures:
+            self.failures -= 1
+            raise aiosmtplib.SMTPServerDisconnected("connection lost")
+        self.sent.append(message)
+
+    async def quit(self):
+        self.is_connected = False
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def make_worker(server, smtp: StubSMTP) -> MailWorker:
+    worker = MailWorker(fakeredis.FakeAsyncRedis(server=server, decode_responses=True))
+
+    async def connection():
+        smtp.is_connected = True
+        return smtp
+
+    worker._connection = connection
+    return worker
+
+
+def enqueue(server, count: int = 1):
+    queue = MailQueue(fakeredis.FakeRedis(server=server, decode_responses=True))
+    for i in range(count):
+        queue.enqueue(f"Betreff {i}", [f"user{i}@fire-map.com"], "<p>Hallo</p>")
+    return queue
+
+
+def run_once(worker: MailWorker):
+    async def _run():
+        for raw in await worker._next_batch():
+            await worker._process(raw)
+
+    asyncio.run(_run())
+
+
+def test_sends_batch_over_one_connection(server):
+    queue = enqueue(server, count=3)
+    smtp = StubSMTP()
+
+    run_once(make_worker(server, smtp))
+
+    assert [m["Subject"] for m in smtp.sent] == ["Betreff 0", "Betreff 1", "Betreff 2"]
+    assert queue.stats() == {"pending": 0, "retrying": 0, "dead": 0}
+
+
+def test_failed_mail_is_scheduled_for_retry(server):
+    queue = enqueue(server)
+    smtp = StubSMTP(failures=1)
+
+    run_once(make_worker(server, smtp))
+
+    assert smtp.sent == []
+    assert queue.stats() == {"pending": 0, "retrying": 1, "dead": 0}
+    job = decode_job(queue.redis.zrange(RETRY_KEY, 0, -1)[0])
+    assert job["attempts"] == 1
+    assert "connection lost" in job["last_error"]
+
+
+def test_mail_is_dead_lettered_after_max_attempts(server, monkeypatch):
+    monkeypatch.setattr(config, "mail_queue_max_attempts", 2)
+    queue = enqueue(server)
+    smtp = StubSMTP(failures=2)
+    worker = make_worker(server, smtp)
+
+    run_once(worker)
+    # Retry sofort fällig machen und erneut verarbeiten
+    raw = queue.redis.zrange(RETRY_KEY, 0, -1)[0]
+    queue.redis.zadd(RETRY_KEY, {raw: 0})
+    asyncio.run(
+        worker._promote_due_retries(keys=[RETRY_KEY, PENDING_KEY], args=[1, 100])
+    )
+    run_once(worker)
+
+    assert queue.stats() == {"pending": 0, "retrying": 0, "dead": 1}
+    assert decode_job(queue.redis.lindex(DEAD_KEY, 0))["attempts"] == 2
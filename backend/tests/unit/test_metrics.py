@@ -0,0 +1,100 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from infrastructure.metrics.middleware import PrometheusMiddleware
+from infrastructure.metrics.prometheus import (
+    UNMATCHED_ROUTE,
+    metrics_token_valid,
+    record_query,
+)
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        # Sync-Route im Threadpool: Statements zählen trotzdem zur Anfrage
+        record_query(0.01)
+        record_query(0.02)
+        return {"id": item_id}
+
+    return TestClient(app)
+
+
+def test_latency_is_labelled_with_route_template():
+    client = _client()
+    before = _sample(
+        "http_request_duration_seconds_count",
+        method="GET",
+        route="/items/{item_id}",
+        status="200",
+    )
+
+    client.get("/items/1")
+    client.get("/items/2")
+
+    after = _sample(
+        "http_request_duration_seconds_count",
+        method="GET",
+        route="/items/{item_id}",
+        status="200",
+    )
+    assert after - before == 2
+
+
+def test_queries_are_counted_per_request():
+    client = _client()
+    route = "/items/{item_id}"
+    count_before = _sample("db_queries_per_request_sum", route=route)
+    time_before = _sample("db_time_per_request_seconds_sum", route=route)
+
+    client.get("/items/1")
+
+    assert _sample("db_queries_per_request_sum", route=route) - count_before == 2
+    assert _sample(
+        "db_time_per_request_seconds_sum", route=route
+    ) - time_before == pytest.approx(0.03)
+
+
+def test_unknown_paths_share_one_label():
+    client = _client()
+    before = _sample(
+        "http_request_duration_seconds_count",
+        method="GET",
+        route=UNMATCHED_ROUTE,
+        status="404",
+    )
+
+    client.get("/does-not-exist/123")
+
+    after = _sample(
+        "http_request_duration_seconds_count",
+        method="GET",
+        route=UNMATCHED_ROUTE,
+        status="404",
+    )
+    assert after - before == 1
+    assert _sample("http_requests_in_flight") == 0
+
+
+@pytest.mark.parametrize(
+    "authorization, valid",
+    [
+        ("Bearer s3cret", True),
+        ("bearer s3cret", True),
+        ("Bearer wrong", False),
+        ("Basic s3cret", False),
+        ("s3cret", False),
+        (None, False),
+    ],
+)
+def test_metrics_token(authorization, valid):
+    assert metrics_token_valid(authorization, "s3cret") is valid
@@ -0,0 +1,85 @@
+import fakeredis
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+import main  # noqa: F401 - registriert alle Modelle
+from domain.role.model import Role
+from domain.user.dependency import get_current_user, is_admin
+from domain.user.model import User
+from domain.user.principal import Principal
+from infrastructure.redis import redis_client
+from infrastructure.redis.redis_client import RedisSessionManager
+
+
+class CountingUserRepository:
+    """Liefert einen festen Benutzer und zählt die Datenbankzugriffe"""
+
+    def __init__(self, user=None):
+        self.user = user
+        self.calls = 0
+
+    def get_user_by_id(self, user_id):
+        self.calls += 1
+        return self.user
+
+
+def _user(role_name):
+    # Transient: role_name() fällt ohne Session auf user.role zurück
+    return User(id=7, role=Role(name=role_name), deactivated=False)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = RedisSessionManager(fakeredis.FakeRedis(decode_responses=True))
+    monkeypatch.setattr(redis_client.session_manager, "redis", manager.redis)
+    return manager
+
+
+def _request(manager, session_id):
+    request = Request({"type": "http", "method": "GET", "headers": []})
+    request.state.user_id = 7
+    request.state.session = manager.get_session(session_id)
+    request.state.session_id = session_id
+    return request
+
+
+def test_principal_is_read_from_session(manager):
+    principal = Principal(7, "admin", False, True)
+    sid = manager.create_session(7, principal=principal.to_session())
+    repo = CountingUserRepository()
+
+    assert get_current_user(_request(manager, sid), repo) == principal
+    assert is_admin(principal)
+    assert repo.calls == 0
+
+
+def test_invalidated_principal_is_reloaded_once(manager):
+    sid = manager.create_session(
+        7, principal=Principal(7, "admin", False, False).to_session()
+    )
+    manager.invalidate_principal(7)
+    repo = CountingUserRepository(_user("user"))
+
+    reloaded = get_current_user(_request(manager, sid), repo)
+    assert reloaded.role == "user"
+    assert not is_admin(reloaded)
+    assert get_current_user(_request(manager, sid), repo) == reloaded
+    assert repo.calls == 1
+
+
+def test_session_without_principal_is_upgraded(manager):
+    sid = manager.create_session(7)
+    repo = CountingUserRepository(_user("user"))
+
+    get_current_user(_request(manager, sid), repo)
+    get_current_user(_request(manager, sid), repo)
+    assert repo.calls == 1
+
+
+def test_deleted_user_is_unauthorized(manager):
+    sid = manager.create_session(7)
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(_request(manager, sid), CountingUserRepository())
+    assert exc.value.status_code == 401
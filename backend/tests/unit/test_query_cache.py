@@ -0,0 +1,45 @@
+import fakeredis
+import pytest
+import redis
+
+from infrastructure.redis.query_cache import QueryCache
+from infrastructure.redis.table_versions import TableVersions
+
+
+@pytest.fixture
+def cache():
+    fake = fakeredis.FakeRedis(decode_responses=True)
+    return QueryCache(fake, TableVersions(fake))
+
+
+def test_cached_value_is_returned_until_the_table_changes(cache):
+    key = cache.key("timeline", "event", "day:abc")
+    assert cache.get("timeline", key) is None
+    cache.set(key, {"total": 3}, 60)
+    assert cache.get("timeline", cache.key("timeline", "event", "day:abc")) == {
+        "total": 3
+    }
+
+    cache.versions.bump("event")
+    assert cache.get("timeline", cache.key("timeline", "event", "day:abc")) is None
+
+
+def test_params_are_part_of_the_key(cache):
+    cache.set(cache.key("timeline", "event", "day:abc"), [1], 60)
+    assert cache.get("timeline", cache.key("timeline", "event", "week:abc")) is None
+
+
+class BrokenRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise redis.ConnectionError("down")
+
+        return fail
+
+
+def test_unavailable_redis_disables_the_cache():
+    cache = QueryCache(BrokenRedis(), TableVersions(BrokenRedis()))
+    key = cache.key("timeline", "event", "day:abc")
+    assert key is None
+    cache.set(key, [1], 60)
+    assert cache.get("timeline", key) is None
@@ -0,0 +1,60 @@
+import fakeredis
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from dependencies.rate_limit_dependencies import RateLimited, body_field
+from infrastructure.redis.rate_limiter import RateLimit, RateLimiter, get_rate_limiter
+
+
+@pytest.fixture
+def limiter():
+    return RateLimiter(fakeredis.FakeRedis(decode_responses=True))
+
+
+def test_bucket_allows_burst_then_reports_retry(limiter):
+    limit = RateLimit(3, 60)
+
+    assert [limiter.hit([("ip:1", limit)]) for _ in range(3)] == [None] * 3
+    retry_after = limiter.hit([("ip:1", limit)])
+    assert retry_after is not None and 0 < retry_after <= 20
+    assert limiter.hit([("ip:2", limit)]) is None
+
+
+def test_denied_request_consumes_no_tokens(limiter):
+    tight, loose = RateLimit(1, 60), RateLimit(10, 60)
+
+    assert limiter.hit([("account:a", tight), ("ip:1", loose)]) is None
+    assert limiter.hit([("account:a", tight), ("ip:1", loose)]) is not None
+    # Der IP-Bucket hat nur für die erste Anfrage einen Token abgegeben
+    tokens = limiter.redis.hget("rate_limit:ip:1", "tokens")
+    assert 8.9 < float(tokens) < 9.1
+
+
+class Login(BaseModel):
+    email: str
+
+
+def test_dependency_returns_429_with_retry_after(limiter):
+    app = FastAPI()
+    app.dependency_overrides[get_rate_limiter] = lambda: limiter
+    rate_limit = RateLimited(
+        "login",
+        per_ip=RateLimit(100, 60),
+        per_account=RateLimit(2, 60),
+        account=body_field("email"),
+    )
+
+    @app.post("/login", dependencies=[Depends(rate_limit)])
+    def login(body: Login):
+        return {"email": body.email}
+
+    client = TestClient(app)
+    for _ in range(2):
+        assert client.post("/login", json={"email": "A@x.de"}).status_code == 200
+
+    response = client.post("/login", json={"email": "a@x.de "})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert client.post("/login", json={"email": "b@x.de"}).status_code == 200
@@ -0,0 +1,78 @@
+import time
+
+import fakeredis
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+
+import main  # noqa: F401 - registriert alle Modelle
+from domain.common.reference_cache import ReferenceCache
+from domain.role.model import Role
+from domain.tag.model import Tag
+from domain.vehicletype.model import VehicleType
+from infrastructure.redis import table_versions as table_versions_module
+
+
+@pytest.fixture
+def db():
+    # Die Stammdatentabellen kommen ohne PostGIS aus
+    engine = create_engine("sqlite://")
+    for model in (Tag, VehicleType, Role):
+        model.__table__.create(engine)
+    with Session(engine) as session:
+        session.execute(insert(Tag), [{"name": "Waldbrand"}, {"name": "Flächenbrand"}])
+        session.execute(insert(Role), [{"name": "admin"}, {"name": "user"}])
+        session.commit()
+        yield session
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        table_versions_module.table_versions,
+        "redis",
+        fakeredis.FakeRedis(server=server, decode_responses=True),
+    )
+    return server
+
+
+def _cache(server):
+    return ReferenceCache(fakeredis.FakeRedis(server=server, decode_responses=True))
+
+
+def test_instances_are_attached_without_query(db, server):
+    cache = _cache(server)
+    cache.load_all(db)
+
+    statements = []
+    event.listen(
+        db.get_bind(), "before_cursor_execute", lambda *a: statements.append(a[2])
+    )
+    tags = cache.tags.instances(db, [2, 1, 2, 99])
+
+    assert [tag.name for tag in tags] == ["Flächenbrand", "Waldbrand"]
+    assert all(tag in db for tag in tags)
+    assert cache.tags.existing_ids(db, {1, 99}) == {1}
+    assert cache.roles.get_by_name(db, "admin")["id"] == 1
+    assert statements == []
+
+
+def test_change_in_other_worker_invalidates_cache(db, server):
+    worker, other_worker = _cache(server), _cache(server)
+    worker.load_all(db)
+    worker.start_listener()
+    try:
+        db.execute(insert(Tag).values(name="Glutnest"))
+        db.commit()
+        assert worker.tags.get_by_name(db, "Glutnest") is None
+
+        other_worker.changed(Tag.__tablename__)
+        for _ in range(50):
+            if worker.tags.get_by_name(db, "Glutnest"):
+                break
+            time.sleep(0.05)
+
+        assert worker.tags.get_by_name(db, "Glutnest")["id"] == 3
+    finally:
+        worker.stop_listener()
@@ -0,0 +1,103 @@
+import json
+import time
+from datetime import datetime
+
+import fakeredis
+import pytest
+
+from infrastructure.redis.redis_client import RedisSessionManager, session_reference
+
+
+@pytest.fixture
+def manager():
+    return RedisSessionManager(fakeredis.FakeRedis(decode_responses=True))
+
+
+def test_revoke_sessions_keeps_current_session(manager):
+    current = manager.create_session(7)
+    others = [manager.create_session(7) for _ in range(3)]
+    foreign = manager.create_session(8)
+    temp = manager.create_temp_session(7)
+
+    assert manager.revoke_sessions(7, except_session_id=current) == 3
+
+    assert manager.get_session(current) is not None
+    assert all(manager.get_session(sid) is None for sid in others)
+    assert manager.get_temp_session(temp) is None
+    assert manager.get_session(foreign) is not None
+    assert [s["session_ref"] for s in manager.list_sessions(7)] == [
+        session_reference(current)
+    ]
+
+
+def test_list_sessions_prunes_dead_members(manager):
+    alive = manager.create_session(7)
+    evicted = manager.create_session(7)
+    manager.redis.delete(f"{manager.session_prefix}{evicted}")
+    index = f"{manager.user_session_prefix}7"
+    manager.redis.zadd(index, {"expired": int(time.time()) - 10})
+
+    sessions = manager.list_sessions(7)
+
+    assert [s["session_ref"] for s in sessions] == [session_reference(alive)]
+    assert manager.redis.zrange(index, 0, -1) == [alive]
+
+
+def test_delete_session_removes_index_entry(manager):
+    sid = manager.create_session(7)
+
+    assert manager.delete_session(sid)
+    assert manager.redis.zcard(f"{manager.user_session_prefix}7") == 0
+
+
+def test_legacy_json_session_is_migrated(manager):
+    key = f"{manager.session_prefix}legacy"
+    manager.redis.setex(
+        key,
+        600,
+        json.dumps(
+            {
+                "user_id": 7,
+                "created_at": "2025-01-01T10:00:00",
+                "last_accessed": "2025-01-01T10:05:00",
+                "state": "active",
+            }
+        ),
+    )
+    manager.redis.zadd(f"{manager.user_session_prefix}7", {"legacy": time.time() + 600})
+
+    assert manager.get_session("legacy")["user_id"] == 7
+    assert manager.redis.type(key) == "hash"
+    assert 0 < manager.redis.ttl(key) <= 600
+    assert manager.get_session("legacy")["created_at"] == int(
+        datetime(2025, 1, 1, 10).timestamp()
+    )
+    assert len(manager.list_sessions(7)) == 1
+
+
+def test_touch_does_not_resurrect_deleted_session(manager):
+    sid = manager.create_session(7)
+    manager.delete_session(sid)
+
+    assert manager.get_session(sid) is None
+    manager.update_principal(sid, {"id": 7, "role": "user"})
+    assert not manager.redis.exists(f"{manager.session_prefix}{sid}")
+
+
+def test_revoke_sessions_deletes_sessions_of_the_legacy_index(manager):
+    # Vor dem ZSET-Index angelegt: nur im alten SET user_sessions:{id}
+    legacy = [f"legacy-{i}" for i in range(2)]
+    for sid in legacy:
+        manager.redis.hset(f"{manager.session_prefix}{sid}", "user_id", 7)
+    current = manager.create_session(7)
+    manager.redis.sadd(f"{manager.legacy_user_session_prefix}7", *legacy, current)
+
+    assert manager.revoke_sessions(7, except_session_id=current) == 2
+
+    assert not any(
+        manager.redis.exists(f"{manager.session_prefix}{sid}") for sid in legacy
+    )
+    assert manager.get_session(current) is not None
+    assert manager.redis.smembers(f"{manager.legacy_user_session_prefix}7") == {
+        current
+    }
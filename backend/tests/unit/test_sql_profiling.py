@@ -0,0 +1,25 @@
+from infrastructure.postgresql.profiling import normalize_sql, parameter_shape
+
+
+def test_expanded_in_lists_normalize_to_one_statement():
+    short = "SELECT * FROM tags WHERE tags.id IN (%(id_1_1)s)"
+    long = """SELECT *
+        FROM tags
+        WHERE tags.id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)"""
+
+    assert normalize_sql(short) == normalize_sql(long)
+    assert normalize_sql(long) == "SELECT * FROM tags WHERE tags.id IN (%(id_1_*)s)"
+
+
+def test_parameter_shape_hides_values():
+    shape = parameter_shape(
+        {"id_1_1": 3, "id_1_2": 4, "email_1": "admin@fire-map.com", "limit_1": 50}
+    )
+
+    assert shape == {"id_1_*": "int[2]", "email_1": "str", "limit_1": "int"}
+
+
+def test_parameter_shape_of_executemany():
+    shape = parameter_shape([{"event_id": 1, "tag_id": 2}] * 3, executemany=True)
+
+    assert shape == "3 x {'event_id': 'int', 'tag_id': 'int'}"
@@ -0,0 +1,54 @@
+from datetime import date
+
+import fakeredis
+import pytest
+
+from domain.statistics.model import NO_CELL
+from domain.statistics.repository import cell_bounds, grid_shape
+from infrastructure.redis.rollup_dirty_days import RollupDirtyDays
+from workers.statistics_worker import refresh_dirty_days
+
+
+def test_grid_cells_cover_the_world(monkeypatch):
+    from config.config_provider import get_config
+
+    monkeypatch.setattr(get_config(), "statistics_grid_degrees", 0.5)
+    rows, columns = grid_shape()
+    assert (rows, columns) == (360, 720)
+    assert cell_bounds(0) == (-180.0, -90.0, -179.5, -89.5)
+    assert cell_bounds(rows * columns - 1) == (179.5, 89.5, 180.0, 90.0)
+    # Frankfurt am Main (8.68, 50.11)
+    assert cell_bounds(280 * columns + 377) == (8.5, 50.0, 9.0, 50.5)
+    assert cell_bounds(NO_CELL) is None
+
+
+def test_dirty_days_are_deduplicated_and_popped_in_batches():
+    days = RollupDirtyDays(fakeredis.FakeRedis(decode_responses=True))
+    days.mark([date(2026, 10, 19), date(2026, 10, 18), date(2026, 10, 19)])
+    days.mark([])
+
+    first = days.pop(1)
+    second = days.pop(5)
+    assert sorted(first + second) == [date(2026, 10, 18), date(2026, 10, 19)]
+    assert days.pop(5) == []
+
+
+class FailingSession:
+    rolled_back = False
+
+    def execute(self, *args, **kwargs):
+        raise RuntimeError("Datenbank nicht erreichbar")
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def test_failed_refresh_marks_days_again():
+    days = RollupDirtyDays(fakeredis.FakeRedis(decode_responses=True))
+    days.mark([date(2026, 10, 19)])
+    db = FailingSession()
+
+    with pytest.raises(RuntimeError):
+        refresh_dirty_days(db, days)
+    assert db.rolled_back
+    assert days.pop(5) == [date(2026, 10, 19)]
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+import pytest
+
+from domain.sync.repository import InvalidCursor, SyncCursor
+
+
+def test_cursor_round_trip():
+    cursor = SyncCursor(
+        changed=(datetime(2026, 10, 19, 12, 0, 0, 123456), 42),
+        deleted=(datetime(2026, 10, 18, 8, 30), 7),
+        synced=datetime(2026, 10, 19, 12, 0, 5),
+    )
+    assert SyncCursor.decode(cursor.encode()) == cursor
+    assert SyncCursor.decode(None) == SyncCursor()
+
+
+@pytest.mark.parametrize("raw", ["kaputt", "e30", "eyJjIjpbXX0"])
+def test_invalid_cursor(raw):
+    with pytest.raises(InvalidCursor):
+        SyncCursor.decode(raw)
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+import numpy as np
+
+from domain.event.timelapse import EPOCH, encode
+
+
+def test_times_are_delta_encoded_and_coordinates_quantized():
+    start = (datetime(2026, 7, 1, 12) - EPOCH).total_seconds()
+    rows = np.array(
+        [
+            [start + 0.4, 8.682126, 50.110922, 7],
+            [start + 60.9, 9.993682, 53.551086, 3],
+            [start + 60.9, -3.703790, 40.416775, 12],
+        ]
+    )
+    frames = encode(rows)
+
+    assert frames["start"] == datetime(2026, 7, 1, 12)
+    assert frames["times"] == [0, 60, 0]
+    assert frames["ids"] == [7, 3, 12]
+    assert frames["scale"] == 100_000
+    assert frames["lon"] == [868213, 999368, -370379]
+    assert frames["lat"] == [5011092, 5355109, 4041678]
+
+    # Dekodieren wie im Client
+    times = frames["start"].timestamp() + np.cumsum(frames["times"])
+    lon = np.array(frames["lon"]) / frames["scale"]
+    assert np.allclose(lon, rows[:, 1], atol=1e-5)
+    assert times[-1] - times[0] == 60
+
+
+def test_empty_result():
+    frames = encode(np.empty((0, 4)))
+    assert frames["times"] == frames["lon"] == frames["ids"] == []
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from misc.sign import sign_invitation_id, sign_message, verify_message_signature
+from workers.webhook_worker import MAX_BACKOFF_SECONDS, backoff, signature_headers
+
+
+def test_invitation_signature_uses_generic_signer():
+    assert sign_invitation_id("abc", "secret") == sign_message(b"abc", "secret")
+
+
+def test_signature_headers_verify_against_timestamp_and_body():
+    body = b'{"deliveries":[]}'
+    headers = signature_headers(body, "geheim", 1760000000)
+
+    message = f"{headers['X-Webhook-Timestamp']}.".encode() + body
+    assert verify_message_signature(message, headers["X-Webhook-Signature"], "geheim")
+    assert not verify_message_signature(
+        message + b" ", headers["X-Webhook-Signature"], "geheim"
+    )
+
+
+def test_backoff_doubles_and_is_capped():
+    first, third = backoff(1), backoff(3)
+    assert third > first * 2
+    assert backoff(50) <= timedelta(seconds=MAX_BACKOFF_SECONDS * 1.2)
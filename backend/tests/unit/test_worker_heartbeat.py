@@ -0,0 +1,75 @@
+import asyncio
+from datetime import date
+
+import fakeredis
+from loguru import logger
+from prometheus_client import REGISTRY
+
+from infrastructure.mail.queue import MailQueue
+from infrastructure.metrics.background import update_background_metrics
+from infrastructure.redis.rollup_dirty_days import RollupDirtyDays
+from infrastructure.redis.worker_heartbeat import (
+    HEARTBEAT_MIN_TTL_SECONDS,
+    WorkerHeartbeats,
+    heartbeat_key,
+)
+from workers.mail_worker import MailWorker
+
+
+def _warnings():
+    messages = []
+    handler = logger.add(messages.append, level="WARNING", format="{message}")
+    return messages, handler
+
+
+def test_heartbeat_expires_after_three_intervals():
+    heartbeats = WorkerHeartbeats(fakeredis.FakeRedis(decode_responses=True))
+    heartbeats.beat("hotspot", 900)
+    heartbeats.beat("mail", 1)
+
+    running = heartbeats.running()
+    assert running["hotspot"] and running["mail"] and not running["webhook"]
+    assert heartbeats.redis.ttl(heartbeat_key("hotspot")) == 2700
+    assert heartbeats.redis.ttl(heartbeat_key("mail")) == HEARTBEAT_MIN_TTL_SECONDS
+
+
+def test_enqueue_warns_without_mail_worker():
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    queue = MailQueue(redis_client)
+    messages, handler = _warnings()
+    try:
+        queue.enqueue("Betreff", ["user@fire-map.com"], "<p>Hallo</p>")
+        assert any("mail-Worker läuft nicht" in m for m in messages)
+
+        messages.clear()
+        WorkerHeartbeats(redis_client).beat("mail", 10)
+        queue.enqueue("Betreff", ["user@fire-map.com"], "<p>Hallo</p>")
+        assert messages == []
+    finally:
+        logger.remove(handler)
+
+
+def test_mail_worker_writes_heartbeat():
+    server = fakeredis.FakeServer()
+    worker = MailWorker(fakeredis.FakeAsyncRedis(server=server, decode_responses=True))
+    asyncio.run(worker._heartbeat())
+
+    sync = fakeredis.FakeRedis(server=server, decode_responses=True)
+    assert WorkerHeartbeats(sync).running()["mail"]
+
+
+def test_metrics_report_workers_and_queue_depth():
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    MailQueue(redis_client).enqueue("Betreff", ["user@fire-map.com"], "<p>Hallo</p>")
+    RollupDirtyDays(redis_client).mark([date(2026, 10, 19)])
+    WorkerHeartbeats(redis_client).beat("webhook", 2)
+
+    update_background_metrics(redis_client)
+
+    def sample(name, **labels):
+        return REGISTRY.get_sample_value(name, labels)
+
+    assert sample("background_worker_up", worker="webhook") == 1
+    assert sample("background_worker_up", worker="mail") == 0
+    assert sample("background_queue_depth", queue="mail_pending") == 1
+    assert sample("background_queue_depth", queue="statistics_dirty_days") == 1